@@ -8,100 +8,79 @@ providers (Google or simulated).
 """
 
 
+import importlib
+import sys
+from functools import lru_cache
 from pathlib import Path
-
-import os
-import json
-from datetime import datetime, timezone
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-
-from HDRP.tools.search.base import SearchError
-from HDRP.tools.search.api_key_validator import APIKeyError
-from HDRP.services.shared.pipeline_runner import (
-    build_search_provider,
-    PipelineRunner,
-    OrchestratedPipelineRunner,
-)
 
+# rich and the pipeline (which pulls in every service and search provider)
+# are imported inside the functions that need them, so `--help` and
+# importers of this module stay cheap. typer is needed at import time to
+# declare the app. The names below remain available as module attributes
+# (e.g. ``HDRP.cli.PipelineRunner``) and are imported on first access.
+_LAZY = {
+    "Console": ("rich.console", "Console"),
+    "Panel": ("rich.panel", "Panel"),
+    "SearchFactory": ("HDRP.tools.search.factory", "SearchFactory"),
+    "build_search_provider": ("HDRP.services.shared.pipeline_runner", "build_search_provider"),
+    "PipelineRunner": ("HDRP.services.shared.pipeline_runner", "PipelineRunner"),
+    "OrchestratedPipelineRunner": ("HDRP.services.shared.pipeline_runner", "OrchestratedPipelineRunner"),
+    "ResearcherService": ("HDRP.services.researcher.service", "ResearcherService"),
+    "CriticService": ("HDRP.services.critic.service", "CriticService"),
+    "SynthesizerService": ("HDRP.services.synthesizer.service", "SynthesizerService"),
+}
+
+
+def __getattr__(name: str):
+    """Resolve a lazily imported attribute (PEP 562) and cache it on the module."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
 
-console = Console()
 
-# Path to artifacts directory
-ARTIFACTS_DIR = Path(__file__).parent / "artifacts"
+@lru_cache(maxsize=1)
+def _console():
+    """Return the shared Rich console, creating it on first use."""
+    from rich.console import Console
 
-# Create app with run as the default callback
-app = typer.Typer(help="HDRP research CLI")
+    return Console()
 
 
-def _save_report_artifacts(run_id: str, query: str, report: str, claims: list, critique_results: list):
-    """
-    Save report and metadata to the artifacts directory for dashboard access.
+def _print_report(report: str) -> None:
+    """Print a report as plain text (no Rich markup parsing).
     
-    Args:
-        run_id: The run ID
-        query: The original query
-        report: The generated markdown report
-        claims: List of all extracted claims
-        critique_results: List of critique results
+    On a terminal the report goes through the Rich console; when stdout is
+    piped or redirected it is written to the underlying byte stream as-is,
+    skipping Rich's wrapping and rendering of large reports.
     """
-    # Create run-specific directory
-    run_dir = ARTIFACTS_DIR / run_id
-    run_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Save report.md
-    report_path = run_dir / "report.md"
-    report_path.write_text(report, encoding='utf-8')
-    
-    # Build metadata
-    verified_count = sum(1 for r in critique_results if r.is_valid)
-    
-    # Collect unique sources
-    sources_dict = {}
-    for claim in claims:
-        url = getattr(claim, 'source_url', None)
-        if url and url not in sources_dict:
-            sources_dict[url] = {
-                "url": url,
-                "title": getattr(claim, 'source_title', 'Unknown'),
-                "rank": len(sources_dict) + 1,
-                "claims": 1
-            }
-        elif url:
-            sources_dict[url]["claims"] += 1
-    
-    metadata = {
-        "bundle_info": {
-            "run_id": run_id,
-            "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-            "query": query,
-            "report_title": f"HDRP Research Report: {query}"
-        },
-        "statistics": {
-            "total_claims": len(claims),
-            "verified_claims": verified_count,
-            "rejected_claims": len(critique_results) - verified_count,
-            "unique_sources": len(sources_dict)
-        },
-        "sources": list(sources_dict.values()),
-        "provenance": {
-            "system": "HDRP",
-            "version": "1.0.0",
-            "pipeline": ["Researcher", "Critic", "Synthesizer"],
-            "verification_enabled": True
-        }
-    }
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None or stream.isatty():
+        _console().print(report, markup=False)
+        return
     
-    # Save metadata.json
-    metadata_path = run_dir / "metadata.json"
-    with open(metadata_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2)
+    stream.flush()
+    buffer.write(report.encode("utf-8"))
+    if not report.endswith("\n"):
+        buffer.write(b"\n")
+    buffer.flush()
+
+
+# Path to artifacts directory
+ARTIFACTS_DIR = Path(__file__).parent / "artifacts"
+
+# Create app with run as the default callback
+app = typer.Typer(help="HDRP research CLI")
 
 
-# _build_search_provider moved to services.shared.pipeline_runner
+# _build_search_provider and _save_report_artifacts live in services.shared.pipeline_runner
 
 
 
@@ -129,8 +108,20 @@ def execute_pipeline(
         
     Returns:
         If return_dict=True: {"success": bool, "run_id": str, "report": str, "error": str, "stats": {...}}
+            (directly answered queries carry "route": "direct" and no stats)
         If return_dict=False: int exit code (0=success, 1=failure)
     """
+    from HDRP.tools.search.base import SearchError
+    from HDRP.tools.search.api_key_validator import APIKeyError
+    from HDRP.services.shared import mfee
+    from HDRP.services.shared.logger import ResearchLogger
+    from HDRP.services.shared.pipeline_runner import (
+        _save_report_artifacts,
+        build_search_provider,
+        PipelineRunner,
+        write_report_file,
+    )
+
     # Build search provider
     try:
         search_provider = build_search_provider(provider, api_key)
@@ -147,7 +138,9 @@ def execute_pipeline(
     except (SearchError, APIKeyError) as exc:
         error_msg = f"Configuration Error: {exc}"
         if not return_dict:
-            console.print(Panel.fit(
+            from rich.panel import Panel
+
+            _console().print(Panel.fit(
                 f"[bold red]Configuration Error[/bold red]\\n\\n{exc}",
                 border_style="red",
                 title="[bold]HDRP Setup Required[/bold]",
@@ -162,7 +155,7 @@ def execute_pipeline(
     except Exception as exc:
         error_msg = f"Failed to initialize search provider: {exc}"
         if not return_dict:
-            console.print(f"[bold red][hdrp][/bold red] {error_msg}")
+            _console().print(f"[bold red][hdrp][/bold red] {error_msg}")
             return 1
         return {
             "success": False,
@@ -171,6 +164,35 @@ def execute_pipeline(
             "error": error_msg,
         }
     
+    # Answer trivial queries directly, skipping Researcher -> Critic -> Synthesizer.
+    # This runs after the provider is built so configuration errors still surface.
+    direct_report = mfee.direct_answer(query)
+    if direct_report is not None:
+        # Log under a real run_id so the run shows up like any other
+        logger = ResearchLogger("cli", run_id=run_id)
+        logger.log("query_submitted", {"query": query})
+        logger.log("direct_answer", {"route": "direct"})
+        # Save artifacts so the run has a report in the dashboard (failure is non-fatal)
+        try:
+            _save_report_artifacts(logger.run_id, query, direct_report, [], [])
+        except Exception as exc:
+            logger.log("artifact_save_failed", {"error": str(exc)})
+        if progress_callback:
+            progress_callback("direct", 100)
+        result = {
+            "success": True,
+            "run_id": logger.run_id,
+            "report": direct_report,
+            "error": "",
+            "route": "direct",
+        }
+        if output_path:
+            try:
+                write_report_file(output_path, direct_report)
+            except OSError as exc:
+                result.update(success=False, error=f"Failed to write report to {output_path}: {exc}")
+        return _format_result(result, output_path, return_dict)
+
     # Use unified PipelineRunner
     runner = PipelineRunner(
         search_provider=search_provider,
@@ -180,14 +202,17 @@ def execute_pipeline(
     )
     
     result = runner.execute(query=query, output_path=output_path)
-    
-    # Handle CLI-specific output formatting
+    return _format_result(result, output_path, return_dict)
+
+
+def _format_result(result: dict, output_path: Optional[str], return_dict: bool):
+    """Return the result dict, or print it and return an exit code for the CLI."""
     if not return_dict:
         if not result["success"]:
             return 1
         if not output_path and result["report"]:
-            # Print to stdout as plain text (no Rich markup parsing) - CLI only
-            console.print(result["report"], markup=False)
+            # Print to stdout as plain text - CLI only
+            _print_report(result["report"])
         return 0
     
     return result
@@ -202,6 +227,9 @@ def _run_cli(
     verbose: bool,
 ) -> None:
     """Run a single HDRP research query (CLI wrapper)."""
+    from rich.panel import Panel
+
+    console = _console()
     provider_display = provider or "auto"
     mode_display = mode.upper()
 
@@ -216,6 +244,8 @@ def _run_cli(
     )
 
     if mode.lower() == "orchestrator":
+        from HDRP.services.shared.pipeline_runner import OrchestratedPipelineRunner
+
         # Use unified OrchestratedPipelineRunner
         runner = OrchestratedPipelineRunner(
             provider=provider or "",
@@ -230,7 +260,7 @@ def _run_cli(
             exit_code = 1
         else:
             if not output and result["report"]:
-                console.print(result["report"], markup=False)
+                _print_report(result["report"])
             exit_code = 0
     else:
         exit_code = execute_pipeline(
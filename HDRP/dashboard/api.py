@@ -6,14 +6,40 @@ Manages query execution in background threads with real-time status tracking.
 Supports both Python-only and orchestrator execution modes.
 """
 
+import itertools
+import os
+import queue
 import threading
 import time
 import uuid
-from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
 
+# Imported at load time rather than per query; neither module imports the
+# dashboard, so there is no cycle
+from HDRP.cli import run_query_programmatic
+from HDRP.services.shared.pipeline_runner import OrchestratedPipelineRunner
+
+# Default cap on concurrently running queries (override with HDRP_MAX_CONCURRENT)
+DEFAULT_MAX_CONCURRENT = 4
+
+# Finished executions kept in memory before the oldest are evicted
+DEFAULT_MAX_EXECUTIONS = 1000
+
+# Seconds between automatic cleanup_old_executions passes
+CLEANUP_INTERVAL_S = 3600
+
+
+def _max_concurrent() -> int:
+    """Read HDRP_MAX_CONCURRENT, falling back to the default if unset or invalid."""
+    try:
+        return max(1, int(os.getenv("HDRP_MAX_CONCURRENT", DEFAULT_MAX_CONCURRENT)))
+    except ValueError:
+        return DEFAULT_MAX_CONCURRENT
+
 
 class ExecutionStatus(Enum):
     """Execution status states."""
@@ -24,14 +50,18 @@ class ExecutionStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ExecutionProgress:
-    """Progress information for a running query."""
+    """Progress information for a running query.
+    
+    Slotted (no per-instance __dict__): records are long-lived and written
+    on every progress tick. Compared by identity only.
+    """
     status: ExecutionStatus
     run_id: str
     query: str
-    started_at: str
-    completed_at: Optional[str] = None
+    started_at: datetime
+    completed_at: Optional[datetime] = None
     progress_percent: float = 0.0
     current_stage: str = "Initializing..."
     claims_extracted: int = 0
@@ -39,6 +69,8 @@ class ExecutionProgress:
     claims_rejected: int = 0
     error_message: Optional[str] = None
     report: Optional[str] = None
+    # Epoch seconds matching started_at, for age checks without reparsing
+    started_ts: float = field(default_factory=time.time)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -46,8 +78,8 @@ class ExecutionProgress:
             "status": self.status.value,
             "run_id": self.run_id,
             "query": self.query,
-            "started_at": self.started_at,
-            "completed_at": self.completed_at,
+            "started_at": self.started_at.isoformat(),
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "progress_percent": self.progress_percent,
             "current_stage": self.current_stage,
             "claims_extracted": self.claims_extracted,
@@ -58,16 +90,62 @@ class ExecutionProgress:
         }
 
 
+# States after which an execution record may be evicted
+_FINISHED_STATUSES = frozenset({
+    ExecutionStatus.COMPLETED,
+    ExecutionStatus.FAILED,
+    ExecutionStatus.CANCELLED,
+})
+
+# Fields _update_progress may set (membership test instead of hasattr)
+_PROGRESS_FIELDS = frozenset(f.name for f in fields(ExecutionProgress))
+
+
+def _snapshot_value(value: Any) -> Any:
+    """Convert a field value to its to_dict() form (enum value, ISO timestamp)."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
 class QueryExecutor:
     """
-    Manages query execution in background threads.
+    Manages query execution on a bounded pool of background threads.
     
     Thread-safe execution tracker that supports multiple concurrent queries.
+    Queries beyond the pool size wait in QUEUED state until a worker frees up.
+    
+    Writers update the ExecutionProgress records under a lock and then
+    publish a fresh to_dict() snapshot per run. Readers polling get_status
+    get the latest snapshot without taking the lock.
     """
     
-    def __init__(self):
-        """Initialize the query executor."""
+    def __init__(self, max_workers: Optional[int] = None, max_executions: int = DEFAULT_MAX_EXECUTIONS):
+        """
+        Initialize the query executor.
+        
+        Args:
+            max_workers: Maximum concurrently running queries
+                (default: HDRP_MAX_CONCURRENT or DEFAULT_MAX_CONCURRENT)
+            max_executions: Number of execution records to keep; beyond it
+                the oldest finished records are evicted (running ones never)
+        """
+        self._max_executions = max_executions
+        self._cleanup_scheduled = False
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers or _max_concurrent(),
+            thread_name_prefix="hdrp-query",
+        )
+        self._futures: Dict[str, Future] = {}
+        # Pipeline progress is queued and applied by one drain thread, so
+        # pipeline threads never wait on the executor lock
+        self._progress_q: "queue.SimpleQueue[Tuple[str, str, float]]" = queue.SimpleQueue()
+        threading.Thread(target=self._drain_progress, name="hdrp-progress", daemon=True).start()
         self._executions: Dict[str, ExecutionProgress] = {}
+        # Published snapshots, replaced (never mutated) by _publish
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
         self._lock = threading.Lock()
         self._cancel_flags: Dict[str, threading.Event] = {}
     
@@ -94,14 +172,16 @@ class QueryExecutor:
         Returns:
             run_id: Unique identifier for this execution
         """
-        run_id = str(uuid.uuid4())
+        run_id = uuid.uuid4().hex
         
         # Create progress tracker
+        started = datetime.now()
         progress = ExecutionProgress(
             status=ExecutionStatus.QUEUED,
             run_id=run_id,
             query=query,
-            started_at=datetime.now().isoformat(),
+            started_at=started,
+            started_ts=started.timestamp(),
         )
         
         # Create cancel flag
@@ -110,14 +190,22 @@ class QueryExecutor:
         with self._lock:
             self._executions[run_id] = progress
             self._cancel_flags[run_id] = cancel_flag
+            self._publish(progress)
+            self._evict_finished()
+            schedule_cleanup = not self._cleanup_scheduled
+            self._cleanup_scheduled = True
+        
+        if schedule_cleanup:
+            self._schedule_cleanup()
         
-        # Start execution thread
-        thread = threading.Thread(
-            target=self._execute_in_background,
-            args=(run_id, query, provider, mode, max_results, verbose, api_key, cancel_flag),
-            daemon=True,
+        # Queue execution on the worker pool
+        future = self._pool.submit(
+            self._execute_in_background,
+            run_id, query, provider, mode, max_results, verbose, api_key, cancel_flag,
         )
-        thread.start()
+        with self._lock:
+            self._futures[run_id] = future
+        future.add_done_callback(lambda _: self._futures.pop(run_id, None))
         
         return run_id
     
@@ -158,8 +246,8 @@ class QueryExecutor:
                     status=ExecutionStatus.COMPLETED,
                     current_stage="Completed successfully",
                     progress_percent=100.0,
-                    report=result.get("report", ""),
-                    completed_at=datetime.now().isoformat(),
+                    report=result["report"],
+                    completed_at=datetime.now(),
                 )
             else:
                 self._update_progress(
@@ -167,7 +255,7 @@ class QueryExecutor:
                     status=ExecutionStatus.FAILED,
                     current_stage="Execution failed",
                     error_message=result.get("error", "Unknown error"),
-                    completed_at=datetime.now().isoformat(),
+                    completed_at=datetime.now(),
                 )
         
         except Exception as e:
@@ -176,7 +264,7 @@ class QueryExecutor:
                 status=ExecutionStatus.FAILED,
                 current_stage="Execution failed",
                 error_message=str(e),
-                completed_at=datetime.now().isoformat(),
+                completed_at=datetime.now(),
             )
     
     def _execute_python_mode(
@@ -189,8 +277,6 @@ class QueryExecutor:
         cancel_flag: threading.Event,
     ) -> Dict[str, Any]:
         """Execute query using Python-only pipeline."""
-        from HDRP.cli import run_query_programmatic
-        
         self._update_progress(run_id, current_stage="Initializing Python pipeline...", progress_percent=5.0)
         
         if cancel_flag.is_set():
@@ -203,9 +289,7 @@ class QueryExecutor:
             api_key=api_key,
             verbose=verbose,
             run_id=run_id,
-            progress_callback=lambda stage, percent: self._update_progress(
-                run_id, current_stage=stage, progress_percent=percent
-            ) if not cancel_flag.is_set() else None,
+            progress_callback=self._progress_callback(run_id, cancel_flag),
         )
         
         return result
@@ -220,8 +304,6 @@ class QueryExecutor:
         cancel_flag: threading.Event,
     ) -> Dict[str, Any]:
         """Execute query using Go orchestrator."""
-        from HDRP.services.shared.pipeline_runner import OrchestratedPipelineRunner
-        
         self._update_progress(run_id, current_stage="Starting orchestrator services...", progress_percent=5.0)
         
         if cancel_flag.is_set():
@@ -233,9 +315,7 @@ class QueryExecutor:
             api_key=api_key,
             verbose=verbose,
             run_id=run_id,
-            progress_callback=lambda stage, percent: self._update_progress(
-                run_id, current_stage=stage, progress_percent=percent
-            ) if not cancel_flag.is_set() else None,
+            progress_callback=self._progress_callback(run_id, cancel_flag),
         )
         
         # Execute through orchestrator
@@ -243,14 +323,65 @@ class QueryExecutor:
         
         return result
     
+    def _publish(self, progress: ExecutionProgress, changes: Optional[Dict[str, Any]] = None):
+        """
+        Replace the published snapshot for a run (caller holds the lock).
+        
+        Args:
+            progress: Execution record to publish
+            changes: Fields changed since the last snapshot; when given, the
+                previous snapshot is copied with only these keys replaced
+                instead of rebuilding it with to_dict()
+        """
+        previous = self._snapshots.get(progress.run_id)
+        if previous is None or changes is None:
+            self._snapshots[progress.run_id] = progress.to_dict()
+            return
+        
+        snapshot = previous.copy()
+        for key, value in changes.items():
+            if key in snapshot:
+                snapshot[key] = _snapshot_value(value)
+        self._snapshots[progress.run_id] = snapshot
+    
+    def _progress_callback(self, run_id: str, cancel_flag: threading.Event):
+        """Build the non-blocking progress callback handed to a pipeline runner."""
+        def callback(stage: str, percent: float):
+            if not cancel_flag.is_set():
+                self._progress_q.put((run_id, stage, percent))
+        return callback
+    
+    def _drain_progress(self):
+        """Apply queued pipeline progress in order (runs on the drain thread)."""
+        while True:
+            run_id, stage, percent = self._progress_q.get()
+            with self._lock:
+                progress = self._executions.get(run_id)
+                # A late update must not overwrite a run's final state
+                if progress is not None and progress.status not in _FINISHED_STATUSES:
+                    self._apply(progress, {"current_stage": stage, "progress_percent": percent})
+    
     def _update_progress(self, run_id: str, **kwargs):
         """Update execution progress (thread-safe)."""
         with self._lock:
-            if run_id in self._executions:
-                progress = self._executions[run_id]
-                for key, value in kwargs.items():
-                    if hasattr(progress, key):
-                        setattr(progress, key, value)
+            progress = self._executions.get(run_id)
+            if progress is not None:
+                self._apply(progress, kwargs)
+    
+    def _apply(self, progress: ExecutionProgress, updates: Dict[str, Any]):
+        """
+        Set fields on a record and republish it (caller holds the lock).
+        
+        Updates that leave every field unchanged (e.g. a repeated stage) are
+        dropped without republishing the snapshot.
+        """
+        changes = {}
+        for key, value in updates.items():
+            if key in _PROGRESS_FIELDS and getattr(progress, key) != value:
+                setattr(progress, key, value)
+                changes[key] = value
+        if changes:
+            self._publish(progress, changes)
     
     def get_status(self, run_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -260,13 +391,11 @@ class QueryExecutor:
             run_id: Execution identifier
             
         Returns:
-            Progress dictionary or None if not found
+            Progress dictionary or None if not found. The dictionary is a
+            shared snapshot and must not be modified.
         """
-        with self._lock:
-            progress = self._executions.get(run_id)
-            if progress:
-                return progress.to_dict()
-            return None
+        # Lock-free: snapshots are replaced whole, never mutated in place
+        return self._snapshots.get(run_id)
     
     def cancel_query(self, run_id: str) -> bool:
         """
@@ -281,38 +410,88 @@ class QueryExecutor:
         with self._lock:
             if run_id in self._cancel_flags:
                 progress = self._executions.get(run_id)
-                if progress and progress.status in [ExecutionStatus.QUEUED, ExecutionStatus.RUNNING]:
+                if progress and progress.status not in _FINISHED_STATUSES:
+                    # Drops runs still waiting for a worker; running ones
+                    # stop at their next cancel_flag check
+                    future = self._futures.get(run_id)
+                    if future is not None:
+                        future.cancel()
                     self._cancel_flags[run_id].set()
                     progress.status = ExecutionStatus.CANCELLED
                     progress.current_stage = "Cancelled by user"
-                    progress.completed_at = datetime.now().isoformat()
+                    progress.completed_at = datetime.now()
+                    self._publish(progress)
                     return True
         return False
     
+    def shutdown(self) -> None:
+        """
+        Cancel every unfinished query and stop the worker pool.
+        
+        The pool's threads are joined at interpreter exit, before atexit
+        handlers run, so the server calls this when it stops (see
+        HDRP.dashboard.app). Queued runs are dropped and running ones stop at
+        their next cancel_flag check, so exit is not held up by the backlog.
+        The executor accepts no new queries afterwards.
+        """
+        with self._lock:
+            run_ids = list(self._cancel_flags)
+        for run_id in run_ids:
+            self.cancel_query(run_id)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+    
     def get_all_executions(self) -> List[Dict[str, Any]]:
-        """Get all executions (for debugging/monitoring)."""
+        """Get all executions (for debugging/monitoring).
+        
+        Returns the published snapshots; the lock is held only to copy the
+        list, not to serialize each record.
+        """
         with self._lock:
-            return [p.to_dict() for p in self._executions.values()]
+            return list(self._snapshots.values())
     
     def cleanup_old_executions(self, max_age_hours: int = 24):
         """Remove old execution records."""
-        cutoff = datetime.now().timestamp() - (max_age_hours * 3600)
+        cutoff = time.time() - (max_age_hours * 3600)
         
         with self._lock:
-            to_remove = []
-            for run_id, progress in self._executions.items():
-                started = datetime.fromisoformat(progress.started_at).timestamp()
-                if started < cutoff and progress.status in [
-                    ExecutionStatus.COMPLETED,
-                    ExecutionStatus.FAILED,
-                    ExecutionStatus.CANCELLED,
-                ]:
-                    to_remove.append(run_id)
-            
+            to_remove = [
+                run_id
+                for run_id, progress in self._executions.items()
+                if progress.started_ts < cutoff and progress.status in _FINISHED_STATUSES
+            ]
             for run_id in to_remove:
-                del self._executions[run_id]
-                if run_id in self._cancel_flags:
-                    del self._cancel_flags[run_id]
+                self._forget(run_id)
+    
+    def _forget(self, run_id: str):
+        """Drop all state for a run (caller holds the lock)."""
+        del self._executions[run_id]
+        self._snapshots.pop(run_id, None)
+        self._cancel_flags.pop(run_id, None)
+    
+    def _evict_finished(self):
+        """Evict the oldest finished runs beyond max_executions (caller holds the lock)."""
+        excess = len(self._executions) - self._max_executions
+        if excess <= 0:
+            return
+        # Dicts keep insertion order, so this walks runs oldest first
+        finished = (
+            run_id for run_id, progress in self._executions.items()
+            if progress.status in _FINISHED_STATUSES
+        )
+        for run_id in list(itertools.islice(finished, excess)):
+            self._forget(run_id)
+    
+    def _schedule_cleanup(self):
+        """Run cleanup_old_executions every CLEANUP_INTERVAL_S on a daemon timer."""
+        timer = threading.Timer(CLEANUP_INTERVAL_S, self._periodic_cleanup)
+        timer.daemon = True
+        timer.start()
+    
+    def _periodic_cleanup(self):
+        try:
+            self.cleanup_old_executions()
+        finally:
+            self._schedule_cleanup()
 
 
 # Global executor instance
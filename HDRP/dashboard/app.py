@@ -6,18 +6,24 @@ Dash-based web UI for monitoring HDRP research runs.
 Run with: python -m HDRP.dashboard.app
 """
 
-from dash import Dash, html, dcc, callback, Output, Input, State, ctx, no_update
+import functools
+import importlib
+
+try:
+    import flask_compress
+except ImportError:
+    flask_compress = None
+
+try:
+    import gunicorn.app.base as gunicorn_base
+except ImportError:
+    gunicorn_base = None
+
+from dash import Dash, html, dcc, callback, ctx, ALL, ClientsideFunction, Output, Input, State, Patch, no_update
 import dash
 
 from HDRP.dashboard.layout import create_layout
-from HDRP.dashboard.pages.dashboard import create_dashboard_page
-from HDRP.dashboard.pages.runs import create_runs_page
-from HDRP.dashboard.pages.claims import create_claims_page
-from HDRP.dashboard.pages.dag import create_dag_page
-from HDRP.dashboard.pages.metrics import create_metrics_page
-from HDRP.dashboard.pages.query import create_query_page
-from HDRP.dashboard.pages.reports import create_reports_page
-from HDRP.dashboard.data_loader import load_run, load_report_content
+from HDRP.dashboard.data_loader import get_recent_events, get_run_progress, load_run, load_report_content
 
 
 # Initialize the Dash app
@@ -27,159 +33,170 @@ app = Dash(
     update_title=None,
     suppress_callback_exceptions=True,
     assets_folder="assets",
+    # gzip callback responses when flask-compress is installed
+    compress=flask_compress is not None,
 )
 
 # Set the layout
 app.layout = create_layout()
 
+# WSGI entry point (e.g. gunicorn HDRP.dashboard.app:server)
+server = app.server
 
-# Page routing callback
-@callback(
-    Output("page-content", "children"),
-    Output("nav-dashboard", "className"),
-    Output("nav-reports", "className"),
-    Output("nav-runs", "className"),
-    Output("nav-claims", "className"),
-    Output("nav-dag", "className"),
-    Output("nav-metrics", "className"),
-    Output("nav-query", "className"),
+# Request threads for the production server. Query executions live in this
+# process's QueryExecutor, so the dashboard runs a single worker process.
+SERVER_THREADS = 8
+
+
+# Executor accessor from HDRP.dashboard.api, bound on first use
+_executor_accessor = None
+
+
+def get_executor():
+    """
+    Return the dashboard query executor.
+
+    HDRP.dashboard.api pulls in the whole pipeline stack, so it is imported
+    when a query is first submitted or polled rather than at startup.
+    """
+    global _executor_accessor
+    if _executor_accessor is None:
+        _executor_accessor = importlib.import_module("HDRP.dashboard.api").get_executor
+    return _executor_accessor()
+
+
+def _shutdown_executor():
+    """Cancel outstanding queries so the server process can exit promptly."""
+    if _executor_accessor is not None:
+        _executor_accessor().shutdown()
+
+
+# Pages rendered for a selected run_id
+RUN_PAGES = frozenset({"reports", "claims", "dag", "metrics"})
+
+
+@functools.cache
+def _get_page(name):
+    """Import HDRP.dashboard.pages.<name> on first use and return its factory."""
+    module = importlib.import_module(f"HDRP.dashboard.pages.{name}")
+    return getattr(module, f"create_{name}_page")
+
+
+def render_page(name, run_id=None):
+    """
+    Render a dashboard page by name.
+
+    Pages are rebuilt on every call: run-scoped pages embed the current list
+    of runs in their selector. Parsed run data is memoized by the data
+    loader, keyed on each log's mtime and size.
+
+    Args:
+        name: Page name (a module under HDRP.dashboard.pages)
+        run_id: Selected run for run-scoped pages
+
+    Returns:
+        Page component tree
+    """
+    if name in RUN_PAGES:
+        return _get_page(name)(run_id)
+    return _get_page(name)()
+
+
+# Status fields rendered by the query page; polls update only when one changes
+STATUS_DISPLAY_FIELDS = (
+    "status",
+    "progress_percent",
+    "current_stage",
+    "claims_extracted",
+    "claims_verified",
+    "claims_rejected",
+    "sources_processed",
+    "error_message",
+)
+
+
+# Page routing: the URL pathname is the single source of truth. Sidebar links
+# update it, the browser toggles the active nav class and the server only
+# renders page content.
+NAV_PATHS = {
+    "/reports": "reports",
+    "/runs": "runs",
+    "/claims": "claims",
+    "/dag": "dag",
+    "/metrics": "metrics",
+    "/query": "query",
+}
+
+app.clientside_callback(
+    """
+    function(pathname) {
+        var links = window.dash_clientside.callback_context.outputs_list;
+        var page = (pathname || "/").replace(/^\\/+|\\/+$/g, "");
+        var known = links.some(function(link) { return link.id.page === page; });
+        if (!known) {
+            page = "dashboard";
+        }
+        return links.map(function(link) {
+            return link.id.page === page ? "nav-link active" : "nav-link";
+        });
+    }
+    """,
+    Output({"type": "nav-link", "page": ALL}, "className"),
     Input("url", "pathname"),
-    Input("nav-dashboard", "n_clicks"),
-    Input("nav-reports", "n_clicks"),
-    Input("nav-runs", "n_clicks"),
-    Input("nav-claims", "n_clicks"),
-    Input("nav-dag", "n_clicks"),
-    Input("nav-metrics", "n_clicks"),
-    Input("nav-query", "n_clicks"),
-    State("selected-run-id", "data"),
-    prevent_initial_call=False,
 )
-def route_page(pathname, n_dash, n_reports, n_runs, n_claims, n_dag, n_metrics, n_query, selected_run_id):
-    """Route to the appropriate page based on URL or navigation clicks."""
-    
-    # Determine which page to show
-    triggered_id = ctx.triggered_id if ctx.triggered_id else None
-    
-    if triggered_id == "nav-reports" or pathname == "/reports":
-        page = "reports"
-    elif triggered_id == "nav-runs" or pathname == "/runs":
-        page = "runs"
-    elif triggered_id == "nav-claims" or pathname == "/claims":
-        page = "claims"
-    elif triggered_id == "nav-dag" or pathname == "/dag":
-        page = "dag"
-    elif triggered_id == "nav-metrics" or pathname == "/metrics":
-        page = "metrics"
-    elif triggered_id == "nav-query" or pathname == "/query":
-        page = "query"
-    else:
-        page = "dashboard"
-    
-    # Generate page content
-    if page == "reports":
-        content = create_reports_page(selected_run_id)
-    elif page == "runs":
-        content = create_runs_page()
-    elif page == "claims":
-        content = create_claims_page(selected_run_id)
-    elif page == "dag":
-        content = create_dag_page(selected_run_id)
-    elif page == "metrics":
-        content = create_metrics_page(selected_run_id)
-    elif page == "query":
-        content = create_query_page()
-    else:
-        content = create_dashboard_page()
-    
-    # Set active nav link classes
-    base = "nav-link"
-    active = "nav-link active"
-    
-    return (
-        content,
-        active if page == "dashboard" else base,
-        active if page == "reports" else base,
-        active if page == "runs" else base,
-        active if page == "claims" else base,
-        active if page == "dag" else base,
-        active if page == "metrics" else base,
-        active if page == "query" else base,
-    )
 
 
-# Run selector callbacks for Claims page
 @callback(
-    Output("page-content", "children", allow_duplicate=True),
-    Input("claims-run-selector", "value"),
-    prevent_initial_call=True,
+    Output("page-content", "children"),
+    Input("url", "pathname"),
+    State("selected-run-id", "data"),
+    prevent_initial_call=False,
 )
-def update_claims_page(run_id):
-    """Update claims page when run is selected."""
-    if run_id:
-        return create_claims_page(run_id)
-    return no_update
+def route_page(pathname, selected_run_id):
+    """Render the page for the current URL pathname."""
+    page = NAV_PATHS.get((pathname or "/").rstrip("/"), "dashboard")
+    return render_page(page, selected_run_id)
 
 
-# Run selector callbacks for DAG page
+# Run selector callback shared by the run-scoped pages
 @callback(
     Output("page-content", "children", allow_duplicate=True),
-    Input("dag-run-selector", "value"),
+    Input({"type": "run-selector", "page": ALL}, "value"),
     prevent_initial_call=True,
 )
-def update_dag_page(run_id):
-    """Update DAG page when run is selected."""
-    if run_id:
-        return create_dag_page(run_id)
-    return no_update
+def update_run_page(run_ids):
+    """Re-render the page whose run selector changed."""
+    trigger = ctx.triggered_id
+    run_id = ctx.triggered[0]["value"] if ctx.triggered else None
+    if not trigger or not run_id:
+        return no_update
+    return render_page(trigger["page"], run_id)
 
 
-# DAG layout update
-@callback(
+# DAG layout update (assets/dag.js)
+app.clientside_callback(
+    ClientsideFunction(namespace="dag", function_name="updateLayout"),
     Output("dag-cytoscape", "layout"),
     Input("dag-layout-selector", "value"),
     prevent_initial_call=True,
 )
-def update_dag_layout(layout_name):
-    """Update DAG layout."""
-    if layout_name == "dagre":
-        return {'name': 'dagre', 'rankDir': 'TB', 'spacingFactor': 1.5}
-    elif layout_name == "breadthfirst":
-        return {'name': 'breadthfirst', 'roots': '[id = "query"]', 'spacingFactor': 1.5}
-    else:
-        return {'name': layout_name}
 
 
-# Run selector callbacks for Metrics page
-@callback(
-    Output("page-content", "children", allow_duplicate=True),
-    Input("metrics-run-selector", "value"),
-    prevent_initial_call=True,
-)
-def update_metrics_page(run_id):
-    """Update metrics page when run is selected."""
-    if run_id:
-        return create_metrics_page(run_id)
-    return no_update
-
-
-# Run selector callbacks for Reports page
-@callback(
-    Output("page-content", "children", allow_duplicate=True),
-    Input("report-selector", "value"),
+# Back off status polling while the tab is hidden (assets/polling.js)
+app.clientside_callback(
+    ClientsideFunction(namespace="polling", function_name="intervalFor"),
+    Output("status-poll-interval", "interval"),
+    Input("page-visibility", "data"),
+    State("status-poll-ms", "data"),
     prevent_initial_call=True,
 )
-def update_reports_page(run_id):
-    """Update reports page when run is selected."""
-    if run_id:
-        return create_reports_page(run_id)
-    return no_update
 
 
 # Download report callback
 @callback(
     Output("download-report", "data"),
     Input("download-report-btn", "n_clicks"),
-    State("report-selector", "value"),
+    State({"type": "run-selector", "page": "reports"}, "value"),
     prevent_initial_call=True,
 )
 def download_report(n_clicks, run_id):
@@ -195,28 +212,27 @@ def download_report(n_clicks, run_id):
 
 
 # Store selected run from runs table
-@callback(
+app.clientside_callback(
+    """
+    function(selectedRows, tableData) {
+        if (!selectedRows || !selectedRows.length || !tableData) {
+            return null;
+        }
+        // Use full_run_id if available, otherwise run_id
+        var row = tableData[selectedRows[0]];
+        return row.full_run_id || row.run_id;
+    }
+    """,
     Output("selected-run-id", "data"),
     Input("runs-table", "selected_rows"),
     State("runs-table", "data"),
     prevent_initial_call=True,
 )
-def store_selected_run(selected_rows, table_data):
-    """Store the selected run ID."""
-    if selected_rows and table_data:
-        # Use full_run_id if available, otherwise run_id
-        run_id = table_data[selected_rows[0]].get("full_run_id") or table_data[selected_rows[0]]["run_id"]
-        return run_id
-    return None
 
 
 # Query execution callbacks
 @callback(
-    Output("execution-status", "data"),
-    Output("current-run-id", "data"),
-    Output("query-status", "style"),
-    Output("status-poll-interval", "disabled"),
-    Output("cancel-query-btn", "style"),
+    Output("query-exec-state", "data"),
     Input("submit-query-btn", "n_clicks"),
     State("query-input", "value"),
     State("provider-selector", "value"),
@@ -227,9 +243,7 @@ def store_selected_run(selected_rows, table_data):
 def submit_query(n_clicks, query, provider, max_results, verbose):
     """Handle query submission."""
     if not n_clicks or not query or not query.strip():
-        return no_update, no_update, no_update, no_update, no_update
-    
-    from HDRP.dashboard.api import get_executor
+        return no_update
     
     # Start execution
     executor = get_executor()
@@ -241,166 +255,276 @@ def submit_query(n_clicks, query, provider, max_results, verbose):
         verbose=verbose,
     )
     
-    # Show status card and enable polling
-    return (
-        {"status": "running"},
-        run_id,
-        {"marginTop": "24px", "display": "block"},
-        False,  # Enable polling
-        {"fontSize": "0.875rem", "padding": "4px 12px", "display": "inline-block"},  # Show cancel button
-    )
+    # Show status card, enable polling and show the cancel button
+    return {"run_id": run_id, "running": True, "showStatus": True}
 
 
-@callback(
+# Apply a submitted execution state to the query widgets (assets/query.js)
+app.clientside_callback(
+    ClientsideFunction(namespace="query", function_name="fanout"),
+    Output("execution-status", "data"),
+    Output("current-run-id", "data"),
+    Output("query-status", "style"),
+    Output("status-poll-interval", "disabled"),
+    Output("cancel-query-btn", "hidden"),
+    Input("query-exec-state", "data"),
+    prevent_initial_call=True,
+)
+
+
+# Clear the query form (assets/query.js)
+app.clientside_callback(
+    ClientsideFunction(namespace="query", function_name="clearForm"),
     Output("query-input", "value"),
     Output("max-results-input", "value"),
     Output("verbose-selector", "value"),
     Input("clear-query-btn", "n_clicks"),
     prevent_initial_call=True,
 )
-def clear_query_form(n_clicks):
-    """Clear the query form."""
-    if not n_clicks:
-        return no_update, no_update, no_update
-    return "", 10, False
 
 
-@callback(
-    Output("query-output", "children"),
-    Output("execution-status", "data", allow_duplicate=True),
-    Output("status-poll-interval", "disabled", allow_duplicate=True),
-    Output("cancel-query-btn", "style", allow_duplicate=True),
-    Input("status-poll-interval", "n_intervals"),
-    State("current-run-id", "data"),
-    prevent_initial_call=True,
-)
-def poll_execution_status(n_intervals, run_id):
-    """Poll execution status and update display."""
-    if not run_id:
-        return no_update, no_update, no_update, no_update
-    
-    from HDRP.dashboard.api import get_executor
-    
-    executor = get_executor()
-    status_data = executor.get_status(run_id)
-    
-    if not status_data:
-        return "Execution not found.", {"status": "error"}, True, {"display": "none"}
-    
+# Positions of the status panel children, patched in place between polls
+_PANEL_STATUS = 1
+_PANEL_PROGRESS = 2
+_PANEL_BAR = 3
+_PANEL_STAGE = 4
+_PANEL_CLAIMS = 5
+_PANEL_ERROR = 6
+_PANEL_COMPLETION = 7
+
+
+# Status text and progress bar colors; anything else is shown in blue
+STATUS_COLOR = {"completed": "#3fb950", "failed": "#f85149", "cancelled": "#d29922"}
+PROGRESS_COLOR = {"completed": "#3fb950"}
+DEFAULT_STATUS_COLOR = "#58a6ff"
+
+# Static styles shared by every status panel and activity log render
+_S_LABEL_ROW = {"marginBottom": "8px"}
+_S_PROGRESS_TRACK = {
+    "width": "100%",
+    "height": "8px",
+    "backgroundColor": "#21262d",
+    "borderRadius": "4px",
+    "marginBottom": "16px",
+    "overflow": "hidden",
+}
+_S_PROGRESS_BAR = {"height": "8px", "borderRadius": "4px", "transition": "width 0.3s ease"}
+_S_COUNTERS = {"marginBottom": "16px"}
+_S_COUNTER = {"marginRight": "16px", "display": "inline-block"}
+_S_LAST_COUNTER = {"display": "inline-block"}
+_S_VERIFIED = {"color": "#3fb950"}
+_S_REJECTED = {"color": "#f85149"}
+_S_MUTED = {"color": "#6e7681"}
+_S_LOG_LINE = {"marginBottom": "4px"}
+
+# Activity log text styles by event name; other events are shown in grey
+_S_EVENT_TEXT = {
+    "claims_extracted": {"color": "#58a6ff"},
+    "claim_verified": {"color": "#3fb950"},
+    "claim_rejected": {"color": "#f85149"},
+}
+_S_OTHER_EVENT_TEXT = {"color": "#8b949e"}
+
+
+def _claims_block(status_data):
+    """Render claim counters, or None before any claims are extracted."""
+    extracted = status_data.get("claims_extracted") or 0
+    if extracted <= 0:
+        return None
+    verified = status_data.get("claims_verified") or 0
+    rejected = status_data.get("claims_rejected") or 0
+    return html.Div([
+        html.Div([
+            html.Strong("Claims Extracted: "),
+            html.Span(str(extracted)),
+        ], style=_S_COUNTER),
+        html.Div([
+            html.Strong("Verified: "),
+            html.Span(str(verified), style=_S_VERIFIED),
+        ], style=_S_COUNTER),
+        html.Div([
+            html.Strong("Rejected: "),
+            html.Span(str(rejected), style=_S_REJECTED),
+        ], style=_S_LAST_COUNTER),
+    ], style=_S_COUNTERS)
+
+
+def _error_block(status_data):
+    """Render the error message, or None if the execution has not failed."""
+    error = status_data.get("error_message")
+    if not error:
+        return None
+    return html.Div([
+        html.Strong("Error: ", style={"color": "#f85149"}),
+        html.Pre(
+            error,
+            style={
+                "backgroundColor": "#21262d",
+                "padding": "12px",
+                "borderRadius": "6px",
+                "marginTop": "8px",
+                "whiteSpace": "pre-wrap",
+                "wordWrap": "break-word",
+            }
+        ),
+    ])
+
+
+def _completion_block(status):
+    """Render the completion card with links, or None until completed."""
+    if status != "completed":
+        return None
+    return html.Div([
+        html.Div("✓ Execution completed successfully!", style={"marginBottom": "12px", "color": "#3fb950", "fontSize": "1.1rem"}),
+        html.Div([
+            html.Span("View in "),
+            dcc.Link(
+                "Run History",
+                href="/runs",
+                style={"color": "#58a6ff", "textDecoration": "none", "fontWeight": "bold"},
+            ),
+            html.Span(" or check "),
+            dcc.Link(
+                "Claims",
+                href="/claims",
+                style={"color": "#58a6ff", "textDecoration": "none", "fontWeight": "bold"},
+            ),
+        ]),
+    ], style={
+        "marginTop": "16px",
+        "padding": "12px",
+        "backgroundColor": "rgba(63, 185, 80, 0.1)",
+        "borderRadius": "6px",
+        "border": "1px solid #3fb950",
+    })
+
+
+def _render_status_panel(run_id, status_data):
+    """Build the full status panel; children positions match the _PANEL_* indexes."""
     status = status_data["status"]
-    
-    # Build status display
-    output = html.Div([
+    pct = status_data["progress_percent"]
+    return html.Div([
         html.Div([
             html.Strong("Run ID: "),
             html.Code(run_id[:8] + "...", style={"color": "#58a6ff"}),
-        ], style={"marginBottom": "8px"}),
+        ], style=_S_LABEL_ROW),
         
         html.Div([
             html.Strong("Status: "),
             html.Span(
                 status.upper(),
-                style={
-                    "color": "#3fb950" if status == "completed" else
-                           "#f85149" if status == "failed" else
-                           "#d29922" if status == "cancelled" else "#58a6ff",
-                    "fontWeight": "bold",
-                }
+                style={"color": STATUS_COLOR.get(status, DEFAULT_STATUS_COLOR), "fontWeight": "bold"},
             ),
-        ], style={"marginBottom": "8px"}),
+        ], style=_S_LABEL_ROW),
         
         html.Div([
             html.Strong("Progress: "),
-            html.Span(f"{status_data['progress_percent']:.0f}%"),
-        ], style={"marginBottom": "8px"}),
+            html.Span(f"{pct:.0f}%"),
+        ], style=_S_LABEL_ROW),
         
         html.Div([
             html.Div(
                 style={
-                    "width": f"{status_data['progress_percent']}%",
-                    "height": "8px",
-                    "backgroundColor": "#3fb950" if status == "completed" else "#58a6ff",
-                    "borderRadius": "4px",
-                    "transition": "width 0.3s ease",
+                    **_S_PROGRESS_BAR,
+                    "width": f"{pct}%",
+                    "backgroundColor": PROGRESS_COLOR.get(status, DEFAULT_STATUS_COLOR),
                 }
             ),
-        ], style={
-            "width": "100%",
-            "height": "8px",
-            "backgroundColor": "#21262d",
-            "borderRadius": "4px",
-            "marginBottom": "16px",
-            "overflow": "hidden",
-        }),
+        ], style=_S_PROGRESS_TRACK),
         
         html.Div([
             html.Strong("Current Stage: "),
             html.Span(status_data["current_stage"]),
-        ], style={"marginBottom": "8px"}),
+        ], style=_S_LABEL_ROW),
         
-        # Show claim stats if available
-        html.Div([
-            html.Div([
-                html.Strong("Claims Extracted: "),
-                html.Span(str(status_data.get("claims_extracted", 0))),
-            ], style={"marginRight": "16px", "display": "inline-block"}),
-            html.Div([
-                html.Strong("Verified: "),
-                html.Span(str(status_data.get("claims_verified", 0)), style={"color": "#3fb950"}),
-            ], style={"marginRight": "16px", "display": "inline-block"}),
-            html.Div([
-                html.Strong("Rejected: "),
-                html.Span(str(status_data.get("claims_rejected", 0)), style={"color": "#f85149"}),
-            ], style={"display": "inline-block"}),
-        ], style={"marginBottom": "16px"}) if status_data.get("claims_extracted", 0) > 0 else None,
-        
-        # Show error message if failed
-        html.Div([
-            html.Strong("Error: ", style={"color": "#f85149"}),
-            html.Pre(
-                status_data["error_message"],
-                style={
-                    "backgroundColor": "#21262d",
-                    "padding": "12px",
-                    "borderRadius": "6px",
-                    "marginTop": "8px",
-                    "whiteSpace": "pre-wrap",
-                    "wordWrap": "break-word",
-                }
-            ),
-        ]) if status_data.get("error_message") else None,
-        
-        # Show completion message with link to run history
-        html.Div([
-            html.Div("✓ Execution completed successfully!", style={"marginBottom": "12px", "color": "#3fb950", "fontSize": "1.1rem"}),
-            html.Div([
-                html.Span("View in "),
-                dcc.Link(
-                    "Run History",
-                    href="/runs",
-                    style={"color": "#58a6ff", "textDecoration": "none", "fontWeight": "bold"},
-                ),
-                html.Span(" or check "),
-                dcc.Link(
-                    "Claims",
-                    href="/claims",
-                    style={"color": "#58a6ff", "textDecoration": "none", "fontWeight": "bold"},
-                ),
-            ]),
-        ], style={
-            "marginTop": "16px",
-            "padding": "12px",
-            "backgroundColor": "rgba(63, 185, 80, 0.1)",
-            "borderRadius": "6px",
-            "border": "1px solid #3fb950",
-        }) if status == "completed" else None,
+        _claims_block(status_data),
+        _error_block(status_data),
+        _completion_block(status),
     ])
+
+
+def _patch_status_panel(previous, status_data):
+    """
+    Patch only the status panel children whose fields changed.
+
+    Args:
+        previous: Field values from the last render, keyed by STATUS_DISPLAY_FIELDS
+        status_data: Current execution status
+
+    Returns:
+        Patch for the query-output children
+    """
+    changed = {
+        field for field in STATUS_DISPLAY_FIELDS
+        if previous.get(field) != status_data.get(field)
+    }
+    status = status_data["status"]
+    patch = Patch()
+    panel = patch["props"]["children"]
+
+    if "status" in changed:
+        span = panel[_PANEL_STATUS]["props"]["children"][1]["props"]
+        span["children"] = status.upper()
+        span["style"]["color"] = STATUS_COLOR.get(status, DEFAULT_STATUS_COLOR)
+        panel[_PANEL_BAR]["props"]["children"][0]["props"]["style"]["backgroundColor"] = (
+            PROGRESS_COLOR.get(status, DEFAULT_STATUS_COLOR)
+        )
+        panel[_PANEL_COMPLETION] = _completion_block(status)
+    if "progress_percent" in changed:
+        pct = status_data["progress_percent"]
+        panel[_PANEL_PROGRESS]["props"]["children"][1]["props"]["children"] = f"{pct:.0f}%"
+        panel[_PANEL_BAR]["props"]["children"][0]["props"]["style"]["width"] = f"{pct}%"
+    if "current_stage" in changed:
+        panel[_PANEL_STAGE]["props"]["children"][1]["props"]["children"] = status_data["current_stage"]
+    if changed & {"claims_extracted", "claims_verified", "claims_rejected"}:
+        panel[_PANEL_CLAIMS] = _claims_block(status_data)
+    if "error_message" in changed:
+        panel[_PANEL_ERROR] = _error_block(status_data)
+    return patch
+
+
+@callback(
+    Output("query-output", "children"),
+    Output("execution-status", "data", allow_duplicate=True),
+    Output("status-poll-interval", "disabled", allow_duplicate=True),
+    Output("cancel-query-btn", "hidden", allow_duplicate=True),
+    Input("status-poll-interval", "n_intervals"),
+    State("current-run-id", "data"),
+    State("execution-status", "data"),
+    prevent_initial_call=True,
+)
+def poll_execution_status(n_intervals, run_id, last_status):
+    """Poll execution status and update display when it has changed."""
+    if not run_id:
+        return no_update, no_update, no_update, no_update
+    
+    executor = get_executor()
+    status_data = executor.get_status(run_id)
+    
+    if not status_data:
+        return "Execution not found.", {"status": "error"}, True, True
+    
+    status = status_data["status"]
+    # Whole percents are all the panel shows; sub-percent ticks are not changes
+    status_data = dict(status_data, progress_percent=round(status_data["progress_percent"]))
+    fields = {field: status_data.get(field) for field in STATUS_DISPLAY_FIELDS}
+    previous = (last_status or {}).get("fields")
+    if previous == fields:
+        # Nothing visible changed since the last tick; skip the re-render
+        return no_update, no_update, no_update, no_update
+    
+    # The panel is built once per run; later polls patch it in place
+    if previous is None:
+        output = _render_status_panel(run_id, status_data)
+    else:
+        output = _patch_status_panel(previous, status_data)
     
     # Disable polling if execution is complete
     should_poll = status in ["queued", "running"]
-    hide_cancel = {"fontSize": "0.875rem", "padding": "4px 12px", "display": "none"} if not should_poll else no_update
+    # Only hide the cancel button here; query.fanout shows it for a new run
+    hide_cancel = True if not should_poll else no_update
     
-    return output, {"status": status}, not should_poll, hide_cancel
+    return output, {"status": status, "fields": fields}, not should_poll, hide_cancel
 
 
 @callback(
@@ -415,8 +539,6 @@ def cancel_query(n_clicks, run_id):
     if not n_clicks or not run_id:
         return no_update, no_update
     
-    from HDRP.dashboard.api import get_executor
-    
     executor = get_executor()
     cancelled = executor.cancel_query(run_id)
     
@@ -453,109 +575,35 @@ def toggle_detailed_progress(n_clicks, current_style):
         )
 
 
-# Update detailed progress content
-@callback(
+# Render the stage timeline and live stats in the browser (assets/query.js)
+app.clientside_callback(
+    ClientsideFunction(namespace="query", function_name="renderProgress"),
     Output("detailed-progress-section", "style"),
     Output("stage-timeline", "children"),
     Output("live-stats", "children"),
+    Input("execution-status", "data"),
+    State("current-run-id", "data"),
+    prevent_initial_call=True,
+)
+
+
+# Update the activity log from the run's event log
+@callback(
     Output("activity-log", "children"),
-    Input("status-poll-interval", "n_intervals"),
+    Input("execution-status", "data"),
     State("current-run-id", "data"),
     prevent_initial_call=True,
 )
-def update_detailed_progress(n_intervals, run_id):
-    """Update detailed progress information."""
-    if not run_id:
-        return no_update, no_update, no_update, no_update
-    
-    from HDRP.dashboard.api import get_executor
-    from HDRP.dashboard.data_loader import get_latest_events, get_run_progress
-    
-    executor = get_executor()
-    status_data = executor.get_status(run_id)
-    
-    if not status_data or status_data["status"] in ["completed", "failed", "cancelled"]:
-        # Hide detailed section on completion
-        return {"display": "none"}, no_update, no_update, no_update
-    
-    # Show detailed section during execution
-    section_style = {"borderTop": "1px solid #30363d", "display": "block"}
-    
-    # Build stage timeline
-    stages = [
-        ("Initializing", 0, 10),
-        ("Research", 10, 40),
-        ("Verification", 40, 80),
-        ("Synthesis", 80, 100),
-    ]
-    
-    current_progress = status_data.get("progress_percent", 0)
-    
-    timeline_items = []
-    for stage_name, start_pct, end_pct in stages:
-        is_complete = current_progress >= end_pct
-        is_current = start_pct <= current_progress < end_pct
-        
-        icon_style = {
-            "display": "inline-block",
-            "width": "20px",
-            "height": "20px",
-            "borderRadius": "50%",
-            "marginRight": "12px",
-            "border": "2px solid",
-        }
-        
-        if is_complete:
-            icon_style["backgroundColor"] = "#3fb950"
-            icon_style["borderColor"] = "#3fb950"
-            icon = "✓"
-        elif is_current:
-            icon_style["backgroundColor"] = "#58a6ff"
-            icon_style["borderColor"] = "#58a6ff"
-            icon = "●"
-        else:
-            icon_style["backgroundColor"] = "transparent"
-            icon_style["borderColor"] = "#6e7681"
-            icon = ""
-        
-        timeline_items.append(
-            html.Div([
-                html.Span(icon, style={**icon_style, "textAlign": "center", "lineHeight": "16px", "fontSize": "0.7rem"}),
-                html.Span(
-                    stage_name,
-                    style={
-                        "color": "#e6edf3" if (is_complete or is_current) else "#6e7681",
-                        "fontWeight": "500" if is_current else "normal",
-                    }
-                ),
-            ], style={"marginBottom": "8px", "display": "flex", "alignItems": "center"})
-        )
-    
-    # Build live statistics
-    stats = [
-        ("Claims Extracted", status_data.get("claims_extracted", 0), "#58a6ff"),
-        ("Claims Verified", status_data.get("claims_verified", 0), "#3fb950"),
-        ("Claims Rejected", status_data.get("claims_rejected", 0), "#f85149"),
-        ("Sources Processed", status_data.get("sources_processed", 0), "#a371f7"),
-    ]
-    
-    stat_cards = []
-    for label, value, color in stats:
-        stat_cards.append(
-            html.Div([
-                html.Div(label, style={"fontSize": "0.75rem", "color": "#8b949e", "marginBottom": "4px"}),
-                html.Div(str(value), style={"fontSize": "1.5rem", "fontWeight": "700", "color": color}),
-            ], style={
-                "padding": "12px",
-                "backgroundColor": "#161b22",
-                "borderRadius": "6px",
-                "border": f"1px solid {color}33",
-            })
-        )
+def update_activity_log(execution_status, run_id):
+    """Update the recent activity log while a query is running."""
+    if not run_id or not execution_status or not execution_status.get("fields"):
+        return no_update
+    if execution_status.get("status") in ["completed", "failed", "cancelled", "error"]:
+        return no_update
     
     # Build activity log from recent events
     try:
-        recent_events = get_latest_events(run_id, since_line=max(0, n_intervals * 5 - 20))[-10:]  # Last 10 events
+        recent_events = get_recent_events(run_id)
         
         if recent_events:
             log_lines = []
@@ -567,32 +615,58 @@ def update_detailed_progress(n_intervals, run_id):
                 # Format event message
                 if event_name == "claims_extracted":
                     msg = f"Extracted {payload.get('claims_count', 0)} claims from {payload.get('source_title', 'source')}"
-                    color = "#58a6ff"
                 elif event_name == "claim_verified":
                     msg = f"Verified claim: {payload.get('verdict', 'N/A')}"
-                    color = "#3fb950"
                 elif event_name == "claim_rejected":
                     msg = f"Rejected claim: {payload.get('reason', 'N/A')}"
-                    color = "#f85149"
                 else:
                     msg = event_name.replace("_", " ").title()
-                    color = "#8b949e"
                     
                 log_lines.append(
                     html.Div([
-                        html.Span(f"[{timestamp}] ", style={"color": "#6e7681"}),
-                        html.Span(msg, style={"color": color}),
-                    ], style={"marginBottom": "4px"})
+                        html.Span(f"[{timestamp}] ", style=_S_MUTED),
+                        html.Span(msg, style=_S_EVENT_TEXT.get(event_name, _S_OTHER_EVENT_TEXT)),
+                    ], style=_S_LOG_LINE)
                 )
             
             activity_display = log_lines
         else:
-            activity_display = [html.Div("No recent activity...", style={"color": "#6e7681"})]
+            activity_display = [html.Div("No recent activity...", style=_S_MUTED)]
     except Exception:
-        activity_display = [html.Div("Loading activity...", style={"color": "#6e7681"})]
+        activity_display = [html.Div("Loading activity...", style=_S_MUTED)]
     
-    return section_style, timeline_items, stat_cards, activity_display
+    return activity_display
+
+
+
+def _serve_production(host, port):
+    """
+    Serve the dashboard with gunicorn, or threaded Werkzeug without it.
+
+    Args:
+        host: Host to bind to
+        port: Port to bind to
+    """
+    if gunicorn_base is None:
+        try:
+            app.run(host=host, port=port, debug=False, threaded=True)
+        finally:
+            _shutdown_executor()
+        return
 
+    class DashboardServer(gunicorn_base.BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{host}:{port}")
+            self.cfg.set("workers", 1)
+            self.cfg.set("worker_class", "gthread")
+            self.cfg.set("threads", SERVER_THREADS)
+            # Queries run in the worker process, so stop them there on exit
+            self.cfg.set("worker_exit", lambda _server, _worker: _shutdown_executor())
+
+        def load(self):
+            return server
+
+    DashboardServer().run()
 
 
 def main():
@@ -613,7 +687,23 @@ def main():
     print(f"  Debug: {args.debug}")
     print(f"{'='*50}\n")
     
-    app.run(host=args.host, port=args.port, debug=args.debug)
+    if not args.debug:
+        _serve_production(args.host, args.port)
+        return
+    
+    # Dev tools (hot reload, props checks, dev bundles) only in debug mode
+    try:
+        app.run(
+            host=args.host,
+            port=args.port,
+            debug=True,
+            dev_tools_ui=True,
+            dev_tools_props_check=True,
+            dev_tools_hot_reload=True,
+            dev_tools_serve_dev_bundles=True,
+        )
+    finally:
+        _shutdown_executor()
 
 
 if __name__ == "__main__":
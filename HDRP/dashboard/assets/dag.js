@@ -0,0 +1,15 @@
+/* Clientside callbacks for the DAG view. */
+
+// Cytoscape layouts that need options beyond their name
+var DAG_LAYOUTS = {
+    dagre: {name: "dagre", rankDir: "TB", spacingFactor: 1.5},
+    breadthfirst: {name: "breadthfirst", roots: '[id = "query"]', spacingFactor: 1.5}
+};
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    dag: {
+        updateLayout: function(name) {
+            return DAG_LAYOUTS[name] || {name: name};
+        }
+    }
+});
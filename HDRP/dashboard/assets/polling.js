@@ -0,0 +1,20 @@
+/* Slow down status polling while the dashboard tab is hidden. */
+
+var HIDDEN_POLL_MS = 30000;
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    polling: {
+        // visibleMs is pages/query.py STATUS_POLL_MS, passed via the status-poll-ms store
+        intervalFor: function(visibility, visibleMs) {
+            return visibility === "hidden" ? HIDDEN_POLL_MS : visibleMs;
+        }
+    }
+});
+
+document.addEventListener("visibilitychange", function() {
+    if (window.dash_clientside && window.dash_clientside.set_props) {
+        window.dash_clientside.set_props("page-visibility", {
+            data: document.hidden ? "hidden" : "visible"
+        });
+    }
+});
@@ -0,0 +1,112 @@
+/* Clientside callbacks for the query page. */
+
+var FINISHED_STATUSES = ["completed", "failed", "cancelled", "error"];
+
+// Pipeline stages with the progress range each one covers
+var STAGES = [
+    {name: "Initializing", start: 0, end: 10},
+    {name: "Research", start: 10, end: 40},
+    {name: "Verification", start: 40, end: 80},
+    {name: "Synthesis", start: 80, end: 100}
+];
+
+var STATS = [
+    {label: "Claims Extracted", field: "claims_extracted", color: "#58a6ff"},
+    {label: "Claims Verified", field: "claims_verified", color: "#3fb950"},
+    {label: "Claims Rejected", field: "claims_rejected", color: "#f85149"},
+    {label: "Sources Processed", field: "sources_processed", color: "#a371f7"}
+];
+
+function htmlElement(type, children, style) {
+    return {
+        type: type,
+        namespace: "dash_html_components",
+        props: {children: children, style: style}
+    };
+}
+
+function stageItem(stage, progress) {
+    var isComplete = progress >= stage.end;
+    var isCurrent = stage.start <= progress && progress < stage.end;
+    var color = isComplete ? "#3fb950" : isCurrent ? "#58a6ff" : "#6e7681";
+    var icon = htmlElement("Span", isComplete ? "✓" : isCurrent ? "●" : "", {
+        display: "inline-block",
+        width: "20px",
+        height: "20px",
+        borderRadius: "50%",
+        marginRight: "12px",
+        border: "2px solid",
+        backgroundColor: isComplete || isCurrent ? color : "transparent",
+        borderColor: color,
+        textAlign: "center",
+        lineHeight: "16px",
+        fontSize: "0.7rem"
+    });
+    var label = htmlElement("Span", stage.name, {
+        color: isComplete || isCurrent ? "#e6edf3" : "#6e7681",
+        fontWeight: isCurrent ? "500" : "normal"
+    });
+    return htmlElement("Div", [icon, label], {marginBottom: "8px", display: "flex", alignItems: "center"});
+}
+
+function statCard(stat, value) {
+    return htmlElement("Div", [
+        htmlElement("Div", stat.label, {fontSize: "0.75rem", color: "#8b949e", marginBottom: "4px"}),
+        htmlElement("Div", String(value), {fontSize: "1.5rem", fontWeight: "700", color: stat.color})
+    ], {
+        padding: "12px",
+        backgroundColor: "#161b22",
+        borderRadius: "6px",
+        border: "1px solid " + stat.color + "33"
+    });
+}
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    query: {
+        // Fan the submitted execution state out to the status widgets
+        fanout: function(state) {
+            if (!state || !state.run_id) {
+                return window.dash_clientside.no_update;
+            }
+            return [
+                {status: "running"},
+                state.run_id,
+                {marginTop: "24px", display: state.showStatus ? "block" : "none"},
+                !state.running,
+                !state.running
+            ];
+        },
+
+        // Reset the query form to its defaults
+        clearForm: function(nClicks) {
+            if (!nClicks) {
+                return window.dash_clientside.no_update;
+            }
+            return ["", 10, false];
+        },
+
+        // Render the stage timeline and live stats from the polled status fields
+        renderProgress: function(executionStatus, runId) {
+            var noUpdate = window.dash_clientside.no_update;
+            if (!runId || !executionStatus) {
+                return [noUpdate, noUpdate, noUpdate];
+            }
+            if (FINISHED_STATUSES.indexOf(executionStatus.status) >= 0) {
+                // Hide detailed section on completion
+                return [{display: "none"}, noUpdate, noUpdate];
+            }
+            var fields = executionStatus.fields;
+            if (!fields) {
+                return [noUpdate, noUpdate, noUpdate];
+            }
+            return [
+                {borderTop: "1px solid #30363d", display: "block"},
+                STAGES.map(function(stage) {
+                    return stageItem(stage, fields.progress_percent || 0);
+                }),
+                STATS.map(function(stat) {
+                    return statCard(stat, fields[stat.field] || 0);
+                })
+            ];
+        }
+    }
+});
@@ -5,13 +5,22 @@ Provides functions to parse JSONL log files and extract run data
 for dashboard visualization.
 """
 
+import functools
+import itertools
 import json
 import os
+import threading
+from collections import OrderedDict, deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass, field
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Path to logs directory  
 LOGS_DIR = Path(__file__).parent.parent / "logs"
@@ -19,6 +28,28 @@ LOGS_DIR = Path(__file__).parent.parent / "logs"
 # Path to artifacts directory (where reports are saved)
 ARTIFACTS_DIR = Path(__file__).parent.parent / "artifacts"
 
+# Parsed runs kept in memory; entries are keyed by the log file's mtime and
+# size, so a run that is still being written is re-parsed when it changes
+RUN_CACHE_SIZE = 128
+
+# Events kept per run for the live activity log
+RECENT_EVENTS_LIMIT = 10
+
+# Runs whose log tail is tracked; least recently read runs are dropped first
+MAX_TRACKED_TAILS = 64
+
+# run_id -> (byte offset read so far, most recent events), shared by all
+# dashboard clients so each new log line is read and parsed once
+_event_tails: "OrderedDict[str, tuple]" = OrderedDict()
+_event_tails_lock = threading.Lock()
+
+
+def _parse_event(line) -> Any:
+    """Parse one JSONL log line, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
 
 
 @dataclass
@@ -83,7 +114,7 @@ def list_available_runs() -> List[Dict[str, Any]]:
             with open(log_file, 'r', encoding='utf-8') as f:
                 first_line = f.readline()
                 if first_line:
-                    event = json.loads(first_line)
+                    event = _parse_event(first_line)
                     timestamp = event.get('timestamp', '')
                     # Try to extract query from payload
                     payload = event.get('payload', {})
@@ -112,13 +143,22 @@ def load_run(run_id: str) -> Optional[RunData]:
         run_id: The run ID (filename stem) to load.
         
     Returns:
-        RunData object with parsed events, claims, and metrics.
+        RunData object with parsed events, claims, and metrics. The object
+        is shared between callers and must not be modified.
     """
     log_file = LOGS_DIR / f"{run_id}.jsonl"
     
-    if not log_file.exists():
+    try:
+        stat = log_file.stat()
+    except OSError:
         return None
     
+    return _parse_run_log(run_id, log_file, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=RUN_CACHE_SIZE)
+def _parse_run_log(run_id: str, log_file: Path, mtime_ns: int, size: int) -> Optional[RunData]:
+    """Parse a run's log file (memoized on its path, mtime and size)."""
     run_data = RunData(run_id=run_id)
     claims_map: Dict[str, ClaimData] = {}
     sources = set()
@@ -131,7 +171,7 @@ def load_run(run_id: str) -> Optional[RunData]:
                     continue
                     
                 try:
-                    event = json.loads(line)
+                    event = _parse_event(line)
                 except json.JSONDecodeError:
                     continue
                 
@@ -327,16 +367,14 @@ def get_latest_events(run_id: str, since_line: int = 0) -> List[Dict[str, Any]]:
     events = []
     try:
         with open(log_file, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f):
-                if line_num < since_line:
-                    continue
-                
+            # Skip already-seen lines without per-line Python work
+            for line in itertools.islice(f, max(since_line, 0), None):
                 line = line.strip()
                 if not line:
                     continue
                 
                 try:
-                    event = json.loads(line)
+                    event = _parse_event(line)
                     events.append(event)
                 except json.JSONDecodeError:
                     continue
@@ -347,6 +385,54 @@ def get_latest_events(run_id: str, since_line: int = 0) -> List[Dict[str, Any]]:
     return events
 
 
+def get_recent_events(run_id: str, limit: int = RECENT_EVENTS_LIMIT) -> List[Dict[str, Any]]:
+    """
+    Get the most recent events of a run, reading only log lines not seen before.
+    
+    Each call resumes from the byte offset reached by the previous call for
+    the same run, so polling a live run costs only the newly appended lines.
+    
+    Args:
+        run_id: The run ID to get events for
+        limit: Maximum number of events to return (at most RECENT_EVENTS_LIMIT)
+        
+    Returns:
+        Up to ``limit`` most recent events, oldest first
+    """
+    log_file = LOGS_DIR / f"{run_id}.jsonl"
+    
+    with _event_tails_lock:
+        offset, recent = _event_tails.pop(run_id, (0, deque(maxlen=RECENT_EVENTS_LIMIT)))
+        try:
+            if log_file.stat().st_size < offset:
+                # Log was truncated or replaced; start over
+                offset, recent = 0, deque(maxlen=RECENT_EVENTS_LIMIT)
+            with open(log_file, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+        except OSError:
+            data = b""
+        
+        # Leave a partially written last line for the next call
+        complete = data.rfind(b"\n") + 1
+        for line in data[:complete].splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                recent.append(_parse_event(line))
+            except json.JSONDecodeError:
+                continue
+        
+        _event_tails[run_id] = (offset + complete, recent)
+        while len(_event_tails) > MAX_TRACKED_TAILS:
+            _event_tails.popitem(last=False)
+        
+        events = list(recent)
+    
+    return events[-limit:] if limit > 0 else []
+
+
 def get_run_progress(run_id: str) -> Optional[Dict[str, Any]]:
     """
     Get progress information for a running query.
@@ -380,7 +466,7 @@ def get_run_progress(run_id: str) -> Optional[Dict[str, Any]]:
                     continue
                 
                 try:
-                    event = json.loads(line)
+                    event = _parse_event(line)
                     progress["total_events"] += 1
                     
                     event_type = event.get('event', '')
@@ -50,13 +50,13 @@ def create_sidebar():
                 className="nav-section",
                 children=[
                     html.Div("Overview", className="nav-section-title"),
-                    html.Button(
-                        id="nav-dashboard",
+                    dcc.Link(
+                        id={"type": "nav-link", "page": "dashboard"},
+                        href="/",
                         className="nav-link active",
                         children=[
                             html.Span("Dashboard"),
                         ],
-                        n_clicks=0,
                     ),
                 ]
             ),
@@ -65,37 +65,37 @@ def create_sidebar():
                 className="nav-section",
                 children=[
                     html.Div("Research", className="nav-section-title"),
-                    html.Button(
-                        id="nav-reports",
+                    dcc.Link(
+                        id={"type": "nav-link", "page": "reports"},
+                        href="/reports",
                         className="nav-link",
                         children=[
                             html.Span("Reports"),
                         ],
-                        n_clicks=0,
                     ),
-                    html.Button(
-                        id="nav-runs",
+                    dcc.Link(
+                        id={"type": "nav-link", "page": "runs"},
+                        href="/runs",
                         className="nav-link",
                         children=[
                             html.Span("Run History"),
                         ],
-                        n_clicks=0,
                     ),
-                    html.Button(
-                        id="nav-claims",
+                    dcc.Link(
+                        id={"type": "nav-link", "page": "claims"},
+                        href="/claims",
                         className="nav-link",
                         children=[
                             html.Span("Claims"),
                         ],
-                        n_clicks=0,
                     ),
-                    html.Button(
-                        id="nav-dag",
+                    dcc.Link(
+                        id={"type": "nav-link", "page": "dag"},
+                        href="/dag",
                         className="nav-link",
                         children=[
                             html.Span("DAG View"),
                         ],
-                        n_clicks=0,
                     ),
                 ]
             ),
@@ -104,13 +104,13 @@ def create_sidebar():
                 className="nav-section",
                 children=[
                     html.Div("Analytics", className="nav-section-title"),
-                    html.Button(
-                        id="nav-metrics",
+                    dcc.Link(
+                        id={"type": "nav-link", "page": "metrics"},
+                        href="/metrics",
                         className="nav-link",
                         children=[
                             html.Span("Metrics"),
                         ],
-                        n_clicks=0,
                     ),
                 ]
             ),
@@ -119,13 +119,13 @@ def create_sidebar():
                 className="nav-section",
                 children=[
                     html.Div("Actions", className="nav-section-title"),
-                    html.Button(
-                        id="nav-query",
+                    dcc.Link(
+                        id={"type": "nav-link", "page": "query"},
+                        href="/query",
                         className="nav-link",
                         children=[
                             html.Span("New Query"),
                         ],
-                        n_clicks=0,
                     ),
                 ]
             ),
@@ -149,6 +149,9 @@ def create_main_content():
             
             # URL location for routing
             dcc.Location(id="url", refresh=False),
+            
+            # Tab visibility, set from assets/polling.js
+            dcc.Store(id="page-visibility", data="visible"),
         ]
     )
 
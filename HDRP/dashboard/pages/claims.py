@@ -88,7 +88,7 @@ def create_claims_page(run_id: str = None):
                             children=[
                                 html.Label("Select Run", className="form-label"),
                                 dcc.Dropdown(
-                                    id="claims-run-selector",
+                                    id={"type": "run-selector", "page": "claims"},
                                     options=run_options,
                                     value=current_run_id,
                                     placeholder="Select a run...",
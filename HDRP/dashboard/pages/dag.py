@@ -69,7 +69,7 @@ def create_dag_page(run_id: str = None):
                             children=[
                                 html.Label("Select Run", className="form-label"),
                                 dcc.Dropdown(
-                                    id="dag-run-selector",
+                                    id={"type": "run-selector", "page": "dag"},
                                     options=run_options,
                                     value=current_run_id,
                                     placeholder="Select a run...",
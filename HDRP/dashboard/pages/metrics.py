@@ -73,7 +73,7 @@ def create_metrics_page(run_id: str = None):
                             children=[
                                 html.Label("Select Run", className="form-label"),
                                 dcc.Dropdown(
-                                    id="metrics-run-selector",
+                                    id={"type": "run-selector", "page": "metrics"},
                                     options=run_options,
                                     value=current_run_id,
                                     placeholder="Select a run...",
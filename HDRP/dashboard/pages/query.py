@@ -7,6 +7,9 @@ Form to submit new research queries.
 from dash import html, dcc
 from HDRP.dashboard.layout import create_info_tooltip
 
+# Status poll cadence while the tab is visible (also read by assets/polling.js)
+STATUS_POLL_MS = 2000
+
 
 def create_query_page():
     """Create the new query submission page."""
@@ -149,7 +152,8 @@ def create_query_page():
                             "Cancel",
                             id="cancel-query-btn",
                             className="btn btn-secondary",
-                            style={"fontSize": "0.875rem", "padding": "4px 12px", "display": "none"},
+                            style={"fontSize": "0.875rem", "padding": "4px 12px"},
+                            hidden=True,
                         ),
                     ],
                     style={"display": "flex", "justifyContent": "space-between", "alignItems": "center"},
@@ -230,14 +234,16 @@ def create_query_page():
         # Hidden state stores for execution tracking
         dcc.Store(id="execution-status", data=None),
         dcc.Store(id="current-run-id", data=None),
+        dcc.Store(id="query-exec-state", data=None),
         
         # Polling interval for status updates (disabled by default)
         dcc.Interval(
             id="status-poll-interval",
-            interval=2000,  # 2 seconds
+            interval=STATUS_POLL_MS,
             disabled=True,
             n_intervals=0,
         ),
+        dcc.Store(id="status-poll-ms", data=STATUS_POLL_MS),
 
         
         # Info card
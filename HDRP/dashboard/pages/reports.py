@@ -130,7 +130,7 @@ def create_reports_page(selected_run_id: str = None):
                                 children=[
                                     html.Label("Select Report:", className="form-label"),
                                     dcc.Dropdown(
-                                        id="report-selector",
+                                        id={"type": "run-selector", "page": "reports"},
                                         options=report_options,
                                         value=selected_run_id if selected_run_id else (reports[0]['run_id'] if reports else None),
                                         placeholder="Select a report...",
@@ -2,7 +2,8 @@
 Unit tests for HDRP dashboard data_loader module.
 
 Tests list_available_runs, load_run, _parse_claim, get_run_summary_stats,
-get_demo_data, get_latest_events, and get_run_progress functions.
+get_demo_data, get_latest_events, get_recent_events, and get_run_progress
+functions.
 """
 
 import json
@@ -13,6 +14,7 @@ from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from HDRP.dashboard import data_loader
 from HDRP.dashboard.data_loader import (
     LOGS_DIR,
     ClaimData,
@@ -23,6 +25,7 @@ from HDRP.dashboard.data_loader import (
     get_run_summary_stats,
     get_demo_data,
     get_latest_events,
+    get_recent_events,
     get_run_progress,
 )
 
@@ -266,6 +269,25 @@ class TestLoadRun(unittest.TestCase):
             self.assertIsInstance(result, RunData)
             self.assertEqual(result.run_id, "test-run")
 
+    def test_reuses_parse_until_log_changes(self):
+        """Verify repeated loads share one parse until the log file changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logs_dir = Path(tmpdir)
+            
+            log_file = logs_dir / "test-run.jsonl"
+            log_file.write_text(json.dumps({"event": "research_start", "payload": {"query": "q"}}) + "\n")
+            
+            with patch('HDRP.dashboard.data_loader.LOGS_DIR', logs_dir):
+                first = load_run("test-run")
+                second = load_run("test-run")
+                with open(log_file, "a") as f:
+                    f.write(json.dumps({"event": "run_complete", "payload": {}}) + "\n")
+                third = load_run("test-run")
+            
+            self.assertIs(first, second)
+            self.assertIsNot(first, third)
+            self.assertEqual(len(third.events), 2)
+
     def test_extracts_query(self):
         """Verify query is extracted from events."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -567,6 +589,53 @@ class TestGetLatestEvents(unittest.TestCase):
             self.assertEqual(len(events), 2)
 
 
+class TestGetRecentEvents(unittest.TestCase):
+    """Tests for get_recent_events function."""
+
+    def setUp(self):
+        data_loader._event_tails.clear()
+
+    def test_returns_empty_for_nonexistent_run(self):
+        """Verify empty list for nonexistent run."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch('HDRP.dashboard.data_loader.LOGS_DIR', Path(tmpdir)):
+                events = get_recent_events("nonexistent")
+        
+        self.assertEqual(events, [])
+
+    def test_returns_most_recent_events(self):
+        """Verify only the last `limit` events are returned, oldest first."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logs_dir = Path(tmpdir)
+            
+            log_file = logs_dir / "test-run.jsonl"
+            log_file.write_text("".join(json.dumps({"event": f"e{i}"}) + "\n" for i in range(15)))
+            
+            with patch('HDRP.dashboard.data_loader.LOGS_DIR', logs_dir):
+                events = get_recent_events("test-run", limit=3)
+            
+            self.assertEqual([e["event"] for e in events], ["e12", "e13", "e14"])
+
+    def test_reads_only_appended_lines(self):
+        """Verify later calls pick up appended lines and defer partial ones."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logs_dir = Path(tmpdir)
+            
+            log_file = logs_dir / "test-run.jsonl"
+            log_file.write_text('{"event": "e1"}\n{"event": "e2"')
+            
+            with patch('HDRP.dashboard.data_loader.LOGS_DIR', logs_dir):
+                first = get_recent_events("test-run")
+                with open(log_file, "a") as f:
+                    f.write('}\n{"event": "e3"}\n')
+                second = get_recent_events("test-run")
+            offset = data_loader._event_tails["test-run"][0]
+            
+            self.assertEqual([e["event"] for e in first], ["e1"])
+            self.assertEqual([e["event"] for e in second], ["e1", "e2", "e3"])
+            self.assertEqual(offset, log_file.stat().st_size)
+
+
 class TestGetRunProgress(unittest.TestCase):
     """Tests for get_run_progress function."""
 
@@ -6,7 +6,7 @@ from __future__ import annotations
 import logging
 import os
 import time
-from typing import Dict
+from typing import Dict, List
 
 from fastapi import FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel, Field
@@ -52,6 +52,21 @@ class RelationResponse(BaseModel):
     variant: str
 
 
+class RelationBatchRequest(BaseModel):
+    pairs: List[RelationRequest] = Field(..., min_length=1)
+
+
+class RelationScores(BaseModel):
+    entailment: float
+    contradiction: float
+    neutral: float
+
+
+class RelationBatchResponse(BaseModel):
+    relations: List[RelationScores]
+    variant: str
+
+
 def _parse_variants() -> Dict[str, str]:
     raw_variants = os.getenv("HDRP_NLI_VARIANTS", "").strip()
     default_model_name = os.getenv(
@@ -139,6 +154,39 @@ def relation(payload: RelationRequest, request: Request) -> RelationResponse:
         REQUEST_COUNT.labels(endpoint="relation", status=status, variant=variant).inc()
 
 
+@app.post("/relation/batch", response_model=RelationBatchResponse)
+def relation_batch(payload: RelationBatchRequest, request: Request) -> RelationBatchResponse:
+    variant = request.headers.get("X-Model-Variant") or DEFAULT_VARIANT
+    if variant not in VERIFIERS:
+        raise HTTPException(status_code=400, detail=f"Unknown model variant '{variant}'")
+
+    start_time = time.time()
+    status = "success"
+    try:
+        relation_scores = VERIFIERS[variant].compute_relation_batch(
+            [(pair.premise, pair.hypothesis) for pair in payload.pairs]
+        )
+        return RelationBatchResponse(
+            relations=[
+                RelationScores(
+                    entailment=scores["entailment"],
+                    contradiction=scores["contradiction"],
+                    neutral=scores["neutral"],
+                )
+                for scores in relation_scores
+            ],
+            variant=variant,
+        )
+    except Exception as exc:
+        status = "error"
+        logger.exception("Batched NLI inference failed for variant '%s'", variant)
+        raise HTTPException(status_code=500, detail="NLI inference failed") from exc
+    finally:
+        duration = time.time() - start_time
+        REQUEST_LATENCY.labels(endpoint="relation_batch", variant=variant).observe(duration)
+        REQUEST_COUNT.labels(endpoint="relation_batch", status=status, variant=variant).inc()
+
+
 if __name__ == "__main__":
     import uvicorn
 
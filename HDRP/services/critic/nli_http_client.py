@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 import requests
 
@@ -40,3 +40,34 @@ class NLIHttpClient:
             "contradiction": float(data["contradiction"]),
             "neutral": float(data["neutral"]),
         }
+
+    def compute_relation_batch(
+        self,
+        pairs: List[Tuple[str, str]],
+        variant: Optional[str] = None,
+    ) -> List[Dict[str, float]]:
+        headers = {}
+        if variant:
+            headers["X-Model-Variant"] = variant
+
+        response = requests.post(
+            f"{self.base_url}/relation/batch",
+            json={
+                "pairs": [
+                    {"premise": premise, "hypothesis": hypothesis}
+                    for premise, hypothesis in pairs
+                ]
+            },
+            headers=headers,
+            timeout=self.timeout_seconds,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return [
+            {
+                "entailment": float(item["entailment"]),
+                "contradiction": float(item["contradiction"]),
+                "neutral": float(item["neutral"]),
+            }
+            for item in data["relations"]
+        ]
@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Tuple
+from typing import Iterable, List, Optional, Dict, Tuple
 from concurrent.futures import ThreadPoolExecutor
 from HDRP.services.shared.claims import AtomicClaim, CritiqueResult
 from HDRP.services.shared.logger import ResearchLogger
@@ -9,6 +9,14 @@ from HDRP.services.critic.nli_verifier import NLIVerifier
 from HDRP.services.critic.nli_http_client import NLIHttpClient
 from datetime import datetime
 
+# Words ignored when comparing claim, support and task tokens
+STOP_WORDS = {
+    "the", "is", "at", "of", "on", "and", "a", "to", "in", "for", 
+    "with", "by", "from", "up", "about", "into", "over", "after",
+    "research", "find", "identify", "list", "describe", "explain"
+}
+
+
 class CriticService:
     """Service responsible for verifying claims found by the Researcher.
     
@@ -26,6 +34,7 @@ class CriticService:
         nli_contradiction_threshold: Optional[float] = None,
         nli_client: Optional[NLIHttpClient] = None,
         nli_variant: Optional[str] = None,
+        nli_batch_size: Optional[int] = None,
     ):
         """Initialize CriticService.
         
@@ -35,6 +44,7 @@ class CriticService:
             nli_threshold: NLI entailment score threshold for accepting claims
                           Default 0.60 determined via grid search optimization (see artifacts/threshold_optimization.json)
                           Previous hardcoded value of 0.65 was too strict, causing false negatives
+            nli_batch_size: Max claim/support pairs scored per NLI call (defaults to HDRP_NLI_BATCH_SIZE)
         """
         self.logger = ResearchLogger("critic", run_id=run_id)
         self.enable_profiling = enable_profiling_env()
@@ -56,6 +66,12 @@ class CriticService:
             if nli_contradiction_threshold is not None
             else getattr(nli_settings, "contradiction_threshold", 0.20)
         )
+        self.nli_batch_size = max(
+            1,
+            nli_batch_size
+            if nli_batch_size is not None
+            else getattr(nli_settings, "batch_size", 8)
+        )
         self._nli_verifier: Optional[NLIVerifier] = None
         self.nli_variant = nli_variant
         if self.use_nli:
@@ -70,16 +86,36 @@ class CriticService:
            in the high-confidence claims from pass 1. This solves the "partial relevance"
            problem for complex queries (e.g. "RSA" details are relevant to "Cryptography"
            if "RSA" was established as a subtopic).
+        
+        The passes are also exposed as ``screen`` and ``finalize`` so callers can
+        screen claims incrementally (e.g. while research is still running) and
+        settle the verdicts once every claim is in.
         """
-        results = []
+        return self.finalize(self.screen(claims, task), task)
+    
+    def verify_stream(self, claim_batches: Iterable[List[AtomicClaim]], task: str) -> List[CritiqueResult]:
+        """Verify claims that arrive in batches, e.g. from ``ResearcherService.research_stream``.
         
+        Each batch is screened as soon as it is produced, so when the batches
+        come from a generator the first pass runs interleaved with research;
+        the bridging pass runs once the stream is exhausted. Results follow
+        batch arrival order and match ``verify`` on the concatenated claims.
+        """
+        candidates = []
+        for batch in claim_batches:
+            candidates.extend(self.screen(batch, task))
+        return self.finalize(candidates, task)
+    
+    def screen(self, claims: List[AtomicClaim], task: str) -> List[Dict]:
+        """Run the per-claim first pass of ``verify``.
+        
+        Each claim is checked independently, so batches of claims may be
+        screened separately and their candidates concatenated.
+        
+        Returns:
+            Candidate dicts: {'claim', 'reason' (str or None), 'score', 'entities'}
+        """
         try:
-            STOP_WORDS = {
-                "the", "is", "at", "of", "on", "and", "a", "to", "in", "for", 
-                "with", "by", "from", "up", "about", "into", "over", "after",
-                "research", "find", "identify", "list", "describe", "explain"
-            }
-
             task_tokens = set(word.lower() for word in task.split() if word.lower() not in STOP_WORDS)
             
             # Intermediate storage for two-pass logic
@@ -87,75 +123,32 @@ class CriticService:
             candidates = []
 
             # PASS 1: Structural & Direct Semantic Checks
+            prechecked = []
             for claim in claims:
                 try:
-                    rejection_reason = None
-                    
-                    # Traceability: timestamp, source_url, support_text
-                    if not claim.extracted_at:
-                        rejection_reason = "REJECTED: Missing extraction timestamp"
-                        self.logger.log("traceability_missing", {"claim_id": claim.claim_id})
-                    elif not self._is_valid_timestamp(claim.extracted_at):
-                        rejection_reason = "REJECTED: Invalid timestamp format"
-                        self.logger.log("traceability_invalid", {"claim_id": claim.claim_id})
-                    
-                    if not rejection_reason and not claim.source_url:
-                        rejection_reason = "REJECTED: Missing source URL"
-                    elif not rejection_reason and not claim.support_text:
-                        rejection_reason = "REJECTED: Missing support text"
+                    prechecked.append((claim, self._structural_rejection(claim), None))
+                except Exception as e:
+                    prechecked.append((claim, None, e))
+
+            # NLI grounding for claims that survived the structural checks, batched
+            relations = {}
+            if self.use_nli and self._nli_verifier:
+                pending = [
+                    index for index, (_, reason, error) in enumerate(prechecked)
+                    if not reason and error is None
+                ]
+                relations = dict(zip(
+                    pending,
+                    self._compute_relations([prechecked[index][0] for index in pending]),
+                ))
+
+            for index, (claim, rejection_reason, error) in enumerate(prechecked):
+                try:
+                    if error is not None:
+                        raise error
 
                     lower_statement = claim.statement.lower()
                     lower_support = claim.support_text.lower()
-                    
-                    # Context-aware qualifiers: only reject if explicit contradiction exists
-                    if not rejection_reason:
-                        # Only penalize if source explicitly contradicts the qualifier
-                        definite_contradictions = {
-                            "contradicts": 0.9, "refutes": 0.9, "disproves": 0.9,
-                            "false": 0.95, "incorrect": 0.85, "wrong": 0.85,
-                        }
-                        
-                        contradiction_severity = 0.0
-                        for indicator, severity in definite_contradictions.items():
-                            if indicator in lower_support:
-                                contradiction_severity = max(contradiction_severity, severity)
-                                break
-                        
-                        if contradiction_severity > 0.8:
-                            rejection_reason = "REJECTED: Source contradicts statement"
-                    
-                    # Adaptive word count: accept 4+ words, or fewer with strong semantics
-                    if not rejection_reason:
-                        word_count = len(claim.statement.split())
-                        # Check for semantic richness even in short claims
-                        has_semantically_rich_connector = any(w in lower_statement for w in 
-                            ["because", "therefore", "causes", "results", "enables", "defines", "is"])
-                        has_entity = any(len(w) > 3 for w in claim.statement.split())
-                        
-                        # Accept if: 4+ words OR (< 4 words BUT has rich semantics AND has entities)
-                        if word_count < 4 and not (has_semantically_rich_connector and has_entity):
-                            rejection_reason = "REJECTED: Statement lacks sufficient information"
-                    
-                    # Logical leap detection: only flag unjustified causal claims
-                    # Decomposed queries (e.g., "How does X relate to Y?") can have implicit causality
-                    if not rejection_reason:
-                        explicit_causal_claims = [
-                            "causes", "directly causes", "is the cause", "resulted in", "led to",
-                            "produced", "generated", "created"
-                        ]
-                        has_strong_causal = any(w in lower_statement for w in explicit_causal_claims)
-                        
-                        if has_strong_causal:
-                            # Only reject if source has NO causal language at all
-                            support_causal = [
-                                "because", "due to", "caused by", "results in", "leads to",
-                                "cause", "result", "effect", "therefore", "thus", "consequently",
-                                "origin", "source", "root", "foundation"
-                            ]
-                            support_has = any(w in lower_support for w in support_causal)
-                            
-                            if not support_has:
-                                rejection_reason = "REJECTED: Causal claim lacks supporting evidence"
 
                     # Grounding check: NLI-based or heuristic overlap
                     filtered_tokens = []
@@ -163,17 +156,9 @@ class CriticService:
                     if not rejection_reason:
                         if self.use_nli and self._nli_verifier:
                             # NLI-based verification
-                            if isinstance(self._nli_verifier, NLIHttpClient):
-                                relation = self._nli_verifier.compute_relation(
-                                    premise=claim.support_text,
-                                    hypothesis=claim.statement,
-                                    variant=self.nli_variant,
-                                )
-                            else:
-                                relation = self._nli_verifier.compute_relation(
-                                    premise=claim.support_text,
-                                    hypothesis=claim.statement
-                                )
+                            relation = relations[index]
+                            if isinstance(relation, Exception):
+                                raise relation
                             nli_score = relation["entailment"]
                             contradiction_score = relation["contradiction"]
 
@@ -281,6 +266,147 @@ class CriticService:
                         "entities": []
                     })
 
+            return candidates
+        
+        except Exception as e:
+            self._report_verification_failure(task, claims, e)
+            return [
+                {
+                    "claim": claim,
+                    "reason": "REJECTED: Verification service error",
+                    "score": 0.0,
+                    "entities": [],
+                }
+                for claim in claims
+            ]
+    def _structural_rejection(self, claim: AtomicClaim) -> Optional[str]:
+        """Run the checks that need no model call; return a rejection reason or None."""
+        rejection_reason = None
+        
+        # Traceability: timestamp, source_url, support_text
+        if not claim.extracted_at:
+            rejection_reason = "REJECTED: Missing extraction timestamp"
+            self.logger.log("traceability_missing", {"claim_id": claim.claim_id})
+        elif not self._is_valid_timestamp(claim.extracted_at):
+            rejection_reason = "REJECTED: Invalid timestamp format"
+            self.logger.log("traceability_invalid", {"claim_id": claim.claim_id})
+        
+        if not rejection_reason and not claim.source_url:
+            rejection_reason = "REJECTED: Missing source URL"
+        elif not rejection_reason and not claim.support_text:
+            rejection_reason = "REJECTED: Missing support text"
+
+        lower_statement = claim.statement.lower()
+        lower_support = claim.support_text.lower()
+        
+        # Context-aware qualifiers: only reject if explicit contradiction exists
+        if not rejection_reason:
+            # Only penalize if source explicitly contradicts the qualifier
+            definite_contradictions = {
+                "contradicts": 0.9, "refutes": 0.9, "disproves": 0.9,
+                "false": 0.95, "incorrect": 0.85, "wrong": 0.85,
+            }
+            
+            contradiction_severity = 0.0
+            for indicator, severity in definite_contradictions.items():
+                if indicator in lower_support:
+                    contradiction_severity = max(contradiction_severity, severity)
+                    break
+            
+            if contradiction_severity > 0.8:
+                rejection_reason = "REJECTED: Source contradicts statement"
+        
+        # Adaptive word count: accept 4+ words, or fewer with strong semantics
+        if not rejection_reason:
+            word_count = len(claim.statement.split())
+            # Check for semantic richness even in short claims
+            has_semantically_rich_connector = any(w in lower_statement for w in 
+                ["because", "therefore", "causes", "results", "enables", "defines", "is"])
+            has_entity = any(len(w) > 3 for w in claim.statement.split())
+            
+            # Accept if: 4+ words OR (< 4 words BUT has rich semantics AND has entities)
+            if word_count < 4 and not (has_semantically_rich_connector and has_entity):
+                rejection_reason = "REJECTED: Statement lacks sufficient information"
+        
+        # Logical leap detection: only flag unjustified causal claims
+        # Decomposed queries (e.g., "How does X relate to Y?") can have implicit causality
+        if not rejection_reason:
+            explicit_causal_claims = [
+                "causes", "directly causes", "is the cause", "resulted in", "led to",
+                "produced", "generated", "created"
+            ]
+            has_strong_causal = any(w in lower_statement for w in explicit_causal_claims)
+            
+            if has_strong_causal:
+                # Only reject if source has NO causal language at all
+                support_causal = [
+                    "because", "due to", "caused by", "results in", "leads to",
+                    "cause", "result", "effect", "therefore", "thus", "consequently",
+                    "origin", "source", "root", "foundation"
+                ]
+                support_has = any(w in lower_support for w in support_causal)
+                
+                if not support_has:
+                    rejection_reason = "REJECTED: Causal claim lacks supporting evidence"
+
+        return rejection_reason
+    
+    def _compute_relations(self, claims: List[AtomicClaim]) -> List:
+        """Compute NLI relations for claims, ``nli_batch_size`` pairs per call.
+        
+        Returns one relation dict per claim, or the exception raised while
+        scoring it. If a batched call fails, its pairs are retried one by one
+        so a single bad pair only affects its own claim.
+        """
+        relations = []
+        for start in range(0, len(claims), self.nli_batch_size):
+            batch = claims[start:start + self.nli_batch_size]
+            if len(batch) > 1:
+                pairs = [(claim.support_text, claim.statement) for claim in batch]
+                try:
+                    batch_relations = self._relation_batch(pairs)
+                    if len(batch_relations) != len(pairs):
+                        raise ValueError(
+                            f"Expected {len(pairs)} NLI relations, got {len(batch_relations)}"
+                        )
+                    relations.extend(batch_relations)
+                    continue
+                except Exception as e:
+                    self.logger.log("nli_batch_failed", {
+                        "batch_size": len(pairs),
+                        "error": str(e),
+                        "type": type(e).__name__
+                    })
+            
+            for claim in batch:
+                try:
+                    relations.append(self._relation(claim))
+                except Exception as e:
+                    relations.append(e)
+        return relations
+    
+    def _relation(self, claim: AtomicClaim) -> Dict[str, float]:
+        """Compute the NLI relation between a claim and its support text."""
+        if isinstance(self._nli_verifier, NLIHttpClient):
+            return self._nli_verifier.compute_relation(
+                premise=claim.support_text,
+                hypothesis=claim.statement,
+                variant=self.nli_variant,
+            )
+        return self._nli_verifier.compute_relation(
+            premise=claim.support_text,
+            hypothesis=claim.statement
+        )
+    
+    def _relation_batch(self, pairs: List[Tuple[str, str]]) -> List[Dict[str, float]]:
+        """Compute NLI relations for (premise, hypothesis) pairs in one call."""
+        if isinstance(self._nli_verifier, NLIHttpClient):
+            return self._nli_verifier.compute_relation_batch(pairs, variant=self.nli_variant)
+        return self._nli_verifier.compute_relation_batch(pairs)
+    
+    def finalize(self, candidates: List[Dict], task: str) -> List[CritiqueResult]:
+        """Run the bridging second pass of ``verify`` over all screened candidates."""
+        try:
             # PASS 2: Bridging & Final Verdict
             
             # 2a. Identify Valid Subtopics (Bridging Entities)
@@ -325,7 +451,7 @@ class CriticService:
                         "reason": reason,
                         "statement": claim.statement if len(claim.statement) <= 50 else claim.statement[:50] + "...",
                         "source_url": claim.source_url,
-                        "source_title": getattr(claim, 'source_title', None)
+                        "source_title": claim.source_title
                     }
                     # Add NLI scores if available
                     if self.use_nli and "NLI" in reason:
@@ -372,25 +498,10 @@ class CriticService:
             return results
         
         except Exception as e:
-            # Catastrophic error in verification - wrap and report
-            error = CriticError(
-                message=f"Verification failed: {str(e)}",
-                run_id=self.logger.run_id,
-                metadata={
-                    "task": task,
-                    "claims_count": len(claims),
-                    "original_error": type(e).__name__
-                }
-            )
-            report_error(error, run_id=self.logger.run_id, service="critic")
+            claims = [c["claim"] for c in candidates]
+            self._report_verification_failure(task, claims, e)
             
             # Return all claims as rejected rather than crashing
-            self.logger.log("verification_failed", {
-                "task": task,
-                "claims_count": len(claims),
-                "error": str(e)
-            })
-            
             return [
                 CritiqueResult(
                     claim=claim,
@@ -401,6 +512,25 @@ class CriticService:
                 for claim in claims
             ]
     
+    def _report_verification_failure(self, task: str, claims: List[AtomicClaim], e: Exception) -> None:
+        """Wrap and report a catastrophic verification error."""
+        error = CriticError(
+            message=f"Verification failed: {str(e)}",
+            run_id=self.logger.run_id,
+            metadata={
+                "task": task,
+                "claims_count": len(claims),
+                "original_error": type(e).__name__
+            }
+        )
+        report_error(error, run_id=self.logger.run_id, service="critic")
+        
+        self.logger.log("verification_failed", {
+            "task": task,
+            "claims_count": len(claims),
+            "error": str(e)
+        })
+    
     def _is_valid_timestamp(self, timestamp_str: str) -> bool:
         """Validate ISO 8601 timestamp (with/without 'Z')."""
         try:
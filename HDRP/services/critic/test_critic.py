@@ -1,5 +1,6 @@
 import unittest
 from datetime import datetime, timezone
+from unittest import mock
 from unittest.mock import patch
 
 from HDRP.services.critic.service import CriticService
@@ -167,6 +168,53 @@ class TestCriticService(unittest.TestCase):
         )
         self.assertTrue(results[0].is_valid)
 
+    def test_verify_batches_nli_calls(self):
+        claims = [
+            AtomicClaim(
+                statement=f"Quantum computing uses qubits for calculation {i}.",
+                support_text=f"Quantum computing uses qubits for calculation {i}.",
+                source_url="https://example.com/q",
+                confidence=1.0,
+                extracted_at=self.test_timestamp,
+            )
+            for i in range(5)
+        ]
+        nli_client = mock.MagicMock()
+        nli_client.compute_relation_batch.side_effect = lambda pairs: [
+            {"entailment": 0.95, "contradiction": 0.01, "neutral": 0.04} for _ in pairs
+        ]
+
+        critic = CriticService(nli_client=nli_client, nli_batch_size=2)
+        results = critic.verify(claims, task="explain quantum computing")
+
+        # 5 claims in batches of 2 -> [2, 2] batched, last one scored singly
+        self.assertEqual(nli_client.compute_relation_batch.call_count, 2)
+        self.assertEqual(nli_client.compute_relation.call_count, 1)
+        self.assertEqual(len(results), 5)
+
+    def test_failed_nli_batch_falls_back_to_single_calls(self):
+        claims = [
+            AtomicClaim(
+                statement=f"Quantum computing uses qubits for calculation {i}.",
+                support_text=f"Quantum computing uses qubits for calculation {i}.",
+                source_url="https://example.com/q",
+                confidence=1.0,
+                extracted_at=self.test_timestamp,
+            )
+            for i in range(2)
+        ]
+        nli_client = mock.MagicMock()
+        nli_client.compute_relation_batch.side_effect = ValueError("bad response")
+        nli_client.compute_relation.return_value = {
+            "entailment": 0.95, "contradiction": 0.01, "neutral": 0.04
+        }
+
+        critic = CriticService(nli_client=nli_client, nli_batch_size=8)
+        results = critic.verify(claims, task="explain quantum computing")
+
+        self.assertEqual(nli_client.compute_relation.call_count, 2)
+        self.assertTrue(all(r.is_valid for r in results))
+
 
 class TestCriticTwoPassVerification(unittest.TestCase):
     """Tests for two-pass verification logic."""
@@ -283,6 +331,60 @@ class TestCriticSubtopicBridging(unittest.TestCase):
         # May or may not be logged depending on claim scores
 
 
+class TestCriticIncrementalScreening(unittest.TestCase):
+    """Tests for screening claims in batches before finalizing."""
+
+    def setUp(self):
+        self.critic = CriticService(use_nli=False)
+        self.test_timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+    def _claim(self, statement, entities=()):
+        return AtomicClaim(
+            statement=statement,
+            support_text=statement,
+            source_url="https://example.com",
+            confidence=0.8,
+            extracted_at=self.test_timestamp,
+            discovered_entities=list(entities),
+        )
+
+    def test_batched_screen_matches_verify(self):
+        claims = [
+            self._claim("Cryptography protects data using RSA keys.", entities=["RSA"]),
+            self._claim("RSA relies on factoring large primes."),
+            self._claim("Bananas are a popular yellow fruit."),
+        ]
+        task = "explain cryptography"
+
+        expected = [(r.is_valid, r.reason) for r in self.critic.verify(claims, task)]
+        candidates = self.critic.screen(claims[:1], task) + self.critic.screen(claims[1:], task)
+        actual = [(r.is_valid, r.reason) for r in self.critic.finalize(candidates, task)]
+
+        self.assertEqual(actual, expected)
+
+    def test_verify_stream_screens_each_batch_as_it_arrives(self):
+        claims = [
+            self._claim("Cryptography protects data using RSA keys.", entities=["RSA"]),
+            self._claim("RSA relies on factoring large primes."),
+            self._claim("Bananas are a popular yellow fruit."),
+        ]
+        task = "explain cryptography"
+        expected = [(r.is_valid, r.reason) for r in self.critic.verify(claims, task)]
+
+        screened_before_next = []
+
+        def batches():
+            for claim in claims:
+                yield [claim]
+                screened_before_next.append(screen.call_count)
+
+        with mock.patch.object(self.critic, "screen", wraps=self.critic.screen) as screen:
+            results = self.critic.verify_stream(batches(), task)
+
+        self.assertEqual([(r.is_valid, r.reason) for r in results], expected)
+        self.assertEqual(screened_before_next, [1, 2, 3])
+
+
 class TestCriticClaimTypeDetection(unittest.TestCase):
     """Tests for claim type detection (factual/speculative/mixed)."""
 
@@ -22,6 +22,9 @@ class FakeVerifier:
     def compute_relation(self, premise: str, hypothesis: str):
         return {"entailment": 0.9, "contradiction": 0.1, "neutral": 0.0}
 
+    def compute_relation_batch(self, pairs):
+        return [self.compute_relation(premise, hypothesis) for premise, hypothesis in pairs]
+
 
 class TestFastAPIServer(unittest.TestCase):
     def setUp(self):
@@ -72,6 +75,18 @@ class TestFastAPIServer(unittest.TestCase):
             )
         self.assertEqual(response.status_code, 400)
 
+    def test_relation_batch_returns_one_relation_per_pair(self):
+        with TestClient(self.server.app) as client:
+            response = client.post(
+                "/relation/batch",
+                json={"pairs": [{"premise": "a", "hypothesis": "b"}, {"premise": "c", "hypothesis": "d"}]},
+                headers={"X-Model-Variant": "exp"},
+            )
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload["variant"], "exp")
+        self.assertEqual(len(payload["relations"]), 2)
+
     def test_metrics_endpoint(self):
         with TestClient(self.server.app) as client:
             response = client.get("/metrics")
@@ -24,6 +24,27 @@ class TestNLIHttpClient(unittest.TestCase):
         self.assertEqual(kwargs["json"]["premise"], "premise")
         self.assertEqual(kwargs["json"]["hypothesis"], "hypothesis")
 
+    @mock.patch("HDRP.services.critic.nli_http_client.requests.post")
+    def test_compute_relation_batch_posts_all_pairs(self, mock_post):
+        mock_response = mock.Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = {
+            "relations": [
+                {"entailment": 0.9, "contradiction": 0.05, "neutral": 0.05},
+                {"entailment": 0.1, "contradiction": 0.8, "neutral": 0.1},
+            ],
+            "variant": "control",
+        }
+        mock_post.return_value = mock_response
+
+        client = NLIHttpClient(base_url="http://nli.example")
+        relations = client.compute_relation_batch([("p1", "h1"), ("p2", "h2")])
+
+        args, kwargs = mock_post.call_args
+        self.assertEqual(args[0], "http://nli.example/relation/batch")
+        self.assertEqual(len(kwargs["json"]["pairs"]), 2)
+        self.assertEqual(relations[1]["contradiction"], 0.8)
+
 
 if __name__ == "__main__":
     unittest.main()
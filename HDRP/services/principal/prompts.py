@@ -6,6 +6,9 @@ Contains few-shot examples for research planning that help the LLM identify:
 - Entity relationships for graph expansion
 """
 
+import hashlib
+import json
+
 SYSTEM_PROMPT = """You are a research planning assistant. Your job is to decompose complex research queries into a structured Directed Acyclic Graph (DAG) of subtasks.
 
 Rules:
@@ -104,6 +107,25 @@ FEW_SHOT_EXAMPLES = [
 ]
 
 
+def _build_static_prefix() -> tuple:
+    """Build the system prompt + few-shot messages shared by every request."""
+    messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+    for example in FEW_SHOT_EXAMPLES:
+        messages.append({"role": "user", "content": example["query"]})
+        messages.append({"role": "assistant", "content": example["response"]})
+    return tuple(messages)
+
+
+# Identical leading messages let the provider reuse its cached prompt prefix;
+# only the final user message varies between requests.
+STATIC_PREFIX = _build_static_prefix()
+
+# Routing key for provider-side prompt caching; changes whenever the prefix does
+PROMPT_CACHE_KEY = "hdrp-decomposition-" + hashlib.sha256(
+    json.dumps(STATIC_PREFIX, sort_keys=True).encode("utf-8")
+).hexdigest()[:16]
+
+
 def build_decomposition_prompt(query: str) -> list:
     """Build the messages list for the decomposition prompt.
     
@@ -113,12 +135,7 @@ def build_decomposition_prompt(query: str) -> list:
     Returns:
         List of message dicts for the chat completion API.
     """
-    messages = [{"role": "system", "content": SYSTEM_PROMPT}]
-    
-    # Add few-shot examples
-    for example in FEW_SHOT_EXAMPLES:
-        messages.append({"role": "user", "content": example["query"]})
-        messages.append({"role": "assistant", "content": example["response"]})
+    messages = [dict(message) for message in STATIC_PREFIX]
     
     # Add the actual query
     messages.append({"role": "user", "content": query})
@@ -13,7 +13,7 @@ from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 
 from HDRP.api.gen.python import hdrp_services_pb2
-from HDRP.services.principal.prompts import build_decomposition_prompt
+from HDRP.services.principal.prompts import PROMPT_CACHE_KEY, build_decomposition_prompt
 from HDRP.services.shared.logger import ResearchLogger
 from HDRP.services.shared.errors import PrincipalError, report_error
 
@@ -42,8 +42,16 @@ class Subtask:
 class PrincipalService:
     """Service for decomposing research queries into DAGs using LLM."""
     
-    def __init__(self, run_id: Optional[str] = None):
+    def __init__(self, run_id: Optional[str] = None, prompt_cache: bool = True):
+        """Initialize PrincipalService.
+        
+        Args:
+            run_id: Optional run ID for logging
+            prompt_cache: Send a stable prompt_cache_key so the provider can reuse
+                          its cached system/few-shot prefix across requests
+        """
         self.logger = ResearchLogger("principal_service", run_id=run_id)
+        self.prompt_cache = prompt_cache
         self._client = None
     
     @property
@@ -128,14 +136,29 @@ class PrincipalService:
         """
         messages = build_decomposition_prompt(query)
         
+        request_kwargs = {}
+        if self.prompt_cache:
+            # Passed via extra_body so older SDKs without the parameter still work
+            request_kwargs["extra_body"] = {"prompt_cache_key": PROMPT_CACHE_KEY}
+        
         response = self.client.chat.completions.create(
             model=model,
             messages=messages,
             response_format={"type": "json_object"},
             temperature=0.3,
-            max_tokens=1024
+            max_tokens=1024,
+            **request_kwargs
         )
         
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        if isinstance(cached_tokens, int):
+            self.logger.log("prompt_cache_usage", {
+                "prompt_tokens": getattr(usage, "prompt_tokens", None),
+                "cached_tokens": cached_tokens,
+            })
+        
         content = response.choices[0].message.content
         return self._parse_llm_response(content)
     
@@ -0,0 +1,155 @@
+"""Persistent cache of Researcher claims keyed by (provider, query).
+
+Repeat and iterative queries (dashboard reruns, local development) re-issue
+identical search calls. This cache stores the claims extracted for a query in
+a small SQLite database so the Researcher stage can be skipped entirely on a
+hit. Entries expire after a TTL so results do not go stale indefinitely, and
+expired rows are pruned on every write.
+
+The cache is opt-in: set HDRP_RESEARCH_CACHE=1 to enable it. HDRP_CACHE_DISABLE=1
+bypasses it (and the response cache) regardless.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from HDRP.services.shared.claims import AtomicClaim
+from HDRP.services.shared.response_cache import cache_disabled, normalize_query
+
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS research_cache (
+    query_hash TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    claims TEXT NOT NULL
+)
+"""
+
+
+def research_cache_enabled() -> bool:
+    """Check if the research cache has been opted into via environment variable.
+
+    Returns:
+        True if HDRP_RESEARCH_CACHE is set to "1", "true" or "yes" and
+        HDRP_CACHE_DISABLE is not set
+    """
+    env_val = os.getenv("HDRP_RESEARCH_CACHE", "").lower()
+    return env_val in ("1", "true", "yes") and not cache_disabled()
+
+
+class ResearchCache:
+    """SQLite-backed cache of extracted claims with a time-to-live.
+
+    A connection is opened per call, so one instance can be shared across
+    threads; writes are additionally serialized with a lock.
+    """
+
+    def __init__(self, db_path: Path, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the research cache.
+
+        Args:
+            db_path: Path of the SQLite database file (created on first write)
+            ttl_seconds: Age after which an entry is treated as a miss
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(provider: str, query: str) -> str:
+        """Hash a provider name and normalized query into a cache key."""
+        material = f"{provider}\x00{normalize_query(query)}".encode("utf-8")
+        return hashlib.blake2b(material, digest_size=16).hexdigest()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, commit on success and always close it."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        try:
+            conn.execute(_SCHEMA)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, query_hash: str) -> Optional[List[AtomicClaim]]:
+        """
+        Return cached claims for a key, or None on a miss or expired entry.
+
+        Args:
+            query_hash: Key from ResearchCache.key
+
+        Returns:
+            List of AtomicClaim, or None
+        """
+        if not self.db_path.exists():
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT created_at, claims FROM research_cache WHERE query_hash = ?",
+                    (query_hash,),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+
+        created_at, payload = row
+        if time.time() - created_at > self.ttl_seconds:
+            return None
+        try:
+            return [AtomicClaim(**data) for data in json.loads(payload)]
+        except (ValueError, TypeError):
+            return None
+
+    def put(self, query_hash: str, claims: List[AtomicClaim]) -> None:
+        """
+        Store claims for a key, replacing any existing entry.
+
+        Expired entries are deleted in the same transaction, so the database
+        does not grow without bound.
+
+        Args:
+            query_hash: Key from ResearchCache.key
+            claims: Claims returned by the Researcher
+        """
+        payload = json.dumps([claim.model_dump() for claim in claims])
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO research_cache (query_hash, created_at, claims) "
+                "VALUES (?, ?, ?)",
+                (query_hash, now, payload),
+            )
+            conn.execute(
+                "DELETE FROM research_cache WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            )
+
+    def prune(self) -> int:
+        """
+        Delete expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.db_path.exists():
+            return 0
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM research_cache WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+            return cursor.rowcount
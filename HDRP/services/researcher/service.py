@@ -1,12 +1,23 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
+import re
 import time
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from HDRP.tools.search.base import SearchProvider, SearchError
 from HDRP.services.shared.claims import ClaimExtractor, AtomicClaim
 from HDRP.services.shared.logger import ResearchLogger
 from HDRP.services.shared.errors import ResearcherError, report_error
 from HDRP.services.shared.profiling_utils import profile_block, enable_profiling_env
+from HDRP.services.shared.settings import get_settings
+
+# Boundaries between consecutive questions in a compound query
+_SUBQUERY_SPLIT = re.compile(r"(?<=\?)\s+")
+
+# Delay before the first search retry, doubled for each later attempt
+RETRY_BASE_DELAY_SECONDS = 1.0
+
+# Upper bound on a single retry delay, including a provider's Retry-After
+MAX_RETRY_DELAY_SECONDS = 30.0
 
 class ResearcherService:
     """Service responsible for executing research tasks.
@@ -17,11 +28,23 @@ class ResearcherService:
     
     Optimized with concurrent claim extraction for improved performance.
     """
-    def __init__(self, search_provider: SearchProvider, run_id: Optional[str] = None):
+    def __init__(
+        self,
+        search_provider: SearchProvider,
+        run_id: Optional[str] = None,
+        max_concurrent_searches: Optional[int] = None,
+    ):
         self.search_provider = search_provider
         self.extractor = ClaimExtractor()
         self.logger = ResearchLogger("researcher", run_id=run_id)
         self.enable_profiling = enable_profiling_env()
+        # Bound on in-flight sub-query searches, to respect provider rate limits
+        self.max_concurrent_searches = max(
+            1,
+            max_concurrent_searches
+            if max_concurrent_searches is not None
+            else get_settings().concurrency.rate_limits.researcher
+        )
         # Thread pool for concurrent claim extraction
         self._executor = ThreadPoolExecutor(max_workers=4)
 
@@ -31,6 +54,114 @@ class ResearcherService:
         Each claim will include the source URL and the support text where it was found.
         Optimized with concurrent claim extraction.
         """
+        results = self._search_plan(query, source_node_id)
+        if not results:
+            return []
+
+        # Concurrent claim extraction from all search results
+        if self.enable_profiling:
+            with profile_block(f"claim_extraction_{query[:30]}", "profiling_data"):
+                all_claims = self._extract_claims_concurrent(results, source_node_id)
+        else:
+            all_claims = self._extract_claims_concurrent(results, source_node_id)
+            
+        return all_claims
+
+    def research_stream(
+        self, query: str, source_node_id: Optional[str] = None
+    ) -> Iterator[Tuple[int, List[AtomicClaim]]]:
+        """Like ``research``, but yields claims per search result as extraction finishes.
+        
+        Yields (source_rank, claims) tuples in completion order, so consumers can
+        start verifying early results while later ones are still being extracted.
+        Sorting the tuples by rank reproduces the ordering of ``research``.
+        """
+        results = self._search_plan(query, source_node_id)
+        if not results:
+            return
+
+        futures = {
+            self._executor.submit(self._extract_from_result, idx, result, source_node_id): idx
+            for idx, result in enumerate(results, 1)
+        }
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except Exception as e:
+                self.logger.log("extraction_error", {
+                    "error": str(e),
+                    "type": type(e).__name__
+                })
+
+    def plan(self, query: str) -> List[str]:
+        """Split a compound query into independently searchable sub-queries.
+        
+        Only explicit multi-question input is split: a query made up entirely
+        of questions ("What is X? How does Y work?") becomes one search per
+        question. Anything else, including a question followed by a
+        statement or text containing semicolons, is returned unchanged.
+        """
+        parts = [part.strip() for part in _SUBQUERY_SPLIT.split(query.strip())]
+        if len(parts) < 2 or not all(part.endswith("?") for part in parts):
+            return [query]
+        return list(dict.fromkeys(parts))
+
+    def _search_plan(self, query: str, source_node_id: Optional[str]) -> list:
+        """Search every sub-query in the plan, concurrently when there are several."""
+        sub_queries = self.plan(query)
+        if len(sub_queries) == 1:
+            return self._search(sub_queries[0], source_node_id)
+        return asyncio.run(self._search_concurrently(sub_queries, source_node_id))
+
+    async def _search_concurrently(self, sub_queries: List[str], source_node_id: Optional[str]) -> list:
+        """Fan sub-query searches out over threads, bounded by a semaphore.
+        
+        Results are merged in plan order with duplicate URLs dropped. A failed
+        sub-query is skipped unless every sub-query fails, in which case the
+        first error is raised.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_searches)
+
+        async def search_one(sub_query: str) -> list:
+            async with semaphore:
+                return await asyncio.to_thread(self._search, sub_query, source_node_id)
+
+        outcomes = await asyncio.gather(
+            *(search_one(sub_query) for sub_query in sub_queries),
+            return_exceptions=True,
+        )
+        errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+        if len(errors) == len(outcomes):
+            raise errors[0]
+
+        results, seen_urls = [], set()
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                continue
+            for result in outcome:
+                if result.url in seen_urls:
+                    continue
+                seen_urls.add(result.url)
+                results.append(result)
+        return results
+
+    @staticmethod
+    def _retry_delay(attempt: int, exc: SearchError) -> float:
+        """Seconds to wait before retry ``attempt`` (0-based) of a failed search.
+        
+        A provider-supplied Retry-After wins; otherwise the delay doubles
+        from RETRY_BASE_DELAY_SECONDS.
+        """
+        retry_after = getattr(exc, "retry_after", None)
+        delay = retry_after if retry_after is not None else RETRY_BASE_DELAY_SECONDS * (2 ** attempt)
+        return min(delay, MAX_RETRY_DELAY_SECONDS)
+
+    def _search(self, query: str, source_node_id: Optional[str]) -> list:
+        """Run the search with retries and return its results (empty if none).
+        
+        This is the only retry layer for searches; providers make a single
+        request per call and report throttling via SearchError.retry_after.
+        """
         max_retries = 2
         search_response = None
         
@@ -50,12 +181,14 @@ class ResearcherService:
                 break
             except SearchError as e:
                 if attempt < max_retries:
+                    delay = self._retry_delay(attempt, e)
                     self.logger.log("research_retry", {
                         "query": query,
                         "error": str(e),
-                        "attempt": attempt + 1
+                        "attempt": attempt + 1,
+                        "delay_seconds": delay
                     })
-                    time.sleep(1)
+                    time.sleep(delay)
                     continue
                 else:
                     # Final retry failed - wrap error and report to Sentry
@@ -107,65 +240,52 @@ class ResearcherService:
             })
             return []
 
-        # Concurrent claim extraction from all search results
-        if self.enable_profiling:
-            with profile_block(f"claim_extraction_{query[:30]}", "profiling_data"):
-                all_claims = self._extract_claims_concurrent(
-                    search_response.results, source_node_id
-                )
-        else:
-            all_claims = self._extract_claims_concurrent(
-                search_response.results, source_node_id
+        return search_response.results
+    
+    def _extract_from_result(self, idx: int, result, source_node_id: Optional[str]) -> List[AtomicClaim]:
+        """Extract claims from a single search result (rank ``idx``)."""
+        try:
+            # For the MVP standard, we extract claims directly from the search snippets.
+            # This ensures that 'support_text' is always tied to a verified search result.
+            extraction = self.extractor.extract(
+                result.snippet, 
+                source_url=result.url, 
+                source_node_id=source_node_id,
+                source_title=result.title,
+                source_rank=idx
             )
             
-        return all_claims
+            # Log traceability metadata for debugging
+            if extraction.claims:
+                self.logger.log("claims_extracted", {
+                    "source_title": result.title,
+                    "source_url": result.url,
+                    "source_rank": idx,
+                    "claims_count": len(extraction.claims)
+                })
+            return extraction.claims
+        except Exception as e:
+            # Log extraction failure but continue with other results
+            self.logger.log("extraction_failed", {
+                "source_url": result.url,
+                "source_title": result.title,
+                "source_rank": idx,
+                "error": str(e),
+                "type": type(e).__name__
+            })
+            return []
     
     def _extract_claims_concurrent(self, results, source_node_id: Optional[str]) -> List[AtomicClaim]:
         """Extract claims from search results concurrently.
         
         Uses ThreadPoolExecutor to process multiple search results in parallel.
         """
-        def extract_from_result(idx_and_result):
-            idx, result = idx_and_result
-            try:
-                # For the MVP standard, we extract claims directly from the search snippets.
-                # This ensures that 'support_text' is always tied to a verified search result.
-                extraction = self.extractor.extract(
-                    result.snippet, 
-                    source_url=result.url, 
-                    source_node_id=source_node_id,
-                    source_title=result.title,
-                    source_rank=idx
-                )
-                
-                # Log traceability metadata for debugging
-                if extraction.claims:
-                    self.logger.log("claims_extracted", {
-                        "source_title": result.title,
-                        "source_url": result.url,
-                        "source_rank": idx,
-                        "claims_count": len(extraction.claims)
-                    })
-                return extraction.claims
-            except Exception as e:
-                # Log extraction failure but continue with other results
-                self.logger.log("extraction_failed", {
-                    "source_url": result.url,
-                    "source_title": result.title,
-                    "source_rank": idx,
-                    "error": str(e),
-                    "type": type(e).__name__
-                })
-                return []
-        
-        # Process results concurrently
-        indexed_results = list(enumerate(results, 1))
         all_claims = []
         
         # Use thread pool to parallelize claim extraction
         futures = [
-            self._executor.submit(extract_from_result, item)
-            for item in indexed_results
+            self._executor.submit(self._extract_from_result, idx, result, source_node_id)
+            for idx, result in enumerate(results, 1)
         ]
         
         for future in futures:
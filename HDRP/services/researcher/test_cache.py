@@ -0,0 +1,66 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import os
+
+from HDRP.services.researcher.cache import ResearchCache, research_cache_enabled
+from HDRP.services.shared.claims import AtomicClaim
+
+
+class TestResearchCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResearchCache(Path(self.tmp.name) / "research.sqlite3", ttl_seconds=60)
+        self.claims = [
+            AtomicClaim(
+                statement="Paris is the capital of France.",
+                support_text="Paris is the capital of France.",
+                source_url="https://example.com/paris",
+                source_title="Paris",
+                source_rank=1,
+                confidence=0.9,
+            )
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_key_depends_on_provider_and_normalized_query(self):
+        key = ResearchCache.key("SimulatedSearchProvider", "Capital of France")
+        self.assertEqual(key, ResearchCache.key("SimulatedSearchProvider", "  capital of   FRANCE "))
+        self.assertNotEqual(key, ResearchCache.key("GoogleSearchProvider", "Capital of France"))
+
+    def test_miss_before_any_write(self):
+        self.assertIsNone(self.cache.get("missing"))
+
+    def test_round_trip_preserves_claims(self):
+        self.cache.put("k", self.claims)
+        cached = self.cache.get("k")
+        self.assertEqual([c.model_dump() for c in cached], [c.model_dump() for c in self.claims])
+
+    def test_expired_entry_is_a_miss_and_pruned(self):
+        self.cache.put("k", self.claims)
+        with patch("HDRP.services.researcher.cache.time.time", return_value=10**12):
+            self.assertIsNone(self.cache.get("k"))
+            self.assertEqual(self.cache.prune(), 1)
+        self.assertIsNone(self.cache.get("k"))
+
+    def test_put_prunes_expired_entries(self):
+        self.cache.put("old", self.claims)
+        with patch("HDRP.services.researcher.cache.time.time", return_value=10**12):
+            self.cache.put("new", self.claims)
+            self.assertEqual(self.cache.prune(), 0)
+
+    def test_research_cache_is_opt_in(self):
+        with patch.dict(os.environ, {"HDRP_RESEARCH_CACHE": "", "HDRP_CACHE_DISABLE": ""}):
+            self.assertFalse(research_cache_enabled())
+        with patch.dict(os.environ, {"HDRP_RESEARCH_CACHE": "1", "HDRP_CACHE_DISABLE": ""}):
+            self.assertTrue(research_cache_enabled())
+        with patch.dict(os.environ, {"HDRP_RESEARCH_CACHE": "1", "HDRP_CACHE_DISABLE": "1"}):
+            self.assertFalse(research_cache_enabled())
+
+
+if __name__ == "__main__":
+    unittest.main()
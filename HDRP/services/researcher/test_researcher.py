@@ -3,6 +3,7 @@ import unittest
 from unittest.mock import Mock, MagicMock, patch
 
 from HDRP.services.researcher.service import ResearcherService
+from HDRP.services.shared.errors import ResearcherError
 from HDRP.tools.search.simulated import SimulatedSearchProvider
 from HDRP.tools.search.base import SearchError
 from HDRP.tools.search.schema import SearchResponse, SearchResult
@@ -27,6 +28,17 @@ class TestResearcherService(unittest.TestCase):
             self.assertEqual(claim.statement, claim.support_text)
             # print(f"Claim: {claim.statement}")
 
+    def test_research_stream_matches_research_by_rank(self):
+        query = "quantum computing"
+        claims = self.researcher.research(query)
+        batches = sorted(self.researcher.research_stream(query), key=lambda item: item[0])
+        streamed = [claim for _, batch in batches for claim in batch]
+
+        self.assertEqual(
+            [(c.source_url, c.statement) for c in streamed],
+            [(c.source_url, c.statement) for c in claims],
+        )
+
     def test_research_failure_logging(self):
         # Mock the search provider to raise an exception
         self.search_provider.search = Mock(side_effect=Exception("Simulated API Error"))
@@ -104,6 +116,78 @@ class TestResearcherRetryLogic(unittest.TestCase):
         self.assertEqual(len(retry_calls), 2)
 
 
+class TestResearcherSubQueries(unittest.TestCase):
+    """Tests for splitting compound queries and searching sub-queries concurrently."""
+
+    def setUp(self):
+        self.search_provider = Mock()
+        self.researcher = ResearcherService(self.search_provider, max_concurrent_searches=2)
+
+    def _response(self, query, urls):
+        return SearchResponse(
+            query=query,
+            results=[
+                SearchResult(
+                    title=f"Result for {query}",
+                    url=url,
+                    snippet="Test snippet with enough content to be extracted.",
+                    source="simulated",
+                )
+                for url in urls
+            ],
+            total_found=len(urls),
+            latency_ms=10,
+        )
+
+    def test_plan_splits_separate_questions(self):
+        self.assertEqual(
+            self.researcher.plan("What is RSA? How is it broken?"),
+            ["What is RSA?", "How is it broken?"],
+        )
+        self.assertEqual(self.researcher.plan("quantum computing"), ["quantum computing"])
+
+    def test_plan_only_splits_explicit_questions(self):
+        for query in (
+            "RSA key sizes; attacks on RSA",
+            "What is RSA? Explain the history in detail",
+            "line one\nline two",
+        ):
+            self.assertEqual(self.researcher.plan(query), [query])
+
+    def test_sub_queries_are_searched_and_deduplicated(self):
+        responses = {
+            "What is RSA?": self._response("What is RSA?", ["https://a.com", "https://b.com"]),
+            "How is it broken?": self._response("How is it broken?", ["https://b.com", "https://c.com"]),
+        }
+        self.search_provider.search = Mock(side_effect=lambda q: responses[q])
+
+        claims = self.researcher.research("What is RSA? How is it broken?")
+
+        self.assertEqual(self.search_provider.search.call_count, 2)
+        self.assertEqual(
+            sorted({c.source_url for c in claims}),
+            ["https://a.com", "https://b.com", "https://c.com"],
+        )
+
+    def test_failed_sub_query_is_skipped(self):
+        def search(query):
+            if query == "How is it broken?":
+                raise ValueError("boom")
+            return self._response(query, ["https://a.com"])
+
+        self.search_provider.search = Mock(side_effect=search)
+
+        claims = self.researcher.research("What is RSA? How is it broken?")
+
+        self.assertEqual({c.source_url for c in claims}, {"https://a.com"})
+
+    def test_raises_when_every_sub_query_fails(self):
+        self.search_provider.search = Mock(side_effect=ValueError("boom"))
+
+        with self.assertRaises(ResearcherError):
+            self.researcher.research("What is RSA? How is it broken?")
+
+
 class TestResearcherEmptyResults(unittest.TestCase):
     """Tests for empty search results handling."""
 
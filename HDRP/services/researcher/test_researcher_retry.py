@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import Mock, patch
 from HDRP.services.researcher.service import ResearcherService
+from HDRP.services.shared.errors import ResearcherError
 from HDRP.tools.search.base import SearchError
 from HDRP.tools.search.simulated import SimulatedSearchProvider
 
@@ -47,6 +48,19 @@ class TestResearcherServiceRetry(unittest.TestCase):
         self.assertEqual(self.search_provider.search.call_count, 3)
         self.assertEqual(mock_sleep.call_count, 2)
 
+    @patch('time.sleep')
+    def test_research_retry_honours_retry_after(self, mock_sleep):
+        self.search_provider.search = Mock(side_effect=[
+            SearchError("Throttled", retry_after=7.0),
+            SearchError("Fail"),
+            SearchError("Fail"),
+        ])
+
+        with self.assertRaises(ResearcherError):
+            self.researcher.research("throttled query")
+
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [7.0, 2.0])
+
     def test_research_other_exception_no_retry(self):
         # Fail with generic Exception
         self.search_provider.search = Mock(side_effect=ValueError("Bad Input"))
@@ -0,0 +1,56 @@
+"""Aggregations over claim lists used when writing run artifacts.
+
+These run once per report but scale with the number of claims, so the
+per-claim work is pushed into C-implemented builtins (attrgetter, Counter,
+dict/zip) instead of an interpreted loop.
+"""
+
+import operator
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Tuple
+
+_SOURCE_URL = operator.attrgetter("source_url")
+
+
+def group_sources(claims: Iterable) -> Dict[str, Tuple[Any, int]]:
+    """
+    Group claims by their source URL.
+
+    Args:
+        claims: Objects with a ``source_url`` attribute
+
+    Returns:
+        Dict mapping each distinct non-empty source URL, in first-seen order,
+        to (first claim citing it, number of citing claims).
+    """
+    claims = list(claims)
+    urls = list(map(_SOURCE_URL, claims))
+    counts = Counter(urls)
+    counts.pop(None, None)
+    counts.pop("", None)
+    if not counts:
+        return {}
+
+    # Index of the first claim citing each URL (reversed so earlier claims
+    # win); callers read per-source fields from that claim only
+    first = dict(zip(reversed(urls), range(len(urls) - 1, -1, -1)))
+    return {url: (claims[first[url]], count) for url, count in counts.items()}
+
+
+def summarize_sources(claims: Iterable) -> List[Dict]:
+    """
+    Collect the unique sources cited by a list of claims.
+
+    Args:
+        claims: Objects with ``source_url`` and ``source_title`` attributes
+
+    Returns:
+        One dict per distinct non-empty source URL, in first-seen order:
+        {"url", "title", "rank", "claims"}. The title comes from the first
+        claim citing the URL ("Unknown" if it has none), rank is the 1-based
+        first-seen position and claims is the number of citing claims.
+    """
+    return [
+        {"url": url, "title": claim.source_title or "Unknown", "rank": rank, "claims": count}
+        for rank, (url, (claim, count)) in enumerate(group_sources(claims).items(), 1)
+    ]
@@ -3,6 +3,8 @@ from pydantic import BaseModel, Field
 from datetime import datetime, timezone
 import uuid
 
+_UTC = timezone.utc
+
 class AtomicClaim(BaseModel):
     """Represents a single, non-decomposable factual statement."""
     claim_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -58,7 +60,7 @@ class ClaimExtractor:
             return ExtractionResponse(source_text=text, claims=[])
 
         # Generate timestamp once for all claims in this extraction
-        extraction_time = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        extraction_time = datetime.now(_UTC).isoformat().replace("+00:00", "Z")
 
         # MVP Heuristic: Split by sentences and filter for 'fact-like' statements.
         sentences = self._split_sentences(text)
@@ -0,0 +1,92 @@
+"""Concurrent staging of artifact files.
+
+Artifact files are written to unique temp files next to their destination
+and published by the caller with os.replace. ``stage_files`` writes several
+such temp files at once on worker threads, so a large report does not hold
+up the smaller files written alongside it.
+
+All blocking file I/O goes through one process-wide thread pool, shared by
+concurrent runs, rather than the default executor of each short-lived
+event loop.
+"""
+
+import asyncio
+import functools
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Union
+
+Chunks = Iterable[Union[str, bytes]]
+
+# Shared pool for artifact I/O across all pipeline runs in this process
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hdrp-io")
+
+
+async def run_io(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking I/O call on the shared artifact I/O pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_IO_POOL, functools.partial(func, *args, **kwargs))
+
+
+def write_temp(
+    directory: Path,
+    name: str,
+    chunks: Chunks,
+    sync: bool = False,
+) -> Path:
+    """
+    Write chunks to a unique temp file in directory and return its path.
+    
+    Text chunks are UTF-8 encoded; bytes are written as-is.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return Path(tmp_name)
+
+
+async def stage_files(
+    directory: Path,
+    files: Dict[str, Chunks],
+    sync: bool = False,
+) -> Dict[str, Path]:
+    """
+    Write several temp files in directory concurrently.
+    
+    Args:
+        directory: Directory the files will be published into
+        files: Map of final file name to its chunks, as for write_temp
+        sync: If True, fsync each temp file before returning
+    
+    Returns:
+        Map of final file name to its staged temp path
+    
+    Raises:
+        Exception: The first write error; temp files that were written are
+            removed before it is raised
+    """
+    names = list(files)
+    outcomes = await asyncio.gather(
+        *(
+            run_io(write_temp, directory, name, chunks, sync)
+            for name, chunks in files.items()
+        ),
+        return_exceptions=True,
+    )
+    errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+    if errors:
+        for outcome in outcomes:
+            if isinstance(outcome, Path):
+                outcome.unlink(missing_ok=True)
+        raise errors[0]
+    return dict(zip(names, outcomes))
@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 # Constants
+_UTC = timezone.utc
 LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../logs"))
 
 class JsonFormatter(logging.Formatter):
@@ -14,7 +15,7 @@ class JsonFormatter(logging.Formatter):
     """
     def format(self, record):
         log_record = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": datetime.fromtimestamp(record.created, _UTC).isoformat().replace("+00:00", "Z"),
             "level": record.levelname,
             "component": getattr(record, "component", "unknown"),
             "run_id": getattr(record, "run_id", "unknown"),
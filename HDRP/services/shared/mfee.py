@@ -0,0 +1,71 @@
+"""MFEE-style gating for trivially answerable queries.
+
+``direct_answer`` returns a report for queries that can be answered without
+running the Researcher -> Critic -> Synthesizer pipeline, and None for those
+that need it. A query is answered directly when it:
+
+1. Has no researchable content (empty or punctuation only), or
+2. Matches an entry in the small built-in fact table, which is opt-in
+   (set HDRP_FACT_KB=1) since its answers carry no sources.
+
+Cached reports are served by PipelineRunner itself (see RESPONSE_CACHE).
+"""
+
+import os
+from typing import Dict, Optional
+
+from HDRP.services.shared.response_cache import normalize_query
+
+
+NO_CONTENT_REPORT = "No information found for this query."
+
+# Deterministic answers keyed by normalized query (trailing punctuation stripped)
+FACT_KB: Dict[str, str] = {
+    "what is the capital of france": "Paris is the capital of France.",
+    "what is the capital of germany": "Berlin is the capital of Germany.",
+    "what is the capital of japan": "Tokyo is the capital of Japan.",
+    "what is the boiling point of water": (
+        "Water boils at 100 degrees Celsius (212 degrees Fahrenheit) at sea-level pressure."
+    ),
+    "what is the speed of light": (
+        "The speed of light in a vacuum is 299,792,458 metres per second."
+    ),
+}
+
+
+def _kb_key(query: str) -> str:
+    return normalize_query(query).rstrip("?.! ")
+
+
+def fact_kb_enabled() -> bool:
+    """Check if FACT_KB answers have been opted into via environment variable.
+
+    Returns:
+        True if HDRP_FACT_KB is set to "1", "true" or "yes"
+    """
+    return os.getenv("HDRP_FACT_KB", "").lower() in ("1", "true", "yes")
+
+
+def direct_answer(query: str, use_kb: Optional[bool] = None) -> Optional[str]:
+    """
+    Return a report for a trivially answerable query, or None.
+
+    Args:
+        query: Research query
+        use_kb: Whether to consult FACT_KB; defaults to fact_kb_enabled()
+
+    Returns:
+        Report text if the query can be answered directly, otherwise None
+    """
+    key = _kb_key(query)
+    if not any(ch.isalnum() for ch in key):
+        return NO_CONTENT_REPORT
+
+    if use_kb is None:
+        use_kb = fact_kb_enabled()
+    fact = FACT_KB.get(key) if use_kb else None
+    if fact is not None:
+        return f"# HDRP Research Report: {query.strip()}\n\n{fact}\n"
+
+    return None
+
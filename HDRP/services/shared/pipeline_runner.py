@@ -6,31 +6,169 @@ Consolidates pipeline execution logic from cli.py, orchestrated_runner.py,
 and benchmark scripts to eliminate code duplication.
 """
 
+import asyncio
+import functools
+import hashlib
 import os
 import sys
+import threading
 import time
 import json
 import subprocess
 import requests
-from datetime import datetime, timezone
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 
 from rich.console import Console
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
 from HDRP.tools.search.factory import SearchFactory
 from HDRP.tools.search.base import SearchProvider, SearchError
 from HDRP.tools.search.api_key_validator import APIKeyError
 from HDRP.services.researcher.service import ResearcherService
+from HDRP.services.researcher.cache import ResearchCache, research_cache_enabled
 from HDRP.services.critic.service import CriticService
 from HDRP.services.synthesizer.service import SynthesizerService
 from HDRP.services.shared.logger import ResearchLogger
+from HDRP.services.shared.agg import summarize_sources
+from HDRP.services.shared.io_async import run_io, stage_files, write_temp
+from HDRP.services.shared.progress import ProgressThrottle
 from HDRP.services.shared.errors import HDRPError, format_user_error, report_error
+from HDRP.services.shared.response_cache import ResponseCache, response_cache_enabled
+from HDRP.services.shared.settings import get_settings
 
 
 # Path to artifacts directory
 ARTIFACTS_DIR = Path(__file__).parent.parent / "artifacts"
 
+# Max claim batches buffered between the Researcher and Critic stages
+CLAIM_QUEUE_SIZE = 8
+
+# Write buffer for reports saved to an explicit output path
+REPORT_WRITE_BUFFER = 1 << 20
+
+# UTC timestamp format for artifact metadata (e.g. 2024-01-01T12:00:00Z)
+GENERATED_AT_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Provenance block shared by every metadata.json written by this module
+# (treat as read-only; it is serialized, never mutated)
+_PROVENANCE = {
+    "system": "HDRP",
+    "version": "1.0.0",
+    "pipeline": ["Researcher", "Critic", "Synthesizer"],
+    "verification_enabled": True,
+}
+
+# Exact + semantic cache of successful reports, shared by all runners
+# (opt-in, see response_cache_enabled)
+RESPONSE_CACHE = ResponseCache(ARTIFACTS_DIR / "_cache")
+
+# Claims per (provider, query), so reruns skip the Researcher stage
+# (opt-in, see research_cache_enabled)
+RESEARCH_CACHE = ResearchCache(ARTIFACTS_DIR / "_cache" / "research.sqlite3")
+
+
+# Providers built by build_search_provider, reused across runs in this
+# process so repeat queries share one instance (and its TLS setup). Cached
+# providers are shared between threads (e.g. concurrent dashboard runs), so
+# providers must not keep per-request state; the built-in ones hold only
+# their configuration.
+_PROVIDER_CACHE_SIZE = 4
+_PROVIDER_CACHE: "OrderedDict[tuple, SearchProvider]" = OrderedDict()
+_PROVIDER_CACHE_LOCK = threading.Lock()
+
+# Worker that runs pipeline coroutines when the caller already has an event
+# loop (see _run_coroutine); created once rather than per call
+_LOOP_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hdrp-run")
+
+
+def _key_digest(api_key: Optional[str]) -> Optional[str]:
+    """Digest an API key for use in cache keys, so the key itself is not held."""
+    return hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest() if api_key else None
+
+
+def _cached_provider(provider_type: str, api_key: Optional[str] = None, **provider_kwargs) -> SearchProvider:
+    """Return a cached SearchFactory provider, constructing it on first use.
+    
+    The cache key holds a blake2b digest of the API key rather than the key
+    itself.
+    """
+    cache_key = (provider_type, _key_digest(api_key), tuple(sorted(provider_kwargs.items())))
+    if api_key:
+        provider_kwargs["api_key"] = api_key
+    return _get_or_build(cache_key, lambda: SearchFactory.get_provider(provider_type, **provider_kwargs))
+
+
+def _cached_env_provider(default_provider: str = "simulated") -> SearchProvider:
+    """Return the cached SearchFactory.from_env provider.
+    
+    Keyed on the provider type from_env resolves to plus a digest of its API
+    key, so a settings change that picks another provider or key builds a new
+    one. Call clear_provider_cache after patching from_env (e.g. in test
+    fixtures).
+    """
+    provider_type = get_settings().search.provider or default_provider
+    api_key = _settings_google_key() if provider_type == "google" else None
+    return _get_or_build(
+        (f"<env>:{provider_type}", _key_digest(api_key), ()),
+        lambda: SearchFactory.from_env(default_provider=default_provider),
+    )
+
+
+def _get_or_build(cache_key: tuple, build: Callable[[], SearchProvider]) -> SearchProvider:
+    """Look up a provider in the LRU cache, calling build() on a miss."""
+    with _PROVIDER_CACHE_LOCK:
+        provider = _PROVIDER_CACHE.get(cache_key)
+        if provider is not None:
+            _PROVIDER_CACHE.move_to_end(cache_key)
+            return provider
+    
+    provider = build()
+    with _PROVIDER_CACHE_LOCK:
+        _PROVIDER_CACHE[cache_key] = provider
+        while len(_PROVIDER_CACHE) > _PROVIDER_CACHE_SIZE:
+            _PROVIDER_CACHE.popitem(last=False)
+    return provider
+
+
+def _settings_google_key() -> Optional[str]:
+    """Return the Google API key from settings, or None if unset.
+    
+    Read on every call (get_settings is already cached), so a key rotated
+    with reload_settings is picked up without clearing the provider cache.
+    """
+    secret = get_settings().search.google.api_key
+    return secret.get_secret_value() if secret else None
+
+
+def clear_provider_cache() -> None:
+    """Drop all cached search providers (e.g. between tests)."""
+    with _PROVIDER_CACHE_LOCK:
+        _PROVIDER_CACHE.clear()
+
+
+def _provider_fingerprint(provider: SearchProvider) -> str:
+    """Identify a search provider by class and configuration for cache keys.
+    
+    Scalar instance attributes (API keys, result limits, endpoints) are folded
+    into a blake2b digest, so differently configured providers never share
+    cache entries and no key is written to disk in the clear.
+    """
+    provider_cls = type(provider)
+    config = sorted(
+        (name, repr(value))
+        for name, value in getattr(provider, "__dict__", {}).items()
+        if isinstance(value, (str, int, float, bool, type(None)))
+    )
+    digest = hashlib.blake2b(repr(config).encode("utf-8"), digest_size=8).hexdigest()
+    return f"{provider_cls.__module__}.{provider_cls.__qualname__}:{digest}"
+
 
 def build_search_provider(
     provider: Optional[str] = None,
@@ -50,6 +188,9 @@ def build_search_provider(
         api_key: Optional API key
         cx: Optional Google Custom Search Engine ID
     
+    Providers are cached per (provider, API key, options), so repeat calls
+    return the same instance; see clear_provider_cache.
+    
     Returns:
         SearchProvider instance
     
@@ -62,75 +203,200 @@ def build_search_provider(
 
     if not provider_type:
         # Let factory decide based on HDRP_SEARCH_PROVIDER and friends
-        return SearchFactory.from_env()
+        return _cached_env_provider()
 
     if provider_type == "google":
         # Explicit key wins; otherwise rely on settings
-        effective_key = api_key
-        if not effective_key:
-            from HDRP.services.shared.settings import get_settings
-            settings = get_settings()
-            if settings.search.google.api_key:
-                effective_key = settings.search.google.api_key.get_secret_value()
+        effective_key = api_key or _settings_google_key()
         
         provider_kwargs = {}
         if cx:
             provider_kwargs["cx"] = cx
-        return SearchFactory.get_provider("google", api_key=effective_key, **provider_kwargs)
+        return _cached_provider("google", api_key=effective_key, **provider_kwargs)
 
     if provider_type == "simulated":
-        return SearchFactory.get_provider("simulated")
+        return _cached_provider("simulated")
 
     if provider_type == "tavily":
         if api_key:
-            return SearchFactory.get_provider("tavily", api_key=api_key)
+            return _cached_provider("tavily", api_key=api_key)
         else:
             # Will use TAVILY_API_KEY from env
-            return SearchFactory.from_env(default_provider="tavily")
+            return _cached_env_provider(default_provider="tavily")
 
     raise SystemExit(f"Unknown provider '{provider}'. Use 'google', 'tavily', or 'simulated'.")
 
 
-def _save_report_artifacts(run_id: str, query: str, report: str, claims: list, critique_results: list):
+def write_report_file(output_path: str, report: str) -> None:
+    """
+    Write a finished report to a user-chosen output path.
+    
+    Uses a 1 MiB buffer so multi-megabyte reports are encoded and written in
+    large blocks instead of through the default 8 KiB buffer.
+    
+    Args:
+        output_path: Destination file path
+        report: Report text, written as UTF-8
+    
+    Raises:
+        OSError: If the file cannot be written
+    """
+    with open(output_path, "w", encoding="utf-8", buffering=REPORT_WRITE_BUFFER) as f:
+        f.write(report)
+
+
+def _dump_metadata(metadata: dict) -> bytes:
+    """Serialize artifact metadata to compact UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(metadata)
+    return json.dumps(metadata, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _publish_staged(run_dir: Path, staged: dict, durable: bool) -> None:
+    """Move staged temp files into place, removing any left over on failure."""
+    try:
+        for name, tmp_path in staged.items():
+            os.replace(tmp_path, run_dir / name)
+    except BaseException:
+        for tmp_path in staged.values():
+            if tmp_path.exists():
+                tmp_path.unlink()
+        raise
+    
+    if durable:
+        dir_fd = os.open(run_dir, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _copy_cached_artifacts(cached_run_id: str, run_id: str) -> bool:
+    """
+    Republish a cached run's report.md and metadata.json under run_id.
+    
+    The copied metadata points at run_id and records cached_run_id in its
+    bundle_info.
+    
+    Returns:
+        False if the cached run's artifacts are no longer available
+    """
+    source_dir = ARTIFACTS_DIR / cached_run_id
+    try:
+        report = (source_dir / "report.md").read_bytes()
+        metadata = json.loads((source_dir / "metadata.json").read_bytes())
+        bundle_info = metadata["bundle_info"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    if run_id == cached_run_id:
+        return True
+    
+    bundle_info.update(
+        run_id=run_id,
+        generated_at=time.strftime(GENERATED_AT_FORMAT, time.gmtime()),
+        cached_run_id=cached_run_id,
+    )
+    run_dir = ARTIFACTS_DIR / run_id
+    os.makedirs(run_dir, exist_ok=True)
+    staged = {}
+    try:
+        for name, data in (("report.md", report), ("metadata.json", _dump_metadata(metadata))):
+            staged[name] = write_temp(run_dir, name, (data,))
+    except BaseException:
+        for tmp_path in staged.values():
+            tmp_path.unlink()
+        raise
+    _publish_staged(run_dir, staged, False)
+    return True
+
+
+def _run_coroutine(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+    
+    asyncio.run refuses to start while the calling thread already runs an
+    event loop (e.g. execute() called from async code or a notebook), so in
+    that case the coroutine gets a fresh loop on the shared _LOOP_POOL
+    worker. The caller blocks either way.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    return _LOOP_POOL.submit(asyncio.run, coro).result()
+
+
+def _save_report_artifacts(
+    run_id: str,
+    query: str,
+    report: str,
+    claims: list,
+    critique_results: list,
+    durable: bool = False,
+    verified_count: Optional[int] = None,
+) -> None:
     """
     Save report and metadata to the artifacts directory for dashboard access.
     
+    Synchronous wrapper around _save_report_artifacts_async; see there for
+    arguments.
+    """
+    _run_coroutine(
+        _save_report_artifacts_async(
+            run_id, query, report, claims, critique_results, durable=durable, verified_count=verified_count
+        )
+    )
+
+
+async def _save_report_artifacts_async(
+    run_id: str,
+    query: str,
+    report: str,
+    claims: list,
+    critique_results: list,
+    durable: bool = False,
+    verified_count: Optional[int] = None,
+) -> None:
+    """
+    Save report and metadata to the artifacts directory for dashboard access.
+    
+    Both files are staged concurrently as temp files and then moved into
+    place with os.replace, so readers never see a truncated report.md or
+    metadata.json.
+    
     Args:
         run_id: The run ID
         query: The original query
         report: The generated markdown report
         claims: List of all extracted claims
         critique_results: List of critique results
+        durable: If True, fsync the staged files and then the run directory
+            once after both renames
+        verified_count: Number of valid critique results, if the caller has
+            already counted them
     """
-    # Create run-specific directory
+    # Create run-specific directory. Once ARTIFACTS_DIR exists this is a
+    # single mkdir, cheaper inline than a hop to the I/O pool; only the
+    # first run needs makedirs for the missing parents.
     run_dir = ARTIFACTS_DIR / run_id
-    run_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Save report.md
-    report_path = run_dir / "report.md"
-    report_path.write_text(report, encoding='utf-8')
+    try:
+        os.mkdir(run_dir)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        await run_io(os.makedirs, run_dir, exist_ok=True)
     
     # Build metadata
-    verified_count = sum(1 for r in critique_results if r.is_valid)
+    if verified_count is None:
+        verified_count = sum(1 for r in critique_results if r.is_valid)
     
     # Collect unique sources
-    sources_dict = {}
-    for claim in claims:
-        url = getattr(claim, 'source_url', None)
-        if url and url not in sources_dict:
-            sources_dict[url] = {
-                "url": url,
-                "title": getattr(claim, 'source_title', 'Unknown'),
-                "rank": len(sources_dict) + 1,
-                "claims": 1
-            }
-        elif url:
-            sources_dict[url]["claims"] += 1
+    sources = summarize_sources(claims)
     
     metadata = {
         "bundle_info": {
             "run_id": run_id,
-            "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "generated_at": time.strftime(GENERATED_AT_FORMAT, time.gmtime()),
             "query": query,
             "report_title": f"HDRP Research Report: {query}"
         },
@@ -138,21 +404,22 @@ def _save_report_artifacts(run_id: str, query: str, report: str, claims: list, c
             "total_claims": len(claims),
             "verified_claims": verified_count,
             "rejected_claims": len(critique_results) - verified_count,
-            "unique_sources": len(sources_dict)
+            "unique_sources": len(sources)
         },
-        "sources": list(sources_dict.values()),
-        "provenance": {
-            "system": "HDRP",
-            "version": "1.0.0",
-            "pipeline": ["Researcher", "Critic", "Synthesizer"],
-            "verification_enabled": True
-        }
+        "sources": sources,
+        "provenance": _PROVENANCE,
     }
     
-    # Save metadata.json
-    metadata_path = run_dir / "metadata.json"
-    with open(metadata_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2)
+    # Stage both files before publishing either
+    staged = await stage_files(
+        run_dir,
+        {
+            "report.md": (report,),
+            "metadata.json": (_dump_metadata(metadata),),
+        },
+        sync=durable,
+    )
+    await run_io(_publish_staged, run_dir, staged, durable)
 
 
 class PipelineRunner:
@@ -176,21 +443,185 @@ class PipelineRunner:
             search_provider: SearchProvider instance
             run_id: Optional run ID (will generate if not provided)
             verbose: Enable verbose logging
-            progress_callback: Optional callback(stage, percent) for progress updates
+            progress_callback: Optional callback(stage, percent) for progress updates,
+                invoked at most once per DEFAULT_PROGRESS_INTERVAL_S
         """
         self.search_provider = search_provider
         self.verbose = verbose
         self.progress_callback = progress_callback
+        self._progress = ProgressThrottle(progress_callback) if progress_callback else None
         self.console = Console()
         
         # Initialize logger with provided or generated run_id
         self.logger = ResearchLogger("pipeline_runner", run_id=run_id)
         self.run_id = self.logger.run_id
     
+    @functools.cached_property
+    def _critic(self) -> CriticService:
+        """CriticService for this run, created on first use.
+        
+        Queries that return no claims never need one, so it is not built up
+        front with the Researcher.
+        """
+        return CriticService(run_id=self.run_id)
+    
     def _update_progress(self, stage: str, percent: float):
-        """Update progress if callback is set."""
-        if self.progress_callback:
-            self.progress_callback(stage, percent)
+        """Update progress if callback is set (coalesced, see ProgressThrottle)."""
+        if self._progress:
+            self._progress.set(stage, percent)
+    
+    def _write_output(self, report: str, output_path: Optional[str]) -> Optional[dict]:
+        """Write the report to output_path, returning a failure dict on error."""
+        if not output_path:
+            return None
+        try:
+            write_report_file(output_path, report)
+            if self.verbose:
+                self.console.print(f"[green]Report written to {output_path}[/green]")
+        except OSError as exc:
+            error_msg = f"Failed to write report to {output_path}: {exc}"
+            self.console.print(f"[bold red][hdrp][/bold red] {error_msg}")
+            return {
+                "success": False,
+                "run_id": self.run_id,
+                "report": report,
+                "error": error_msg,
+            }
+        return None
+    
+    def _cached_result(self, cached: dict, output_path: Optional[str]) -> Optional[dict]:
+        """
+        Build the result for a response-cache hit.
+        
+        The cached run's artifacts are copied to this run's directory, so the
+        returned run_id can be loaded like any other.
+        
+        Returns:
+            Result dict, or None if the cached run's artifacts are gone and
+            the query must be run again
+        """
+        cached_run_id = cached.get("run_id", "")
+        try:
+            copied = bool(cached_run_id) and _copy_cached_artifacts(cached_run_id, self.run_id)
+        except OSError as e:
+            self.logger.log("cache_artifact_copy_failed", {"error": str(e)})
+            copied = False
+        if not copied:
+            return None
+        
+        self.logger.log("cache_hit", {"cached_run_id": cached_run_id})
+        if self.verbose:
+            self.console.print(
+                f"[bold cyan][hdrp][/bold cyan] Cache hit (run_id={cached_run_id})"
+            )
+        
+        report = cached.get("report", "")
+        write_error = self._write_output(report, output_path)
+        if write_error:
+            return write_error
+        
+        self._update_progress("Completed (cached)", 100)
+        return {
+            "success": True,
+            "run_id": self.run_id,
+            "report": report,
+            "error": "",
+            "stats": cached.get("stats", {}),
+            "cached_run_id": cached.get("run_id", ""),
+        }
+    
+    @functools.cached_property
+    def _provider_id(self) -> str:
+        """Cache-key identity of this runner's search provider."""
+        return _provider_fingerprint(self.search_provider)
+    
+    async def _research_and_screen(
+        self,
+        researcher: ResearcherService,
+        critic: Optional[CriticService],
+        query: str,
+    ) -> Tuple[list, list]:
+        """
+        Research the query and run the Critic's first pass concurrently.
+        
+        Claim batches are streamed from the Researcher (on a worker thread)
+        through a bounded queue and screened as they arrive, so verification of
+        early results overlaps with extraction of later ones. Batches are
+        reassembled in source-rank order before returning.
+        
+        When research_cache_enabled(), claims are served from RESEARCH_CACHE
+        if a fresh entry exists for this provider and query (logged as a
+        claims_extracted event, so the run's dashboard counts match), and
+        stored there after a successful search.
+        
+        If critic is None, the runner's own CriticService is used, created
+        only once the first batch of claims arrives.
+        
+        Returns:
+            (claims, candidates) in source-rank order
+        
+        Raises:
+            Exception: Any error raised by the Researcher or the Critic; on a
+                Critic error the Researcher is stopped before this returns
+        """
+        def screen(batch: list) -> list:
+            return (critic or self._critic).screen(batch, query)
+        
+        use_cache = research_cache_enabled()
+        cache_key = ResearchCache.key(self._provider_id, query)
+        if use_cache:
+            cached_claims = await asyncio.to_thread(RESEARCH_CACHE.get, cache_key)
+            if cached_claims is not None:
+                self.logger.log("research_cache_hit", {"claims": len(cached_claims)})
+                self.logger.log("claims_extracted", {
+                    "source": "research_cache",
+                    "claims_count": len(cached_claims),
+                    "claims": [claim.model_dump() for claim in cached_claims],
+                })
+                return cached_claims, await asyncio.to_thread(screen, cached_claims)
+        
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CLAIM_QUEUE_SIZE)
+        stop = threading.Event()
+        
+        def produce():
+            try:
+                for item in researcher.research_stream(query, source_node_id="root_research"):
+                    if stop.is_set():
+                        break
+                    asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+            finally:
+                asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+        
+        producer = asyncio.ensure_future(asyncio.to_thread(produce))
+        screened = {}
+        try:
+            while (item := await queue.get()) is not None:
+                rank, batch = item
+                screened[rank] = (batch, await asyncio.to_thread(screen, batch))
+        except BaseException:
+            # Stop the producer and empty the queue; after stop is set it
+            # makes at most two more puts (one in flight plus the sentinel),
+            # so it can no longer block on a full queue
+            stop.set()
+            while not queue.empty():
+                queue.get_nowait()
+            await asyncio.gather(producer, return_exceptions=True)
+            raise
+        await producer
+        
+        claims, candidates = [], []
+        for rank in sorted(screened):
+            batch, batch_candidates = screened[rank]
+            claims.extend(batch)
+            candidates.extend(batch_candidates)
+        
+        if use_cache and claims:
+            try:
+                await asyncio.to_thread(RESEARCH_CACHE.put, cache_key, claims)
+            except Exception as e:
+                self.logger.log("research_cache_store_failed", {"error": str(e)})
+        return claims, candidates
     
     def execute(
         self,
@@ -200,6 +631,10 @@ class PipelineRunner:
         """
         Execute the pipeline.
         
+        Blocks until the run finishes. Safe to call from a thread that is
+        running an event loop, though that loop is blocked for the duration;
+        async callers should use asyncio.to_thread(runner.execute, ...).
+        
         Args:
             query: Research query to execute
             output_path: Optional path to write report file
@@ -210,7 +645,8 @@ class PipelineRunner:
                 "run_id": str,
                 "report": str,
                 "error": str,
-                "stats": {...}  # Only on success
+                "stats": {...},  # Only on success
+                "cached_run_id": str  # Only on response-cache hit
             }
         """
         try:
@@ -222,20 +658,25 @@ class PipelineRunner:
             # Log the query for dashboard visibility
             self.logger.log("query_submitted", {"query": query})
             
-            # Initialize services
+            # Short-circuit on an exact or near-duplicate cached query
+            cached = RESPONSE_CACHE.lookup(self._provider_id, query) if response_cache_enabled() else None
+            if cached is not None:
+                cached_result = self._cached_result(cached, output_path)
+                if cached_result is not None:
+                    return cached_result
+            
+            # Initialize the Researcher; the Critic and Synthesizer are only built once there are claims
             self._update_progress("Initializing services", 20)
             researcher = ResearcherService(self.search_provider, run_id=self.run_id)
-            critic = CriticService(run_id=self.run_id)
-            synthesizer = SynthesizerService()
             
             if self.verbose:
                 self.console.print(f"[bold cyan][hdrp][/bold cyan] Researching: [italic]{query}[/italic]")
             
             self._update_progress(f"Researching: {query}", 30)
             
-            # Step 1: Research
+            # Steps 1-2a: Research, screening each batch of claims as it arrives
             try:
-                claims = researcher.research(query, source_node_id="root_research")
+                claims, candidates = _run_coroutine(self._research_and_screen(researcher, None, query))
             except Exception as exc:
                 error_msg = f"Research failed: {exc}"
                 self.console.print(f"[bold red][hdrp][/bold red] {error_msg}")
@@ -262,20 +703,21 @@ class PipelineRunner:
             
             self._update_progress(f"Verifying {len(claims)} claims", 60)
             
-            # Step 2: Critic - verify claims
-            critique_results = critic.verify(claims, task=query)
+            # Step 2b: Critic - settle verdicts across all screened claims
+            critique_results = self._critic.finalize(candidates, task=query)
             verified_count = sum(1 for r in critique_results if r.is_valid)
+            rejected_count = len(critique_results) - verified_count
             
             if self.verbose:
-                rejected_count = len(critique_results) - verified_count
                 self.console.print(
                     f"[bold cyan][hdrp][/bold cyan] Verified={verified_count}, "
                     f"Rejected={rejected_count}"
                 )
             
             self._update_progress("Synthesizing final report", 80)
+            synthesizer = SynthesizerService()
             
-            # Step 3: Synthesize human-readable report
+            # Step 3: Report context for the Synthesizer
             context = {
                 "report_title": f"HDRP Research Report: {query}",
                 "introduction": (
@@ -283,13 +725,32 @@ class PipelineRunner:
                     "pipeline using structured claims with explicit source traceability."
                 ),
             }
-            report = synthesizer.synthesize(critique_results, context=context)
+            
+            # Step 4: Synthesize the full report before anything is written
+            try:
+                report = synthesizer.synthesize(critique_results, context=context)
+            except Exception as exc:
+                error_msg = f"Synthesis failed: {exc}"
+                self.console.print(f"[bold red][hdrp][/bold red] {error_msg}")
+                return {
+                    "success": False,
+                    "run_id": self.run_id,
+                    "report": "",
+                    "error": error_msg,
+                }
             
             self._update_progress("Saving report artifacts", 90)
             
-            # Step 4: Save report artifacts
+            # Step 4b: Save artifacts for the dashboard (failure is non-fatal)
             try:
-                _save_report_artifacts(self.run_id, query, report, claims, critique_results)
+                _save_report_artifacts(
+                    self.run_id,
+                    query,
+                    report,
+                    claims,
+                    critique_results,
+                    verified_count=verified_count,
+                )
                 if self.verbose:
                     self.console.print(f"[bold cyan][hdrp][/bold cyan] Artifacts saved to artifacts/{self.run_id}/")
             except Exception as e:
@@ -298,26 +759,13 @@ class PipelineRunner:
                 self.logger.log("artifact_save_failed", {"error": str(e)})
             
             # Step 5: Output report
-            if output_path:
-                try:
-                    with open(output_path, "w", encoding="utf-8") as f:
-                        f.write(report)
-                    if self.verbose:
-                        self.console.print(f"[green]Report written to {output_path}[/green]")
-                except OSError as exc:
-                    error_msg = f"Failed to write report to {output_path}: {exc}"
-                    self.console.print(f"[bold red][hdrp][/bold red] {error_msg}")
-                    return {
-                        "success": False,
-                        "run_id": self.run_id,
-                        "report": report,
-                        "error": error_msg,
-                    }
+            write_error = self._write_output(report, output_path)
+            if write_error:
+                return write_error
             
             self._update_progress("Completed", 100)
             
-            # Return success
-            return {
+            result = {
                 "success": True,
                 "run_id": self.run_id,
                 "report": report,
@@ -325,9 +773,18 @@ class PipelineRunner:
                 "stats": {
                     "total_claims": len(claims),
                     "verified_claims": verified_count,
-                    "rejected_claims": len(critique_results) - verified_count,
+                    "rejected_claims": rejected_count,
                 }
             }
+            
+            # Step 6: Populate response cache
+            if response_cache_enabled():
+                try:
+                    RESPONSE_CACHE.store(self._provider_id, query, result)
+                except Exception as e:
+                    self.logger.log("cache_store_failed", {"error": str(e)})
+            
+            return result
         
         except Exception as exc:
             error_msg = f"Unexpected error: {exc}"
@@ -338,6 +795,10 @@ class PipelineRunner:
                 "report": "",
                 "error": error_msg,
             }
+        finally:
+            # Deliver the final stage before returning
+            if self._progress:
+                self._progress.flush()
 
 
 class OrchestratedPipelineRunner:
@@ -371,15 +832,16 @@ class OrchestratedPipelineRunner:
         self.verbose = verbose
         self.run_id = run_id
         self.progress_callback = progress_callback
+        self._progress = ProgressThrottle(progress_callback) if progress_callback else None
         self.console = Console()
         
         self.services = []
         self.orchestrator_proc = None
     
     def _update_progress(self, stage: str, percent: float):
-        """Update progress if callback is set."""
-        if self.progress_callback:
-            self.progress_callback(stage, percent)
+        """Update progress if callback is set (coalesced, see ProgressThrottle)."""
+        if self._progress:
+            self._progress.set(stage, percent)
     
     def _start_service_server(self, service_name: str, port: int, script_path: str) -> subprocess.Popen:
         """Starts a Python gRPC service server in the background."""
@@ -567,8 +1029,7 @@ class OrchestratedPipelineRunner:
             
             # Output report
             if output_path:
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(report)
+                write_report_file(output_path, report)
                 if self.verbose:
                     self.console.print(f"[green]Report written to {output_path}[/green]")
             
@@ -634,3 +1095,7 @@ class OrchestratedPipelineRunner:
                     proc.wait(timeout=2)
                 except subprocess.TimeoutExpired:
                     proc.kill()
+            
+            # Deliver the final progress update held back by the throttle
+            if self._progress:
+                self._progress.flush()
@@ -0,0 +1,82 @@
+"""Rate limiting for pipeline progress callbacks.
+
+Progress callbacks may be expensive (e.g. a dashboard pushing every update
+over a socket). ``ProgressThrottle`` forwards at most one update per
+interval: the first update is delivered immediately, later ones within the
+interval overwrite a single pending slot that a timer delivers when the
+interval ends, and ``flush`` cancels that timer and delivers whatever is
+still pending, so nothing older than the final update arrives after it.
+"""
+
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+DEFAULT_PROGRESS_INTERVAL_S = 0.1
+
+ProgressCallback = Callable[[str, float], None]
+
+
+class ProgressThrottle:
+    """Coalesce (stage, percent) updates so the callback fires at most once per interval.
+
+    Only the latest pending update is kept; intermediate ones are dropped.
+    The callback runs on the caller's thread for immediate updates and on a
+    daemon timer thread for deferred ones, never on both at once.
+    """
+
+    def __init__(self, callback: ProgressCallback, interval_s: float = DEFAULT_PROGRESS_INTERVAL_S):
+        """
+        Initialize the throttle.
+
+        Args:
+            callback: Callback(stage, percent) to forward updates to
+            interval_s: Minimum time between callback invocations, in seconds
+        """
+        self.callback = callback
+        self.interval_s = interval_s
+        self._lock = threading.Lock()
+        self._emit_lock = threading.Lock()
+        self._pending: Optional[Tuple[str, float]] = None
+        self._last_emit = float("-inf")
+        self._timer: Optional[threading.Timer] = None
+
+    def set(self, stage: str, percent: float) -> None:
+        """Record the latest progress, delivering it now or at the end of the interval."""
+        with self._lock:
+            self._pending = (stage, percent)
+            wait = self._last_emit + self.interval_s - time.monotonic()
+            if wait > 0:
+                if self._timer is None:
+                    timer = threading.Timer(wait, self._on_timer)
+                    timer.args = (timer,)
+                    timer.daemon = True
+                    self._timer = timer
+                    timer.start()
+                return
+        self._emit()
+
+    def flush(self) -> None:
+        """Deliver any pending update immediately and cancel the timer."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self._emit()
+
+    def _on_timer(self, timer: threading.Timer) -> None:
+        with self._lock:
+            if self._timer is not timer:
+                # Cancelled by flush after it had already fired
+                return
+            self._timer = None
+        self._emit()
+
+    def _emit(self) -> None:
+        with self._emit_lock:
+            with self._lock:
+                update, self._pending = self._pending, None
+                if update is None:
+                    return
+                self._last_emit = time.monotonic()
+            self.callback(*update)
@@ -0,0 +1,260 @@
+"""Two-tier response cache for pipeline reports.
+
+Tier 1 is an exact lookup keyed by the SHA-256 of the search provider and
+normalized query. Tier 2 embeds the query with a small sentence-transformer
+and returns the closest previously cached report for the same provider whose
+cosine similarity clears a threshold. Entries expire after a TTL.
+
+The cache is opt-in: set HDRP_RESPONSE_CACHE=1 to enable it. HDRP_CACHE_DISABLE=1
+bypasses it (and the Researcher claim cache) regardless.
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+_TRUTHY = ("1", "true", "yes")
+
+
+def cache_disabled() -> bool:
+    """Check if the response cache is disabled via environment variable.
+
+    Returns:
+        True if HDRP_CACHE_DISABLE is set to "1", "true" or "yes"
+    """
+    env_val = os.getenv("HDRP_CACHE_DISABLE", "").lower()
+    return env_val in _TRUTHY
+
+
+def response_cache_enabled() -> bool:
+    """Check if the response cache has been opted into via environment variable.
+
+    Returns:
+        True if HDRP_RESPONSE_CACHE is set to "1", "true" or "yes" and
+        HDRP_CACHE_DISABLE is not set
+    """
+    env_val = os.getenv("HDRP_RESPONSE_CACHE", "").lower()
+    return env_val in _TRUTHY and not cache_disabled()
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for exact-match lookups."""
+    return " ".join(query.strip().lower().split())
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write data to a temp file next to path and rename it into place."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+class ResponseCache:
+    """Exact + semantic cache of successful pipeline results.
+
+    Entries are stored as JSON files under ``<cache_dir>/exact``; the
+    semantic index (unit-normalized embeddings plus their exact keys and
+    providers) lives under ``<cache_dir>/semantic``. Every file is written to
+    a temp file and renamed into place. The embedding model is loaded lazily
+    on the first exact miss; if it cannot be loaded, only the exact tier is
+    used.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Root directory for cache files
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            model_name: Sentence-transformer model used for query embeddings
+            ttl_seconds: Age after which an entry is treated as a miss
+        """
+        self.cache_dir = Path(cache_dir)
+        self.similarity_threshold = similarity_threshold
+        self.model_name = model_name
+        self.ttl_seconds = ttl_seconds
+
+        self._exact_dir = self.cache_dir / "exact"
+        self._semantic_dir = self.cache_dir / "semantic"
+        self._lock = threading.Lock()
+
+        # Lazily initialized; False means the encoder is unavailable
+        self._encoder = None
+        self._embeddings: Optional[np.ndarray] = None
+        self._keys: Optional[List[str]] = None
+        self._providers: Optional[List[str]] = None
+
+    @staticmethod
+    def _key(provider: str, normalized: str) -> str:
+        return hashlib.sha256(f"{provider}\x00{normalized}".encode("utf-8")).hexdigest()
+
+    def _encode(self, text: str) -> Optional[np.ndarray]:
+        """Embed text as a unit vector, or return None if no encoder is available."""
+        if self._encoder is None:
+            with self._lock:
+                if self._encoder is None:
+                    try:
+                        from sentence_transformers import SentenceTransformer
+
+                        self._encoder = SentenceTransformer(self.model_name)
+                    except Exception:
+                        self._encoder = False
+        if self._encoder is False:
+            return None
+
+        vector = np.asarray(self._encoder.encode(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _load_index(self) -> None:
+        """Load the semantic index from disk (caller holds the lock)."""
+        if self._keys is not None:
+            return
+
+        keys_path = self._semantic_dir / "keys.json"
+        embeddings_path = self._semantic_dir / "embeddings.npy"
+        self._keys = []
+        self._providers = []
+        self._embeddings = None
+        if keys_path.exists() and embeddings_path.exists():
+            try:
+                index = json.loads(keys_path.read_text(encoding="utf-8"))
+                keys, providers = index["keys"], index["providers"]
+                embeddings = np.load(embeddings_path)
+                if len(keys) == len(providers) == embeddings.shape[0]:
+                    self._keys = keys
+                    self._providers = providers
+                    self._embeddings = embeddings
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+    def _read_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read an entry, or return None if it is missing, corrupt or expired."""
+        path = self._exact_dir / f"{key}.json"
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            return None
+        return entry
+
+    def lookup_exact(self, provider: str, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result by exact (normalized) query only.
+
+        Args:
+            provider: Identifier of the search provider the result came from
+            query: Research query
+
+        Returns:
+            Cached entry dict ({"query", "provider", "run_id", "report",
+            "stats", "created_at"}) or None
+        """
+        return self._read_entry(self._key(provider, normalize_query(query)))
+
+    def lookup(self, provider: str, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result for a query, falling back to semantic search.
+
+        Args:
+            provider: Identifier of the search provider the result came from
+            query: Research query
+
+        Returns:
+            Cached entry dict ({"query", "provider", "run_id", "report",
+            "stats", "created_at"}) or None
+        """
+        entry = self.lookup_exact(provider, query)
+        if entry is not None:
+            return entry
+
+        normalized = normalize_query(query)
+        embedding = self._encode(normalized)
+        if embedding is None:
+            return None
+
+        with self._lock:
+            self._load_index()
+            if self._embeddings is None or provider not in self._providers:
+                return None
+            similarities = self._embeddings @ embedding
+            similarities[np.asarray(self._providers) != provider] = -np.inf
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.similarity_threshold:
+                return None
+            key = self._keys[best]
+
+        return self._read_entry(key)
+
+    def store(self, provider: str, query: str, result: Dict[str, Any]) -> None:
+        """
+        Store a successful pipeline result in both cache tiers.
+
+        Args:
+            provider: Identifier of the search provider the result came from
+            query: Research query
+            result: Result dict returned by PipelineRunner.execute
+        """
+        normalized = normalize_query(query)
+        key = self._key(provider, normalized)
+        entry = {
+            "query": query,
+            "provider": provider,
+            "run_id": result.get("run_id", ""),
+            "report": result.get("report", ""),
+            "stats": result.get("stats", {}),
+            "created_at": time.time(),
+        }
+
+        self._exact_dir.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self._exact_dir / f"{key}.json", json.dumps(entry).encode("utf-8"))
+
+        embedding = self._encode(normalized)
+        if embedding is None:
+            return
+
+        with self._lock:
+            self._load_index()
+            if key in self._keys:
+                return
+            row = embedding[np.newaxis, :]
+            self._embeddings = row if self._embeddings is None else np.vstack([self._embeddings, row])
+            self._keys.append(key)
+            self._providers.append(provider)
+
+            buffer = io.BytesIO()
+            np.save(buffer, self._embeddings)
+            index = {"keys": self._keys, "providers": self._providers}
+            self._semantic_dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write(self._semantic_dir / "embeddings.npy", buffer.getvalue())
+            _atomic_write(self._semantic_dir / "keys.json", json.dumps(index).encode("utf-8"))
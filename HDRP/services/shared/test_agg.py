@@ -0,0 +1,58 @@
+import unittest
+from types import SimpleNamespace
+
+from HDRP.services.shared.agg import group_sources, summarize_sources
+
+
+def _claim(url, title=None):
+    return SimpleNamespace(source_url=url, source_title=title)
+
+
+class TestSummarizeSources(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual(summarize_sources([]), [])
+        self.assertEqual(summarize_sources([_claim(None), _claim("")]), [])
+
+    def test_counts_in_first_seen_order_with_first_title(self):
+        claims = [
+            _claim("https://b.example"),
+            _claim("https://a.example", "A"),
+            _claim(None, "No URL"),
+            _claim("https://b.example", "Later B"),
+            _claim("https://b.example", "Even later B"),
+        ]
+        self.assertEqual(summarize_sources(iter(claims)), [
+            {"url": "https://b.example", "title": "Unknown", "rank": 1, "claims": 3},
+            {"url": "https://a.example", "title": "A", "rank": 2, "claims": 1},
+        ])
+
+    def test_title_read_only_from_first_citing_claim(self):
+        class Repeat:
+            source_url = "https://a.example"
+
+            @property
+            def source_title(self):
+                raise AssertionError("title read for a repeated source")
+
+        claims = [_claim("https://a.example", "A"), Repeat(), Repeat()]
+        self.assertEqual(summarize_sources(claims), [
+            {"url": "https://a.example", "title": "A", "rank": 1, "claims": 3},
+        ])
+
+
+
+class TestGroupSources(unittest.TestCase):
+    def test_groups_by_url_with_first_claim_and_count(self):
+        first_b = _claim("https://b.example", "B")
+        claims = [first_b, _claim("https://a.example", "A"), _claim(""), _claim("https://b.example", "B2")]
+
+        grouped = group_sources(claims)
+
+        self.assertEqual(list(grouped), ["https://b.example", "https://a.example"])
+        self.assertIs(grouped["https://b.example"][0], first_b)
+        self.assertEqual(grouped["https://b.example"][1], 2)
+        self.assertEqual(group_sources([]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
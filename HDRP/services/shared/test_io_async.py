@@ -0,0 +1,72 @@
+import asyncio
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from HDRP.services.shared.io_async import run_io, stage_files, write_temp
+
+
+class TestWriteTemp(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_writes_text_and_bytes_chunks(self):
+        path = write_temp(self.dir, "report.md", ["café ", "☕".encode("utf-8")])
+
+        self.assertEqual(path.read_bytes(), "café ☕".encode("utf-8"))
+        self.assertTrue(path.name.startswith(".report.md."))
+
+    def test_failed_stream_removes_temp_file(self):
+        def chunks():
+            yield "partial"
+            raise RuntimeError("synthesis failed")
+
+        with self.assertRaises(RuntimeError):
+            write_temp(self.dir, "report.md", chunks())
+        self.assertEqual(list(self.dir.iterdir()), [])
+
+
+class TestStageFiles(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_stages_every_file(self):
+        staged = asyncio.run(stage_files(self.dir, {
+            "report.md": ["# Report"],
+            "metadata.json": [b"{}"],
+        }))
+
+        self.assertEqual(sorted(staged), ["metadata.json", "report.md"])
+        self.assertEqual(staged["report.md"].read_text(encoding="utf-8"), "# Report")
+        self.assertEqual(staged["metadata.json"].read_bytes(), b"{}")
+
+    def test_writes_run_on_shared_io_pool(self):
+        def thread_name():
+            return threading.current_thread().name
+
+        self.assertTrue(asyncio.run(run_io(thread_name)).startswith("hdrp-io"))
+
+    def test_one_failure_removes_all_staged_files(self):
+        def failing():
+            raise OSError("disk full")
+            yield  # pragma: no cover
+
+        with self.assertRaises(OSError):
+            asyncio.run(stage_files(self.dir, {
+                "report.md": failing(),
+                "metadata.json": [b"{}"],
+            }))
+        self.assertEqual(list(self.dir.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
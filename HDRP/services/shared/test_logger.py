@@ -106,6 +106,23 @@ class TestJsonFormatter(unittest.TestCase):
         except ValueError:
             self.fail("Timestamp is not valid ISO format")
 
+    def test_format_timestamp_uses_record_creation_time(self):
+        """Verify timestamp reflects when the record was created, not formatted."""
+        record = logging.LogRecord(
+            name="test.logger",
+            level=logging.INFO,
+            pathname="",
+            lineno=0,
+            msg="event",
+            args=(),
+            exc_info=None,
+        )
+        record.created = 1700000000.5
+
+        parsed = json.loads(self.formatter.format(record))
+
+        self.assertEqual(parsed["timestamp"], "2023-11-14T22:13:20.500000Z")
+
     def test_format_uses_defaults_for_missing_attributes(self):
         """Verify defaults when record lacks custom attributes."""
         record = logging.LogRecord(
@@ -0,0 +1,30 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from HDRP.services.shared import mfee
+
+
+class TestMFEE(unittest.TestCase):
+    def test_empty_query_is_direct(self):
+        self.assertEqual(mfee.direct_answer("  ?! "), mfee.NO_CONTENT_REPORT)
+        self.assertEqual(mfee.direct_answer(""), mfee.NO_CONTENT_REPORT)
+
+    def test_fact_kb_query_is_direct_when_enabled(self):
+        report = mfee.direct_answer("What is the capital of France?", use_kb=True)
+        self.assertIn("Paris", report)
+        self.assertTrue(report.startswith("# HDRP Research Report:"))
+
+    def test_fact_kb_is_opt_in(self):
+        with patch.dict(os.environ, {"HDRP_FACT_KB": ""}):
+            self.assertIsNone(mfee.direct_answer("What is the capital of France?"))
+        with patch.dict(os.environ, {"HDRP_FACT_KB": "1"}):
+            self.assertIsNotNone(mfee.direct_answer("What is the capital of France?"))
+
+    def test_research_query_is_rendered(self):
+        self.assertIsNone(mfee.direct_answer("quantum error correction", use_kb=True))
+        self.assertIsNone(mfee.direct_answer("quantum error correction"))
+
+
+if __name__ == "__main__":
+    unittest.main()
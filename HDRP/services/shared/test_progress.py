@@ -0,0 +1,65 @@
+import threading
+import time
+import unittest
+
+from HDRP.services.shared.progress import ProgressThrottle
+
+
+class TestProgressThrottle(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.delivered = threading.Event()
+
+        def callback(stage, percent):
+            self.calls.append((stage, percent))
+            self.delivered.set()
+
+        self.callback = callback
+
+    def test_first_update_is_immediate(self):
+        throttle = ProgressThrottle(self.callback, interval_s=60)
+        throttle.set("Initializing", 10)
+        self.assertEqual(self.calls, [("Initializing", 10)])
+
+    def test_burst_collapses_to_latest_on_flush(self):
+        throttle = ProgressThrottle(self.callback, interval_s=60)
+        throttle.set("Initializing", 10)
+        throttle.set("Researching", 30)
+        throttle.set("Verifying", 60)
+        self.assertEqual(len(self.calls), 1)
+
+        throttle.flush()
+        self.assertEqual(self.calls, [("Initializing", 10), ("Verifying", 60)])
+
+        throttle.flush()
+        self.assertEqual(len(self.calls), 2)
+
+    def test_pending_update_is_delivered_after_interval(self):
+        throttle = ProgressThrottle(self.callback, interval_s=0.05)
+        throttle.set("Initializing", 10)
+        self.delivered.clear()
+        throttle.set("Researching", 30)
+
+        self.assertTrue(self.delivered.wait(timeout=2))
+        self.assertEqual(self.calls[-1], ("Researching", 30))
+
+
+    def test_flush_cancels_pending_timer(self):
+        throttle = ProgressThrottle(self.callback, interval_s=0.05)
+        throttle.set("Initializing", 10)
+        throttle.set("Researching", 30)
+        stale_timer = throttle._timer
+        throttle.set("Completed", 100)
+        throttle.flush()
+
+        self.assertTrue(stale_timer.finished.is_set())
+        # A timer that fired just as flush cancelled it must not deliver anything
+        throttle._pending = ("Researching", 30)
+        throttle._on_timer(stale_timer)
+        time.sleep(0.15)
+
+        self.assertEqual(self.calls, [("Initializing", 10), ("Completed", 100)])
+
+
+if __name__ == "__main__":
+    unittest.main()
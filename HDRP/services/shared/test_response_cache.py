@@ -0,0 +1,135 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+from HDRP.services.shared.response_cache import (
+    ResponseCache,
+    cache_disabled,
+    normalize_query,
+    response_cache_enabled,
+)
+
+PROVIDER = "simulated:abc"
+
+
+class FakeEncoder:
+    """Deterministic bag-of-words encoder standing in for a sentence-transformer."""
+
+    VOCAB = ["capital", "france", "paris", "photosynthesis", "work", "what", "is", "the", "of"]
+
+    def encode(self, text):
+        words = text.replace("?", "").split()
+        return np.array([float(words.count(w)) for w in self.VOCAB], dtype=np.float32)
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmp.name)
+        self.result = {
+            "success": True,
+            "run_id": "run-1",
+            "report": "Paris is the capital of France.",
+            "error": "",
+            "stats": {"total_claims": 2, "verified_claims": 1, "rejected_claims": 1},
+        }
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _cache(self, encoder=None, **kwargs):
+        cache = ResponseCache(self.cache_dir, similarity_threshold=0.9, **kwargs)
+        cache._encoder = encoder if encoder is not None else False
+        return cache
+
+    def test_normalize_query(self):
+        self.assertEqual(normalize_query("  What IS  the capital?\n"), "what is the capital?")
+
+    def test_exact_hit_ignores_case_and_whitespace(self):
+        cache = self._cache()
+        cache.store(PROVIDER, "What is the capital of France?", self.result)
+
+        entry = cache.lookup(PROVIDER, "  what is the CAPITAL of france? ")
+
+        self.assertIsNotNone(entry)
+        self.assertEqual(entry["report"], self.result["report"])
+        self.assertEqual(entry["run_id"], "run-1")
+        self.assertEqual(entry["stats"]["verified_claims"], 1)
+
+    def test_miss_without_encoder(self):
+        cache = self._cache()
+        cache.store(PROVIDER, "What is the capital of France?", self.result)
+
+        self.assertIsNone(cache.lookup(PROVIDER, "How does photosynthesis work?"))
+
+    def test_semantic_hit_above_threshold(self):
+        cache = self._cache(FakeEncoder())
+        cache.store(PROVIDER, "What is the capital of France?", self.result)
+
+        entry = cache.lookup(PROVIDER, "what is the capital of france")
+
+        self.assertIsNotNone(entry)
+        self.assertEqual(entry["report"], self.result["report"])
+
+    def test_semantic_miss_below_threshold(self):
+        cache = self._cache(FakeEncoder())
+        cache.store(PROVIDER, "What is the capital of France?", self.result)
+
+        self.assertIsNone(cache.lookup(PROVIDER, "How does photosynthesis work?"))
+
+    def test_semantic_index_persists(self):
+        self._cache(FakeEncoder()).store(PROVIDER, "What is the capital of France?", self.result)
+
+        reloaded = self._cache(FakeEncoder())
+        entry = reloaded.lookup(PROVIDER, "what is the capital of france")
+
+        self.assertIsNotNone(entry)
+        index = json.loads((self.cache_dir / "semantic" / "keys.json").read_text())
+        self.assertEqual(index["providers"], [PROVIDER])
+        self.assertEqual(len(index["keys"]), 1)
+
+    def test_entries_are_scoped_to_provider(self):
+        cache = self._cache(FakeEncoder())
+        cache.store(PROVIDER, "What is the capital of France?", self.result)
+
+        self.assertIsNone(cache.lookup("google:def", "What is the capital of France?"))
+        self.assertIsNone(cache.lookup("google:def", "what is the capital of france"))
+
+    def test_expired_entry_is_a_miss(self):
+        cache = self._cache(FakeEncoder(), ttl_seconds=60)
+        cache.store(PROVIDER, "What is the capital of France?", self.result)
+
+        with patch("HDRP.services.shared.response_cache.time.time", return_value=time.time() + 120):
+            self.assertIsNone(cache.lookup(PROVIDER, "What is the capital of France?"))
+            self.assertIsNone(cache.lookup(PROVIDER, "what is the capital of france"))
+
+    def test_store_leaves_no_temp_files(self):
+        self._cache(FakeEncoder()).store(PROVIDER, "What is the capital of France?", self.result)
+
+        files = [p.name for p in self.cache_dir.rglob("*") if p.is_file()]
+        self.assertFalse([name for name in files if name.endswith(".tmp")])
+        self.assertEqual(len(files), 3)
+
+    def test_cache_disabled_env(self):
+        with patch.dict(os.environ, {"HDRP_CACHE_DISABLE": "1"}):
+            self.assertTrue(cache_disabled())
+        with patch.dict(os.environ, {"HDRP_CACHE_DISABLE": ""}):
+            self.assertFalse(cache_disabled())
+
+    def test_response_cache_is_opt_in(self):
+        with patch.dict(os.environ, {"HDRP_RESPONSE_CACHE": "", "HDRP_CACHE_DISABLE": ""}):
+            self.assertFalse(response_cache_enabled())
+        with patch.dict(os.environ, {"HDRP_RESPONSE_CACHE": "1", "HDRP_CACHE_DISABLE": ""}):
+            self.assertTrue(response_cache_enabled())
+        with patch.dict(os.environ, {"HDRP_RESPONSE_CACHE": "1", "HDRP_CACHE_DISABLE": "1"}):
+            self.assertFalse(response_cache_enabled())
+
+
+if __name__ == "__main__":
+    unittest.main()
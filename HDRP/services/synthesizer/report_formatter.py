@@ -5,11 +5,14 @@ Generates structured research reports following the Deep Research Report Skeleto
 with full traceability, verification details, and DAG execution summaries.
 """
 
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
+from HDRP.services.shared.agg import group_sources
 from HDRP.services.shared.claims import AtomicClaim, CritiqueResult
 from datetime import datetime, timezone
 import hashlib
 
+_UTC = timezone.utc
+
 
 class DeepResearchReportFormatter:
     """Formats verification results into the Deep Research Report structure."""
@@ -83,6 +86,21 @@ class DeepResearchReportFormatter:
         Returns:
             Formatted markdown report following the Deep Research Report Skeleton
         """
+        return "".join(self.iter_report_sections(verification_results, graph_data, context, run_id, query))
+    
+    def iter_report_sections(
+        self,
+        verification_results: List[CritiqueResult],
+        graph_data: Optional[Dict] = None,
+        context: Optional[Dict] = None,
+        run_id: str = "unknown",
+        query: str = ""
+    ) -> Iterator[str]:
+        """Yield the sections of the Deep Research Report in order.
+        
+        Takes the same arguments as format_full_report; joining the yielded
+        sections produces the same report.
+        """
         if context is None:
             context = {}
         
@@ -95,18 +113,16 @@ class DeepResearchReportFormatter:
         verified_claims = [r.claim for r in verified_results]
         
         # Build report sections
-        report = self._format_header(report_title, run_id, query)
-        report += self._format_executive_synthesis(verified_claims, context)
-        report += self._format_verified_findings(verified_results, context)
-        report += self._format_evidence_traceability(verified_results, rejected_results)
-        report += self._format_dag_execution_summary(graph_data, verified_claims, rejected_results)
-        report += self._format_bibliography(verified_claims)
-        
-        return report
+        yield self._format_header(report_title, run_id, query)
+        yield self._format_executive_synthesis(verified_claims, context)
+        yield self._format_verified_findings(verified_results, context)
+        yield self._format_evidence_traceability(verified_results, rejected_results)
+        yield self._format_dag_execution_summary(graph_data, verified_claims, rejected_results)
+        yield self._format_bibliography(verified_claims)
     
     def _format_header(self, title: str, run_id: str, query: str) -> str:
         """Format report header with metadata."""
-        timestamp = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        timestamp = datetime.now(_UTC).isoformat().replace('+00:00', 'Z')
         
         header = f"# HDRP Deep Research Report\n\n"
         header += f"**Topic**: {query if query else 'Research Investigation'}\n\n"
@@ -407,17 +423,8 @@ class DeepResearchReportFormatter:
         """Format Section 5: Bibliography."""
         section = "## 5. Bibliography\n\n"
         
-        # Collect unique sources with metadata
-        source_map = {}
-        for claim in verified_claims:
-            if claim.source_url:
-                if claim.source_url not in source_map:
-                    source_map[claim.source_url] = {
-                        'title': claim.source_title or "Untitled Source",
-                        'rank': claim.source_rank,
-                        'claim_count': 0
-                    }
-                source_map[claim.source_url]['claim_count'] += 1
+        # Collect unique sources; title and rank come from the first citing claim
+        source_map = group_sources(verified_claims)
         
         if not source_map:
             section += "*No sources available.*\n\n"
@@ -426,14 +433,13 @@ class DeepResearchReportFormatter:
         # Sort by rank (if available), then alphabetically
         sorted_sources = sorted(
             source_map.items(),
-            key=lambda x: (x[1]['rank'] if x[1]['rank'] else 999, x[0])
+            key=lambda x: (x[1][0].source_rank if x[1][0].source_rank else 999, x[0])
         )
         
         # Format bibliography entries
-        for idx, (url, metadata) in enumerate(sorted_sources, 1):
-            title = metadata['title']
-            rank = metadata['rank']
-            claim_count = metadata['claim_count']
+        for idx, (url, (claim, claim_count)) in enumerate(sorted_sources, 1):
+            title = claim.source_title or "Untitled Source"
+            rank = claim.source_rank
             
             section += f"**[{idx}]** {title}\n\n"
             section += f"   {url}\n\n"
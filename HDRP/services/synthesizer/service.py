@@ -1,5 +1,6 @@
 from typing import List, Dict, Optional
 from HDRP.services.shared.claims import AtomicClaim, CritiqueResult
+from HDRP.services.shared.agg import group_sources
 from HDRP.services.shared.errors import SynthesizerError, report_error
 from datetime import datetime, timezone
 import json
@@ -7,6 +8,21 @@ import os
 from pathlib import Path
 from HDRP.services.synthesizer.report_formatter import DeepResearchReportFormatter
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+_UTC = timezone.utc
+
+
+def _dump_json(data) -> bytes:
+    """Serialize an artifact to indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
 class SynthesizerService:
     """Service responsible for composing the final research report.
     
@@ -37,7 +53,7 @@ class SynthesizerService:
             context = {}
         
         if run_id is None:
-            run_id = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+            run_id = datetime.now(_UTC).strftime("%Y%m%d_%H%M%S")
         
         query = context.get("query", "")
         
@@ -54,34 +70,37 @@ class SynthesizerService:
             return report
         
         except Exception as e:
-            # Report generation failed - create minimal fallback report
-            error = SynthesizerError(
-                message=f"Report generation failed: {str(e)}",
-                run_id=run_id,
-                metadata={
-                    "query": query,
-                    "verification_count": len(verification_results),
-                    "original_error": type(e).__name__
-                }
-            )
-            report_error(error, run_id=run_id, service="synthesizer")
-            
-            # Generate minimal fallback report with verified claims
-            verified_claims = [r.claim for r in verification_results if r.is_valid]
-            
-            fallback_report = f"# Research Report\n\n"
-            fallback_report += f"**Query:** {query}\n\n"
-            fallback_report += f"**Note:** Report formatter encountered an error. Showing raw verified claims.\n\n"
-            fallback_report += f"## Verified Claims ({len(verified_claims)} total)\n\n"
-            
-            for idx, claim in enumerate(verified_claims, 1):
-                fallback_report += f"{idx}. {claim.statement}\n"
-                fallback_report += f"   - Source: [{claim.source_url}]({claim.source_url})\n"
-                if claim.support_text:
-                    fallback_report += f"   - Evidence: \"{claim.support_text[:100]}...\"\n"
-                fallback_report += "\n"
-            
-            return fallback_report
+            return self._fallback_report(verification_results, query, run_id, e)
+    
+    def _fallback_report(self, verification_results: List[CritiqueResult], query: str, run_id: str, exc: Exception) -> str:
+        """Report a formatter failure and build a minimal report of verified claims."""
+        error = SynthesizerError(
+            message=f"Report generation failed: {str(exc)}",
+            run_id=run_id,
+            metadata={
+                "query": query,
+                "verification_count": len(verification_results),
+                "original_error": type(exc).__name__
+            }
+        )
+        report_error(error, run_id=run_id, service="synthesizer")
+        
+        # Generate minimal fallback report with verified claims
+        verified_claims = [r.claim for r in verification_results if r.is_valid]
+        
+        fallback_report = f"# Research Report\n\n"
+        fallback_report += f"**Query:** {query}\n\n"
+        fallback_report += f"**Note:** Report formatter encountered an error. Showing raw verified claims.\n\n"
+        fallback_report += f"## Verified Claims ({len(verified_claims)} total)\n\n"
+        
+        for idx, claim in enumerate(verified_claims, 1):
+            fallback_report += f"{idx}. {claim.statement}\n"
+            fallback_report += f"   - Source: [{claim.source_url}]({claim.source_url})\n"
+            if claim.support_text:
+                fallback_report += f"   - Evidence: \"{claim.support_text[:100]}...\"\n"
+            fallback_report += "\n"
+        
+        return fallback_report
     
     def create_artifact_bundle(
         self,
@@ -119,7 +138,7 @@ class SynthesizerService:
         
         # Generate run-specific directory
         if run_id is None:
-            run_id = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+            run_id = datetime.now(_UTC).strftime("%Y%m%d_%H%M%S")
         
         artifact_dir = Path(output_dir) / run_id
         artifact_dir.mkdir(parents=True, exist_ok=True)
@@ -161,18 +180,12 @@ class SynthesizerService:
         # Write DAG JSON (if available)
         if graph_data:
             dag_path = artifact_dir / "dag.json"
-            dag_path.write_text(
-                json.dumps(graph_data, indent=2),
-                encoding='utf-8'
-            )
+            dag_path.write_bytes(_dump_json(graph_data))
             output_files['dag'] = str(dag_path)
         
         # Write metadata JSON
         metadata_path = artifact_dir / "metadata.json"
-        metadata_path.write_text(
-            json.dumps(metadata, indent=2),
-            encoding='utf-8'
-        )
+        metadata_path.write_bytes(_dump_json(metadata))
         output_files['metadata'] = str(metadata_path)
         
         # Write structured claims JSON
@@ -191,10 +204,7 @@ class SynthesizerService:
             for c in verified_claims
         ]
         claims_path = artifact_dir / "claims.json"
-        claims_path.write_text(
-            json.dumps(claims_data, indent=2),
-            encoding='utf-8'
-        )
+        claims_path.write_bytes(_dump_json(claims_data))
         output_files['claims'] = str(claims_path)
         
         return output_files
@@ -221,20 +231,10 @@ class SynthesizerService:
         latest = max(timestamps) if timestamps else None
         
         # Calculate statistics
-        unique_sources = set(c.source_url for c in verified_claims if c.source_url)
         avg_confidence = sum(c.confidence for c in verified_claims) / len(verified_claims) if verified_claims else 0
         
-        # Source distribution
-        source_stats = {}
-        for claim in verified_claims:
-            if claim.source_url:
-                if claim.source_url not in source_stats:
-                    source_stats[claim.source_url] = {
-                        'title': claim.source_title or 'Untitled',
-                        'rank': claim.source_rank,
-                        'claim_count': 0
-                    }
-                source_stats[claim.source_url]['claim_count'] += 1
+        # Source distribution (title and rank from the first citing claim)
+        source_stats = group_sources(verified_claims)
         
         # Node distribution
         node_stats = {}
@@ -268,7 +268,7 @@ class SynthesizerService:
         metadata = {
             'bundle_info': {
                 'run_id': run_id,
-                'generated_at': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+                'generated_at': datetime.now(_UTC).isoformat().replace('+00:00', 'Z'),
                 'query': query,
                 'report_title': context.get('report_title', 'Deep Research Report')
             },
@@ -276,7 +276,7 @@ class SynthesizerService:
                 'total_claims': len(verification_results),
                 'verified_claims': len(verified_claims),
                 'rejected_claims': len(rejected_claims),
-                'unique_sources': len(unique_sources),
+                'unique_sources': len(source_stats),
                 'average_confidence': round(avg_confidence, 3),
                 'research_period': {
                     'start': earliest,
@@ -287,11 +287,11 @@ class SynthesizerService:
             'sources': [
                 {
                     'url': url,
-                    'title': stats['title'],
-                    'rank': stats['rank'],
-                    'claims': stats['claim_count']
+                    'title': claim.source_title or 'Untitled',
+                    'rank': claim.source_rank,
+                    'claims': claim_count
                 }
-                for url, stats in source_stats.items()
+                for url, (claim, claim_count) in source_stats.items()
             ],
             'dag_nodes': {
                 node_id: count
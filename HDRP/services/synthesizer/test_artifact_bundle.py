@@ -10,8 +10,10 @@ import json
 import os
 import shutil
 from pathlib import Path
+from unittest import mock
 from datetime import datetime, timezone
 
+from HDRP.services.synthesizer import service as synthesizer_service
 from HDRP.services.synthesizer.service import SynthesizerService
 from HDRP.services.synthesizer.humanizer import ReportHumanizer
 from HDRP.services.synthesizer.dag_visualizer import DAGVisualizer
@@ -495,6 +497,26 @@ class TestDAGVisualizerModule(unittest.TestCase):
         self.assertIn("Rectangles", result)
 
 
+
+class TestArtifactJsonSerialization(unittest.TestCase):
+    """Test the orjson fast path for bundle JSON files."""
+    
+    @unittest.skipIf(synthesizer_service.orjson is None, "orjson not installed")
+    def test_orjson_output_matches_stdlib_fallback(self):
+        """Test orjson and stdlib json produce the same indented output."""
+        data = {
+            'nodes': [{'id': 'n1', 'confidence': 0.5, 'tags': []}],
+            'edges': [],
+            'verification_enabled': True,
+            'parent': None,
+        }
+        fast = synthesizer_service._dump_json(data)
+        with mock.patch.object(synthesizer_service, 'orjson', None):
+            fallback = synthesizer_service._dump_json(data)
+        
+        self.assertEqual(fast, fallback)
+
+
 if __name__ == "__main__":
     unittest.main()
 
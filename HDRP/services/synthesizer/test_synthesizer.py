@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 from HDRP.services.synthesizer.service import SynthesizerService
 from HDRP.services.shared.claims import AtomicClaim, CritiqueResult
 
@@ -82,5 +83,15 @@ class TestSynthesizerService(unittest.TestCase):
         # If support_text is missing or equals statement, no quote block is shown
         self.assertNotIn("> *\"", report) # Should not generate support block for missing support
 
+    def test_synthesize_falls_back_on_formatter_error(self):
+        claim = AtomicClaim(statement="Surviving fact.", source_url="http://site.com/5")
+        with mock.patch.object(
+            self.synthesizer.formatter, "_format_bibliography", side_effect=RuntimeError("boom")
+        ), mock.patch("HDRP.services.synthesizer.service.report_error"):
+            report = self.synthesizer.synthesize([self._wrap(claim)], run_id="run-1")
+
+        self.assertIn("Report formatter encountered an error", report)
+        self.assertIn("Surviving fact.", report)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -19,10 +19,26 @@ from typing import Generator, List, Tuple, Optional
 
 import pytest
 
+from HDRP.services.shared.pipeline_runner import clear_provider_cache
 from HDRP.tools.search.simulated import SimulatedSearchProvider
 from HDRP.tools.search.factory import SearchFactory
 
 
+@pytest.fixture(autouse=True)
+def disable_pipeline_caches(monkeypatch):
+    """Keep the persistent response and research caches out of every test."""
+    monkeypatch.setenv("HDRP_CACHE_DISABLE", "1")
+    monkeypatch.delenv("HDRP_RESPONSE_CACHE", raising=False)
+
+
+@pytest.fixture(autouse=True)
+def reset_provider_cache():
+    """Build search providers afresh in each test, so patched factories take effect."""
+    clear_provider_cache()
+    yield
+    clear_provider_cache()
+
+
 @pytest.fixture
 def simulated_search_provider() -> SimulatedSearchProvider:
     """Provides a deterministic simulated search provider for testing."""
@@ -42,8 +42,9 @@ class TestResearcherTimeouts:
             time.sleep(2)  # Slow but not timeout-inducing
             return []
         
+        # PipelineRunner consumes research_stream, not research
         mocker.patch(
-            'HDRP.services.researcher.service.ResearcherService.research',
+            'HDRP.services.researcher.service.ResearcherService.research_stream',
             side_effect=slow_research
         )
         
@@ -67,8 +68,9 @@ class TestResearcherTimeouts:
     ):
         """Test that researcher timeout returns a proper error response."""
         # Mock researcher to raise TimeoutError
+        # PipelineRunner consumes research_stream, not research
         mocker.patch(
-            'HDRP.services.researcher.service.ResearcherService.research',
+            'HDRP.services.researcher.service.ResearcherService.research_stream',
             side_effect=TimeoutError("Search provider timeout")
         )
         
@@ -4,7 +4,10 @@ Unit tests for HDRP CLI module.
 Tests _build_search_provider, execute_pipeline, and run_query_programmatic functions.
 """
 
+import io
 import os
+import subprocess
+import sys
 import unittest
 from unittest.mock import MagicMock, patch, Mock
 
@@ -12,14 +15,40 @@ from HDRP.cli import (
     execute_pipeline,
     run_query_programmatic,
 )
-from HDRP.services.shared.pipeline_runner import build_search_provider
+from HDRP.services.shared.pipeline_runner import build_search_provider, clear_provider_cache
 from HDRP.tools.search.base import SearchError
 from HDRP.tools.search.api_key_validator import APIKeyError
 
 
+class TestLazyImports(unittest.TestCase):
+    """Tests for the deferred imports in HDRP.cli."""
+
+    def test_import_does_not_load_rich_or_pipeline(self):
+        """Importing the CLI module should not pull in rich or the services."""
+        code = (
+            "import sys, HDRP.cli; "
+            "print(any(m == 'rich' or m.startswith(('rich.', 'HDRP.services')) for m in sys.modules))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "False")
+
+    def test_lazy_attributes_resolve_on_access(self):
+        """Lazily declared names resolve to the real objects."""
+        import HDRP.cli as cli
+        from HDRP.services.shared.pipeline_runner import PipelineRunner
+
+        self.assertIs(cli.PipelineRunner, PipelineRunner)
+        with self.assertRaises(AttributeError):
+            cli.not_a_real_attribute
+
+
 class TestBuildSearchProvider(unittest.TestCase):
     """Tests for _build_search_provider function."""
 
+    def setUp(self):
+        clear_provider_cache()
+        self.addCleanup(clear_provider_cache)
+
     @patch('HDRP.services.shared.pipeline_runner.SearchFactory')
     def test_empty_provider_uses_from_env(self, mock_factory):
         """Verify empty provider string delegates to from_env()."""
@@ -38,6 +67,36 @@ class TestBuildSearchProvider(unittest.TestCase):
         
         mock_factory.from_env.assert_called_once()
 
+    @patch('HDRP.services.shared.pipeline_runner.SearchFactory')
+    def test_from_env_provider_is_reused(self, mock_factory):
+        """Verify the auto-selected provider is built once and reused."""
+        mock_factory.from_env.return_value = MagicMock()
+        
+        first = build_search_provider(None, None)
+        second = build_search_provider("", None)
+        
+        self.assertIs(first, second)
+        mock_factory.from_env.assert_called_once()
+
+    @patch('HDRP.services.shared.pipeline_runner.SearchFactory')
+    @patch('HDRP.services.shared.pipeline_runner.get_settings')
+    def test_from_env_provider_rebuilt_when_settings_change(self, mock_get_settings, mock_factory):
+        """Verify the auto-selected provider is keyed on the resolved provider and key."""
+        mock_factory.from_env.side_effect = lambda **kwargs: MagicMock()
+        settings = mock_get_settings.return_value
+        settings.search.provider = "simulated"
+
+        simulated = build_search_provider(None, None)
+        settings.search.provider = "google"
+        settings.search.google.api_key.get_secret_value.return_value = "key-1"
+        google = build_search_provider(None, None)
+        settings.search.google.api_key.get_secret_value.return_value = "key-2"
+        rotated = build_search_provider(None, None)
+
+        self.assertIsNot(simulated, google)
+        self.assertIsNot(google, rotated)
+        self.assertEqual(mock_factory.from_env.call_count, 3)
+
     @patch('HDRP.services.shared.pipeline_runner.SearchFactory')
     def test_whitespace_provider_uses_from_env(self, mock_factory):
         """Verify whitespace-only provider delegates to from_env()."""
@@ -58,7 +117,7 @@ class TestBuildSearchProvider(unittest.TestCase):
 
     @patch.dict(os.environ, {"GOOGLE_API_KEY": "env-api-key"})
     @patch('HDRP.services.shared.pipeline_runner.SearchFactory')
-    @patch('HDRP.services.shared.settings.get_settings')
+    @patch('HDRP.services.shared.pipeline_runner.get_settings')
     def test_google_provider_uses_env_key_when_none_provided(self, mock_get_settings, mock_factory):
         """Verify Google provider uses key from settings when none provided."""
         mock_factory.get_provider.return_value = MagicMock()
@@ -72,6 +131,23 @@ class TestBuildSearchProvider(unittest.TestCase):
         
         mock_factory.get_provider.assert_called_once_with("google", api_key="env-api-key")
 
+    @patch('HDRP.services.shared.pipeline_runner.SearchFactory')
+    @patch('HDRP.services.shared.pipeline_runner.get_settings')
+    def test_settings_key_rotation_rebuilds_provider(self, mock_get_settings, mock_factory):
+        """Verify a rotated settings key builds a new provider without clearing the cache."""
+        mock_factory.get_provider.side_effect = lambda *args, **kwargs: MagicMock()
+        secret = mock_get_settings.return_value.search.google.api_key
+        secret.get_secret_value.return_value = "key-1"
+        
+        first = build_search_provider("google", None)
+        reused = build_search_provider("google", None)
+        secret.get_secret_value.return_value = "key-2"
+        rotated = build_search_provider("google", None)
+        
+        self.assertIs(first, reused)
+        self.assertIsNot(first, rotated)
+        mock_factory.get_provider.assert_called_with("google", api_key="key-2")
+
     @patch('HDRP.services.shared.pipeline_runner.SearchFactory')
     def test_simulated_provider_ignores_key(self, mock_factory):
         """Verify simulated provider ignores API key."""
@@ -100,13 +176,56 @@ class TestBuildSearchProvider(unittest.TestCase):
         build_search_provider("Simulated", None)
         mock_factory.get_provider.assert_called_with("simulated")
 
+    @patch('HDRP.services.shared.pipeline_runner.SearchFactory')
+    def test_provider_reused_for_same_key(self, mock_factory):
+        """Verify explicit providers are cached per API key."""
+        mock_factory.get_provider.side_effect = lambda *args, **kwargs: MagicMock()
+        
+        first = build_search_provider("google", "key-a")
+        second = build_search_provider("google", "key-a")
+        other = build_search_provider("google", "key-b")
+        
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(mock_factory.get_provider.call_count, 2)
+
+
+class TestPrintReport(unittest.TestCase):
+    """Tests for _print_report."""
+
+    @patch('HDRP.cli._console')
+    def test_piped_stdout_gets_raw_bytes(self, mock_console):
+        """Verify reports bypass Rich when stdout is not a terminal."""
+        from HDRP.cli import _print_report
+
+        buffer = io.BytesIO()
+        stdout = MagicMock(buffer=buffer)
+        stdout.isatty.return_value = False
+        with patch('HDRP.cli.sys.stdout', stdout):
+            _print_report("# Report\n\n[bold]not markup[/bold] – ok")
+
+        self.assertEqual(buffer.getvalue(), "# Report\n\n[bold]not markup[/bold] – ok\n".encode("utf-8"))
+        mock_console.assert_not_called()
+
+    @patch('HDRP.cli._console')
+    def test_terminal_uses_rich_console(self, mock_console):
+        """Verify reports are printed through Rich on a terminal."""
+        from HDRP.cli import _print_report
+
+        stdout = MagicMock()
+        stdout.isatty.return_value = True
+        with patch('HDRP.cli.sys.stdout', stdout):
+            _print_report("# Report")
+
+        mock_console.return_value.print.assert_called_once_with("# Report", markup=False)
+
 
 class TestRunPipeline(unittest.TestCase):
     """Tests for execute_pipeline function."""
 
-    @patch('HDRP.cli.build_search_provider')
-    @patch('HDRP.cli.PipelineRunner')
-    @patch('HDRP.cli.console')
+    @patch('HDRP.services.shared.pipeline_runner.build_search_provider')
+    @patch('HDRP.services.shared.pipeline_runner.PipelineRunner')
+    @patch('HDRP.cli._console')
     def test_returns_zero_on_success(
         self, mock_console, mock_runner_class, mock_build_provider
     ):
@@ -133,8 +252,8 @@ class TestRunPipeline(unittest.TestCase):
         
         self.assertEqual(result, 0)
 
-    @patch('HDRP.cli.build_search_provider')
-    @patch('HDRP.cli.console')
+    @patch('HDRP.services.shared.pipeline_runner.build_search_provider')
+    @patch('HDRP.cli._console')
     def test_returns_one_on_search_error(self, mock_console, mock_build_provider):
         """Verify returns 1 on SearchError."""
         mock_build_provider.side_effect = SearchError("API error")
@@ -149,8 +268,8 @@ class TestRunPipeline(unittest.TestCase):
         
         self.assertEqual(result, 1)
 
-    @patch('HDRP.cli.build_search_provider')
-    @patch('HDRP.cli.console')
+    @patch('HDRP.services.shared.pipeline_runner.build_search_provider')
+    @patch('HDRP.cli._console')
     def test_returns_one_on_api_key_error(self, mock_console, mock_build_provider):
         """Verify returns 1 on APIKeyError."""
         mock_build_provider.side_effect = APIKeyError("Missing API key")
@@ -165,9 +284,9 @@ class TestRunPipeline(unittest.TestCase):
         
         self.assertEqual(result, 1)
 
-    @patch('HDRP.cli.build_search_provider')
-    @patch('HDRP.cli.PipelineRunner')
-    @patch('HDRP.cli.console')
+    @patch('HDRP.services.shared.pipeline_runner.build_search_provider')
+    @patch('HDRP.services.shared.pipeline_runner.PipelineRunner')
+    @patch('HDRP.cli._console')
     def test_returns_zero_on_no_claims(
         self, mock_console, mock_runner_class, mock_build_provider
     ):
@@ -193,9 +312,9 @@ class TestRunPipeline(unittest.TestCase):
         
         self.assertEqual(result, 0)
 
-    @patch('HDRP.cli.build_search_provider')
-    @patch('HDRP.cli.PipelineRunner')
-    @patch('HDRP.cli.console')
+    @patch('HDRP.services.shared.pipeline_runner.build_search_provider')
+    @patch('HDRP.services.shared.pipeline_runner.PipelineRunner')
+    @patch('HDRP.cli._console')
     def test_returns_one_on_research_exception(
         self, mock_console, mock_runner_class, mock_build_provider
     ):
@@ -225,8 +344,8 @@ class TestRunPipeline(unittest.TestCase):
 class TestRunQueryProgrammatic(unittest.TestCase):
     """Tests for run_query_programmatic function."""
 
-    @patch('HDRP.cli.build_search_provider')
-    @patch('HDRP.cli.PipelineRunner')
+    @patch('HDRP.services.shared.pipeline_runner.build_search_provider')
+    @patch('HDRP.services.shared.pipeline_runner.PipelineRunner')
     def test_returns_success_dict(
         self, mock_runner_class, mock_build_provider
     ):
@@ -259,7 +378,7 @@ class TestRunQueryProgrammatic(unittest.TestCase):
         self.assertEqual(result["report"], "Generated report")
         self.assertEqual(result["error"], "")
 
-    @patch('HDRP.cli.build_search_provider')
+    @patch('HDRP.services.shared.pipeline_runner.build_search_provider')
     def test_returns_error_on_provider_failure(self, mock_build_provider):
         """Verify returns error dict on provider failure."""
         mock_build_provider.side_effect = SearchError("Provider failed")
@@ -273,8 +392,8 @@ class TestRunQueryProgrammatic(unittest.TestCase):
         self.assertIn("Configuration Error", result["error"])
         self.assertEqual(result["report"], "")
 
-    @patch('HDRP.cli.build_search_provider')
-    @patch('HDRP.cli.PipelineRunner')
+    @patch('HDRP.services.shared.pipeline_runner.build_search_provider')
+    @patch('HDRP.services.shared.pipeline_runner.PipelineRunner')
     def test_returns_stats_on_success(
         self, mock_runner_class, mock_build_provider
     ):
@@ -302,8 +421,8 @@ class TestRunQueryProgrammatic(unittest.TestCase):
         self.assertEqual(result["stats"]["verified_claims"], 3)
         self.assertEqual(result["stats"]["rejected_claims"], 2)
 
-    @patch('HDRP.cli.build_search_provider')
-    @patch('HDRP.cli.PipelineRunner')
+    @patch('HDRP.services.shared.pipeline_runner.build_search_provider')
+    @patch('HDRP.services.shared.pipeline_runner.PipelineRunner')
     def test_handles_no_claims_gracefully(
         self, mock_runner_class, mock_build_provider
     ):
@@ -324,8 +443,8 @@ class TestRunQueryProgrammatic(unittest.TestCase):
         self.assertTrue(result["success"])
         self.assertIn("No information found", result["report"])
 
-    @patch('HDRP.cli.build_search_provider')
-    @patch('HDRP.cli.PipelineRunner')
+    @patch('HDRP.services.shared.pipeline_runner.build_search_provider')
+    @patch('HDRP.services.shared.pipeline_runner.PipelineRunner')
     def test_returns_error_on_research_failure(
         self, mock_runner_class, mock_build_provider
     ):
@@ -346,8 +465,8 @@ class TestRunQueryProgrammatic(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertIn("Research failed", result["error"])
 
-    @patch('HDRP.cli.build_search_provider')
-    @patch('HDRP.cli.PipelineRunner')
+    @patch('HDRP.services.shared.pipeline_runner.build_search_provider')
+    @patch('HDRP.services.shared.pipeline_runner.PipelineRunner')
     def test_uses_provided_run_id(
         self, mock_runner_class, mock_build_provider
     ):
@@ -375,8 +494,8 @@ class TestRunQueryProgrammatic(unittest.TestCase):
             progress_callback=None,
         )
 
-    @patch('HDRP.cli.build_search_provider')
-    @patch('HDRP.cli.PipelineRunner')
+    @patch('HDRP.services.shared.pipeline_runner.build_search_provider')
+    @patch('HDRP.services.shared.pipeline_runner.PipelineRunner')
     def test_calls_progress_callback(
         self, mock_runner_class, mock_build_provider
     ):
@@ -406,7 +525,31 @@ class TestRunQueryProgrammatic(unittest.TestCase):
         # Verify callback was passed to runner
         self.assertIsNotNone(captured_callback)
 
-    @patch('HDRP.cli.build_search_provider')
+    @patch.dict(os.environ, {"HDRP_FACT_KB": "1"})
+    @patch('HDRP.services.shared.pipeline_runner._save_report_artifacts')
+    @patch('HDRP.services.shared.pipeline_runner.build_search_provider')
+    @patch('HDRP.services.shared.pipeline_runner.PipelineRunner')
+    def test_trivial_query_skips_pipeline(self, mock_runner_class, mock_build_provider, mock_save):
+        """Verify fact-table queries are answered without running the pipeline when opted in."""
+        result = run_query_programmatic(query="What is the capital of France?")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["route"], "direct")
+        self.assertIn("Paris", result["report"])
+        self.assertTrue(result["run_id"])
+        mock_runner_class.assert_not_called()
+        mock_save.assert_called_once_with(
+            result["run_id"], "What is the capital of France?", result["report"], [], []
+        )
+
+    def test_trivial_query_still_reports_unknown_provider(self):
+        """Verify provider configuration errors win over the direct-answer route."""
+        result = run_query_programmatic(query="?!", provider="bogus")
+
+        self.assertFalse(result["success"])
+        self.assertIn("Unknown provider", result["error"])
+
+    @patch('HDRP.services.shared.pipeline_runner.build_search_provider')
     def test_handles_unexpected_exception(self, mock_build_provider):
         """Verify handles unexpected exceptions."""
         mock_build_provider.side_effect = RuntimeError("Unexpected error")
@@ -3,9 +3,10 @@
 import threading
 import time
 import unittest
+from datetime import datetime
 from unittest.mock import patch
 
-from HDRP.dashboard.api import QueryExecutor, ExecutionStatus
+from HDRP.dashboard.api import ExecutionProgress, ExecutionStatus, QueryExecutor
 
 
 class TestQueryExecutor(unittest.TestCase):
@@ -69,6 +70,218 @@ class TestQueryExecutor(unittest.TestCase):
         self.assertIsNotNone(status)
         self.assertEqual(status["status"], ExecutionStatus.CANCELLED.value)
 
+    @patch("HDRP.dashboard.api.QueryExecutor._execute_python_mode")
+    def test_queries_beyond_pool_size_wait_and_can_be_cancelled(self, mock_run):
+        """Runs past max_workers stay queued; cancelling one never starts it."""
+        executor = QueryExecutor(max_workers=1)
+        release = threading.Event()
+        started = []
+
+        def fake_run(run_id, *_args, **_kwargs):
+            started.append(run_id)
+            release.wait(2.0)
+            return {"success": True, "report": "ok"}
+
+        mock_run.side_effect = fake_run
+
+        first = executor.execute_query("first", provider="simulated", mode="python")
+        second = executor.execute_query("second", provider="simulated", mode="python")
+        self.assertEqual(executor.get_status(second)["status"], ExecutionStatus.QUEUED.value)
+
+        self.assertTrue(executor.cancel_query(second))
+        release.set()
+        executor._pool.shutdown(wait=True)
+
+        self.assertEqual(started, [first])
+        self.assertEqual(executor.get_status(first)["status"], ExecutionStatus.COMPLETED.value)
+        self.assertEqual(executor.get_status(second)["status"], ExecutionStatus.CANCELLED.value)
+
+    @patch("HDRP.dashboard.api.QueryExecutor._execute_python_mode")
+    def test_shutdown_cancels_running_and_queued_queries(self, mock_run):
+        """shutdown() drops queued runs and signals running ones to stop."""
+        executor = QueryExecutor(max_workers=1)
+        started = threading.Event()
+        stopped = threading.Event()
+
+        def fake_run(run_id, query, provider, api_key, verbose, cancel_flag):
+            started.set()
+            cancel_flag.wait(2.0)
+            stopped.set()
+            return {"success": True, "report": "ok"}
+
+        mock_run.side_effect = fake_run
+
+        first = executor.execute_query("first", provider="simulated", mode="python")
+        second = executor.execute_query("second", provider="simulated", mode="python")
+        self.assertTrue(started.wait(2.0))
+
+        executor.shutdown()
+
+        self.assertTrue(stopped.wait(1.0))
+        self.assertEqual(mock_run.call_count, 1)
+        self.assertEqual(executor.get_status(first)["status"], ExecutionStatus.CANCELLED.value)
+        self.assertEqual(executor.get_status(second)["status"], ExecutionStatus.CANCELLED.value)
+        with self.assertRaises(RuntimeError):
+            executor.execute_query("third", provider="simulated", mode="python")
+
+    @patch("HDRP.dashboard.api.QueryExecutor._execute_python_mode")
+    def test_run_ids_are_unhyphenated_hex(self, mock_run):
+        """Run IDs double as directory names and use the compact hex form."""
+        mock_run.return_value = {"success": True, "report": "ok"}
+
+        run_id = self.executor.execute_query("test query", provider="simulated", mode="python")
+
+        self.assertRegex(run_id, r"^[0-9a-f]{32}$")
+        self._wait_for_status(run_id, ExecutionStatus.COMPLETED.value)
+
+    def test_update_progress_sets_only_dataclass_fields(self):
+        """Unknown keys and non-field attributes are ignored."""
+        progress = ExecutionProgress(
+            status=ExecutionStatus.RUNNING, run_id="run-1", query="q", started_at=datetime.now()
+        )
+        self.executor._executions["run-1"] = progress
+
+        self.executor._update_progress(
+            "run-1", progress_percent=50.0, to_dict="clobbered", not_a_field=1
+        )
+
+        self.assertEqual(progress.progress_percent, 50.0)
+        self.assertTrue(callable(progress.to_dict))
+        self.assertFalse(hasattr(progress, "not_a_field"))
+
+
+    def test_execution_progress_is_slotted(self):
+        """Records reject attributes that are not declared fields."""
+        progress = ExecutionProgress(
+            status=ExecutionStatus.RUNNING, run_id="run-1", query="q", started_at=datetime.now()
+        )
+
+        self.assertFalse(hasattr(progress, "__dict__"))
+        with self.assertRaises(AttributeError):
+            progress.not_a_field = 1
+
+    def test_pipeline_progress_is_queued_and_applied(self):
+        """Pipeline callbacks enqueue; late updates never touch finished runs."""
+        for run_id, status in [("done", ExecutionStatus.COMPLETED), ("live", ExecutionStatus.RUNNING)]:
+            self.executor._executions[run_id] = ExecutionProgress(
+                status=status, run_id=run_id, query="q", started_at=datetime.now()
+            )
+            self.executor._publish(self.executor._executions[run_id])
+
+        self.executor._progress_callback("done", threading.Event())("Late stage", 90.0)
+        self.executor._progress_callback("live", threading.Event())("Verifying", 60.0)
+
+        deadline = time.time() + 2.0
+        while time.time() < deadline and self.executor.get_status("live")["current_stage"] != "Verifying":
+            time.sleep(0.01)
+        self.assertEqual(self.executor.get_status("live")["progress_percent"], 60.0)
+        self.assertEqual(self.executor.get_status("done")["current_stage"], "Initializing...")
+
+    def test_cancelled_run_stops_enqueuing_progress(self):
+        """Callbacks are dropped once the cancel flag is set."""
+        cancel_flag = threading.Event()
+        cancel_flag.set()
+
+        self.executor._progress_callback("run-1", cancel_flag)("Researching", 30.0)
+
+        self.assertTrue(self.executor._progress_q.empty())
+
+    def test_get_status_returns_published_snapshots(self):
+        """Updates publish a new snapshot instead of mutating the old one."""
+        progress = ExecutionProgress(
+            status=ExecutionStatus.RUNNING, run_id="run-1", query="q", started_at=datetime.now()
+        )
+        self.executor._executions["run-1"] = progress
+        self.executor._update_progress("run-1", progress_percent=10.0)
+        before = self.executor.get_status("run-1")
+
+        self.executor._update_progress("run-1", progress_percent=60.0, current_stage="Verifying")
+        after = self.executor.get_status("run-1")
+
+        self.assertEqual(before["progress_percent"], 10.0)
+        self.assertEqual(after["progress_percent"], 60.0)
+        self.assertEqual(after["current_stage"], "Verifying")
+        self.assertEqual(after["status"], ExecutionStatus.RUNNING.value)
+        self.assertIsNone(self.executor.get_status("missing"))
+
+
+    def test_unchanged_update_keeps_published_snapshot(self):
+        """Repeating the current stage and percent does not republish."""
+        progress = ExecutionProgress(
+            status=ExecutionStatus.RUNNING, run_id="run-1", query="q", started_at=datetime.now()
+        )
+        self.executor._executions["run-1"] = progress
+        self.executor._update_progress("run-1", current_stage="Initializing services", progress_percent=20.0)
+        snapshot = self.executor.get_status("run-1")
+
+        self.executor._update_progress("run-1", current_stage="Initializing services", progress_percent=20.0)
+
+        self.assertIs(self.executor.get_status("run-1"), snapshot)
+
+    def test_incremental_snapshot_matches_to_dict(self):
+        """Patched snapshots stay identical to a full to_dict() rebuild."""
+        progress = ExecutionProgress(
+            status=ExecutionStatus.QUEUED, run_id="run-1", query="q", started_at=datetime.now()
+        )
+        self.executor._executions["run-1"] = progress
+        self.executor._publish(progress)
+
+        self.executor._update_progress(
+            "run-1", status=ExecutionStatus.COMPLETED, progress_percent=100.0,
+            report="done", completed_at=datetime.now(), started_ts=0.0,
+        )
+
+        self.assertEqual(self.executor.get_status("run-1"), progress.to_dict())
+
+    def test_get_all_executions_returns_snapshots(self):
+        """Listing returns the same snapshots get_status serves."""
+        progress = ExecutionProgress(
+            status=ExecutionStatus.RUNNING, run_id="run-1", query="q", started_at=datetime.now()
+        )
+        self.executor._executions["run-1"] = progress
+        self.executor._publish(progress)
+
+        self.assertEqual(self.executor.get_all_executions(), [self.executor.get_status("run-1")])
+
+    def test_oldest_finished_executions_evicted_beyond_cap(self):
+        """New runs evict the oldest finished records, never running ones."""
+        executor = QueryExecutor(max_executions=2)
+        for run_id, status in [("running", ExecutionStatus.RUNNING), ("done-1", ExecutionStatus.COMPLETED)]:
+            executor._executions[run_id] = ExecutionProgress(
+                status=status, run_id=run_id, query="q", started_at=datetime.now()
+            )
+            executor._publish(executor._executions[run_id])
+
+        with patch.object(QueryExecutor, "_execute_in_background"), \
+                patch.object(QueryExecutor, "_schedule_cleanup") as mock_schedule:
+            new_id = executor.execute_query("q")
+            executor.execute_query("q2")
+
+        self.assertIn("running", executor._executions)
+        self.assertIn(new_id, executor._executions)
+        self.assertNotIn("done-1", executor._executions)
+        self.assertIsNone(executor.get_status("done-1"))
+        mock_schedule.assert_called_once()
+
+    def test_cleanup_removes_only_old_finished_executions(self):
+        """Age is judged from started_ts; running executions are kept."""
+        old = time.time() - 48 * 3600
+        for run_id, status, started_ts in [
+            ("old-done", ExecutionStatus.COMPLETED, old),
+            ("old-running", ExecutionStatus.RUNNING, old),
+            ("new-done", ExecutionStatus.COMPLETED, time.time()),
+        ]:
+            self.executor._executions[run_id] = ExecutionProgress(
+                status=status, run_id=run_id, query="q",
+                started_at=datetime.fromtimestamp(started_ts), started_ts=started_ts,
+            )
+            self.executor._publish(self.executor._executions[run_id])
+
+        self.executor.cleanup_old_executions(max_age_hours=24)
+
+        self.assertEqual(sorted(self.executor._executions), ["new-done", "old-running"])
+        self.assertIsNone(self.executor.get_status("old-done"))
+
 
 if __name__ == "__main__":
     unittest.main()
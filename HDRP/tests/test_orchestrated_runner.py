@@ -16,5 +16,25 @@ class TestOrchestratedRunnerStub(unittest.TestCase):
         self.assertTrue(True)
 
 
+class TestOrchestratedRunnerProgress(unittest.TestCase):
+    """Progress callbacks are coalesced like PipelineRunner's."""
+
+    def test_rapid_updates_are_coalesced(self):
+        from HDRP.services.shared.pipeline_runner import OrchestratedPipelineRunner
+
+        callback = MagicMock()
+        runner = OrchestratedPipelineRunner(progress_callback=callback)
+        runner._progress.interval_s = 60.0
+
+        for percent in range(5, 40, 5):
+            runner._update_progress(f"Step {percent}", percent)
+        runner._progress.flush()
+
+        self.assertEqual(
+            [c.args for c in callback.call_args_list],
+            [("Step 5", 5), ("Step 35", 35)],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,342 @@
+"""Tests for pipeline artifact persistence."""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from HDRP.services.researcher.cache import ResearchCache
+from HDRP.services.shared.response_cache import ResponseCache
+from HDRP.services.shared import pipeline_runner
+from HDRP.services.shared.claims import AtomicClaim
+
+
+class TestSaveReportArtifacts(unittest.TestCase):
+    """Tests for _save_report_artifacts."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        patcher = patch.object(pipeline_runner, "ARTIFACTS_DIR", Path(self._tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    def _save(self, **kwargs):
+        claims = [SimpleNamespace(source_url="https://a.example", source_title="A")]
+        critiques = [SimpleNamespace(is_valid=True)]
+        pipeline_runner._save_report_artifacts("run-1", "q", "# Report", claims, critiques, **kwargs)
+        return Path(self._tmp.name) / "run-1"
+
+    def test_writes_report_and_metadata_without_temp_files(self):
+        run_dir = self._save()
+
+        self.assertEqual(sorted(p.name for p in run_dir.iterdir()), ["metadata.json", "report.md"])
+        self.assertEqual((run_dir / "report.md").read_text(encoding="utf-8"), "# Report")
+        metadata = json.loads((run_dir / "metadata.json").read_text(encoding="utf-8"))
+        self.assertEqual(metadata["statistics"]["verified_claims"], 1)
+
+    def test_metadata_includes_shared_provenance(self):
+        run_dir = self._save()
+
+        metadata = json.loads((run_dir / "metadata.json").read_text(encoding="utf-8"))
+        self.assertEqual(metadata["provenance"], {
+            "system": "HDRP",
+            "version": "1.0.0",
+            "pipeline": ["Researcher", "Critic", "Synthesizer"],
+            "verification_enabled": True,
+        })
+
+    def test_sources_are_deduplicated_in_first_seen_order(self):
+        claims = [
+            SimpleNamespace(source_url="https://b.example", source_title=None),
+            SimpleNamespace(source_url="https://a.example", source_title="A"),
+            SimpleNamespace(source_url="https://b.example", source_title="B"),
+            SimpleNamespace(source_url=None, source_title="No URL"),
+        ]
+        pipeline_runner._save_report_artifacts("run-1", "q", "# Report", claims, [])
+
+        metadata_path = Path(self._tmp.name) / "run-1" / "metadata.json"
+        sources = json.loads(metadata_path.read_text(encoding="utf-8"))["sources"]
+        self.assertEqual(sources, [
+            {"url": "https://b.example", "title": "Unknown", "rank": 1, "claims": 2},
+            {"url": "https://a.example", "title": "A", "rank": 2, "claims": 1},
+        ])
+
+    @unittest.skipIf(pipeline_runner.orjson is None, "orjson not installed")
+    def test_metadata_serialization_matches_stdlib_fallback(self):
+        metadata = {"query": "café ☕", "sources": [{"url": "https://a.example", "rank": 1}]}
+        fast = pipeline_runner._dump_metadata(metadata)
+        with patch.object(pipeline_runner, "orjson", None):
+            fallback = pipeline_runner._dump_metadata(metadata)
+
+        self.assertEqual(fast, fallback)
+
+    def test_uses_precomputed_verified_count(self):
+        class Uncountable:
+            @property
+            def is_valid(self):
+                raise AssertionError("verdicts were recounted")
+
+        critiques = [Uncountable(), Uncountable()]
+        pipeline_runner._save_report_artifacts("run-1", "q", "# Report", [], critiques, verified_count=1)
+
+        metadata_path = Path(self._tmp.name) / "run-1" / "metadata.json"
+        statistics = json.loads(metadata_path.read_text(encoding="utf-8"))["statistics"]
+        self.assertEqual((statistics["verified_claims"], statistics["rejected_claims"]), (1, 1))
+
+    def test_durable_save_overwrites_existing_files(self):
+        self._save()
+        run_dir = self._save(durable=True)
+
+        self.assertEqual(sorted(p.name for p in run_dir.iterdir()), ["metadata.json", "report.md"])
+
+    def test_writes_report_text_as_utf8(self):
+        report = "# Report\n\nCafé prices rose 5%.\n"
+
+        pipeline_runner._save_report_artifacts("run-1", "q", report, [], [])
+
+        run_dir = Path(self._tmp.name) / "run-1"
+        self.assertEqual((run_dir / "report.md").read_text(encoding="utf-8"), report)
+
+    def test_creates_missing_artifacts_dir(self):
+        nested = Path(self._tmp.name) / "not" / "yet" / "created"
+        with patch.object(pipeline_runner, "ARTIFACTS_DIR", nested):
+            pipeline_runner._save_report_artifacts("run-1", "q", "# Report", [], [])
+
+        self.assertEqual((nested / "run-1" / "report.md").read_text(encoding="utf-8"), "# Report")
+
+    def test_failed_replace_leaves_no_temp_files(self):
+        with patch.object(pipeline_runner.os, "replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self._save()
+
+        run_dir = Path(self._tmp.name) / "run-1"
+        self.assertEqual(list(run_dir.iterdir()), [])
+
+
+class TestWriteOutput(unittest.TestCase):
+    """Tests for writing reports to an explicit output path."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.runner = pipeline_runner.PipelineRunner(MagicMock(), run_id="run-out")
+
+    def test_writes_report_as_utf8(self):
+        output_path = Path(self._tmp.name) / "report.md"
+
+        self.assertIsNone(self.runner._write_output("# Café ☕\n", str(output_path)))
+        self.assertEqual(output_path.read_bytes(), "# Café ☕\n".encode("utf-8"))
+
+    def test_unwritable_path_returns_failure(self):
+        output_path = Path(self._tmp.name) / "missing" / "report.md"
+
+        result = self.runner._write_output("# Report", str(output_path))
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["report"], "# Report")
+        self.assertIn("Failed to write report", result["error"])
+
+
+class TestResearchCacheIntegration(unittest.TestCase):
+    """Tests for the Researcher claim cache in PipelineRunner."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        cache = ResearchCache(Path(self._tmp.name) / "research.sqlite3")
+        for patcher in (
+            patch.object(pipeline_runner, "RESEARCH_CACHE", cache),
+            patch.dict(os.environ, {"HDRP_RESEARCH_CACHE": "1", "HDRP_CACHE_DISABLE": ""}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.runner = pipeline_runner.PipelineRunner(MagicMock(), run_id="run-cache")
+        self.claims = [AtomicClaim(statement="Water boils at 100C.", source_url="https://a.example")]
+        self.researcher = MagicMock()
+        self.researcher.research_stream.side_effect = lambda *a, **k: iter([(1, self.claims)])
+        self.critic = MagicMock()
+        self.critic.screen.side_effect = lambda claims, task: list(claims)
+
+    def _run(self):
+        return asyncio.run(self.runner._research_and_screen(self.researcher, self.critic, "boiling point"))
+
+    def test_repeat_query_skips_researcher(self):
+        first_claims, _ = self._run()
+        second_claims, candidates = self._run()
+
+        self.assertEqual(self.researcher.research_stream.call_count, 1)
+        self.assertEqual([c.statement for c in second_claims], [c.statement for c in first_claims])
+        self.assertEqual(len(candidates), 1)
+
+    def test_cache_hit_logs_claims_extracted(self):
+        self._run()
+        self.runner.logger = MagicMock()
+        self._run()
+
+        events = {c.args[0]: c.args[1] for c in self.runner.logger.log.call_args_list}
+        self.assertEqual(events["claims_extracted"]["claims_count"], 1)
+        self.assertEqual(events["claims_extracted"]["claims"][0]["statement"], "Water boils at 100C.")
+
+    def test_cache_disabled_always_researches(self):
+        with patch.dict(os.environ, {"HDRP_CACHE_DISABLE": "1"}):
+            self._run()
+            self._run()
+
+        self.assertEqual(self.researcher.research_stream.call_count, 2)
+
+
+class TestResearchAndScreen(unittest.TestCase):
+    """Tests for the Researcher -> Critic hand-off in PipelineRunner."""
+
+    def setUp(self):
+        patcher = patch.dict(os.environ, {"HDRP_CACHE_DISABLE": "1"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.runner = pipeline_runner.PipelineRunner(MagicMock(), run_id="run-screen")
+        self.researcher = MagicMock()
+        self.researched = []
+
+        def research_stream(*args, **kwargs):
+            for rank in range(1, 4 * pipeline_runner.CLAIM_QUEUE_SIZE):
+                self.researched.append(rank)
+                yield rank, [AtomicClaim(statement=f"Claim {rank}.", source_url="https://a.example")]
+
+        self.researcher.research_stream.side_effect = research_stream
+
+    def test_critic_error_stops_researcher(self):
+        critic = MagicMock()
+        critic.screen.side_effect = RuntimeError("critic down")
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(asyncio.wait_for(
+                self.runner._research_and_screen(self.researcher, critic, "q"), timeout=5,
+            ))
+
+        self.assertLess(len(self.researched), 4 * pipeline_runner.CLAIM_QUEUE_SIZE - 1)
+
+    def test_runs_inside_running_event_loop(self):
+        async def thread_name():
+            return threading.current_thread().name
+
+        async def call_from_loop():
+            return [pipeline_runner._run_coroutine(thread_name()) for _ in range(2)]
+
+        first, second = asyncio.run(call_from_loop())
+        self.assertTrue(first.startswith("hdrp-run"))
+        self.assertEqual(first, second)
+
+
+class TestResponseCacheIntegration(unittest.TestCase):
+    """Tests for response-cache hits in PipelineRunner.execute."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.artifacts_dir = Path(self._tmp.name)
+        cache = ResponseCache(self.artifacts_dir / "_cache")
+        cache._encoder = False
+        for patcher in (
+            patch.object(pipeline_runner, "ARTIFACTS_DIR", self.artifacts_dir),
+            patch.object(pipeline_runner, "RESPONSE_CACHE", cache),
+            patch.dict(os.environ, {"HDRP_RESPONSE_CACHE": "1", "HDRP_CACHE_DISABLE": ""}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.provider = MagicMock()
+        provider_id = pipeline_runner._provider_fingerprint(self.provider)
+        cache.store(provider_id, "boiling point", {
+            "run_id": "run-cached",
+            "report": "# Cached",
+            "stats": {"total_claims": 1, "verified_claims": 1, "rejected_claims": 0},
+        })
+
+    @patch.object(pipeline_runner, "ResearcherService")
+    def test_hit_republishes_cached_artifacts(self, mock_researcher):
+        pipeline_runner._save_report_artifacts("run-cached", "boiling point", "# Cached", [], [])
+
+        result = pipeline_runner.PipelineRunner(self.provider, run_id="run-new").execute("boiling point")
+
+        self.assertTrue(result["success"])
+        self.assertEqual((result["run_id"], result["cached_run_id"]), ("run-new", "run-cached"))
+        run_dir = self.artifacts_dir / "run-new"
+        self.assertEqual((run_dir / "report.md").read_text(encoding="utf-8"), "# Cached")
+        metadata = json.loads((run_dir / "metadata.json").read_text(encoding="utf-8"))
+        self.assertEqual(metadata["bundle_info"]["run_id"], "run-new")
+        mock_researcher.assert_not_called()
+
+    @patch.object(pipeline_runner, "ResearcherService")
+    def test_hit_without_artifacts_reruns_query(self, mock_researcher):
+        mock_researcher.return_value.research_stream.return_value = iter([])
+
+        result = pipeline_runner.PipelineRunner(self.provider, run_id="run-new").execute("boiling point")
+
+        self.assertNotIn("cached_run_id", result)
+        mock_researcher.assert_called_once()
+
+
+class TestEmptyResultsFastPath(unittest.TestCase):
+    """Tests for PipelineRunner.execute when research finds nothing."""
+
+    @patch.dict(os.environ, {"HDRP_CACHE_DISABLE": "1"})
+    @patch.object(pipeline_runner, "SynthesizerService")
+    @patch.object(pipeline_runner, "CriticService")
+    @patch.object(pipeline_runner, "ResearcherService")
+    def test_no_claims_skips_critic_and_synthesizer(self, mock_researcher, mock_critic, mock_synthesizer):
+        mock_researcher.return_value.research_stream.return_value = iter([])
+        runner = pipeline_runner.PipelineRunner(MagicMock(), run_id="run-empty")
+
+        result = runner.execute("an obscure query")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["report"], "No information found for this query.")
+        mock_critic.assert_not_called()
+        mock_synthesizer.assert_not_called()
+
+
+
+@patch.dict(os.environ, {"HDRP_CACHE_DISABLE": "1"})
+@patch.object(pipeline_runner, "CriticService")
+@patch.object(pipeline_runner, "ResearcherService")
+class TestSynthesisFailures(unittest.TestCase):
+    """Synthesizer errors fail the run; artifact I/O errors do not."""
+
+    def _runner(self, mock_researcher, mock_critic):
+        claims = [AtomicClaim(statement="Water boils at 100C.", source_url="https://a.example")]
+        mock_researcher.return_value.research_stream.side_effect = lambda *a, **k: iter([(1, claims)])
+        mock_critic.return_value.screen.side_effect = lambda batch, task: list(batch)
+        mock_critic.return_value.finalize.return_value = [SimpleNamespace(is_valid=True)]
+        return pipeline_runner.PipelineRunner(MagicMock(), run_id="run-synth")
+
+    @patch.object(pipeline_runner, "_save_report_artifacts")
+    @patch.object(pipeline_runner, "SynthesizerService")
+    def test_synthesizer_error_fails_run(self, mock_synthesizer, mock_save, mock_researcher, mock_critic):
+        mock_synthesizer.return_value.synthesize.side_effect = RuntimeError("formatter down")
+
+        result = self._runner(mock_researcher, mock_critic).execute("boiling point")
+
+        self.assertFalse(result["success"])
+        self.assertIn("Synthesis failed", result["error"])
+        mock_save.assert_not_called()
+
+    @patch.object(pipeline_runner, "_save_report_artifacts", side_effect=OSError("disk full"))
+    @patch.object(pipeline_runner, "SynthesizerService")
+    def test_artifact_save_error_keeps_report(self, mock_synthesizer, mock_save, mock_researcher, mock_critic):
+        mock_synthesizer.return_value.synthesize.return_value = "# Report"
+
+        result = self._runner(mock_researcher, mock_critic).execute("boiling point")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["report"], "# Report")
+        mock_synthesizer.return_value.synthesize.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
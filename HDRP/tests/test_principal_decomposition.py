@@ -114,6 +114,22 @@ class TestPrincipalServiceDecomposition(unittest.TestCase):
         # Verify linear edges
         self.assertEqual(len(result.graph.edges), 2)
 
+    def test_requests_share_prompt_cache_prefix(self):
+        """Verify the static prompt prefix is sent with a stable prompt_cache_key."""
+        self._set_mock_response({
+            "subtasks": [{"id": "a", "query": "q", "dependencies": [], "entities": []}]
+        })
+
+        self.service.decompose_query("First query", "test-run")
+        self.service.decompose_query("Second query", "test-run")
+
+        first, second = self.mock_client.chat.completions.create.call_args_list
+        self.assertEqual(first.kwargs["messages"][:-1], second.kwargs["messages"][:-1])
+        self.assertEqual(
+            first.kwargs["extra_body"]["prompt_cache_key"],
+            second.kwargs["extra_body"]["prompt_cache_key"],
+        )
+
     def test_parse_llm_response_single_subtask(self):
         """Simple query returns single subtask."""
         mock_response = {
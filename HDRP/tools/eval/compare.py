@@ -143,15 +143,19 @@ class ComparisonRunner:
         researcher = ResearcherService(self.search_provider, run_id=run_id)
         critic = CriticService(run_id=run_id)
         
-        # Step 1: Research (extract claims)
-        raw_claims = researcher.research(question, source_node_id="root_research")
+        # Steps 1-2: Research, screening each batch of claims as it is extracted
+        raw_claims = []
+        
+        def claim_batches():
+            for _, batch in researcher.research_stream(question, source_node_id="root_research"):
+                raw_claims.extend(batch)
+                yield batch
+        
+        critique_results = critic.verify_stream(claim_batches(), task=question)
         
         # Record search call (ResearcherService makes 1 search call)
         collector.record_search_call(0.0)  # Latency tracked internally
         
-        # Step 2: Critic (verify claims)
-        critique_results = critic.verify(raw_claims, task=question)
-        
         # Collect metrics
         metrics = collector.collect_from_hdrp(
             query=question,
@@ -351,8 +351,7 @@ def save_optimization_results(
     
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w') as f:
-        json.dump(output, f, indent=2)
+    output_file.write_text(json.dumps(output, indent=2), encoding='utf-8')
     
     print(f"\nResults saved to: {output_file}")
 
@@ -1,5 +1,5 @@
 import abc
-from typing import List
+from typing import List, Optional
 
 from .schema import SearchResponse
 
@@ -47,5 +47,13 @@ class SearchProvider(abc.ABC):
         pass
 
 class SearchError(Exception):
-    """Base exception for search tool failures."""
-    pass
+    """Base exception for search tool failures.
+    
+    Attributes:
+        retry_after: Seconds the provider asked callers to wait before
+            retrying (e.g. a throttled request's Retry-After), or None
+    """
+
+    def __init__(self, message: str = "", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
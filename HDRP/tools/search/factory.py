@@ -1,5 +1,7 @@
 from typing import Any, Optional
 
+from HDRP.services.shared.settings import get_settings
+
 from .base import SearchProvider, SearchError
 from .simulated import SimulatedSearchProvider
 from .api_key_validator import APIKeyError
@@ -49,8 +51,6 @@ class SearchFactory:
             strict_mode: If True, raise errors on misconfiguration instead of
                         falling back to simulated provider.
         """
-        from HDRP.services.shared.settings import get_settings
-        
         settings = get_settings()
         provider_type = settings.search.provider or default_provider
 
@@ -1,3 +1,4 @@
+import functools
 import json
 import os
 import ssl
@@ -15,6 +16,31 @@ GOOGLE_SEARCH_URL = os.getenv(
     "GOOGLE_API_URL", "https://www.googleapis.com/customsearch/v1"
 )
 
+# HTTP statuses that indicate throttling; their Retry-After is passed on
+RETRYABLE_STATUS_CODES = (429, 503)
+
+# Upper bound on a Retry-After delay passed on to callers, in seconds
+MAX_BACKOFF_SECONDS = 30.0
+
+
+
+@functools.lru_cache(maxsize=8)
+def _ssl_context(ca_bundle: Optional[str]) -> Optional[ssl.SSLContext]:
+    """Build (once per CA bundle) the TLS context used for API requests.
+
+    Loading a CA bundle parses every certificate in it, so the context is
+    shared across searches instead of being rebuilt per call. Without an
+    explicit bundle, certifi is used when available, else the system default.
+    """
+    if ca_bundle:
+        return ssl.create_default_context(cafile=ca_bundle)
+    try:
+        import certifi
+
+        return ssl.create_default_context(cafile=certifi.where())
+    except Exception:
+        return None
+
 
 class GoogleSearchProvider(SearchProvider):
     """Search provider backed by Google Custom Search JSON API.
@@ -26,6 +52,9 @@ class GoogleSearchProvider(SearchProvider):
         * Both can be passed explicitly or via environment variables
     - Latency / timeouts:
         * `timeout_seconds` is a hard client-side timeout for the HTTP request
+        * Each search makes a single request; a 429/503 raises SearchError
+          with the server's Retry-After, and retries are left to the caller
+          (ResearcherService)
     - Query scope:
         * Results are filtered by the Custom Search Engine configuration
         * CSE can be configured for specific sites or the entire web
@@ -70,6 +99,26 @@ class GoogleSearchProvider(SearchProvider):
         )
         return is_valid
 
+    @staticmethod
+    def _retry_after(exc: error.HTTPError) -> Optional[float]:
+        """Seconds a throttled response asked us to wait, or None if unknown."""
+        if exc.code not in RETRYABLE_STATUS_CODES:
+            return None
+        retry_after = exc.headers.get("Retry-After") if exc.headers else None
+        try:
+            return min(float(retry_after), MAX_BACKOFF_SECONDS) if retry_after else None
+        except ValueError:
+            return None
+
+    def _fetch(self, req: request.Request, ssl_context) -> tuple:
+        """Perform the HTTP request and return (status, body)."""
+        with request.urlopen(
+            req,
+            timeout=self.timeout_seconds,
+            context=ssl_context,
+        ) as resp:
+            return resp.getcode(), resp.read().decode("utf-8")
+
     def search(self, query: str, max_results: int = None) -> SearchResponse:
         if max_results is None:
             max_results = self.default_max_results
@@ -99,31 +148,15 @@ class GoogleSearchProvider(SearchProvider):
         start_time = time.time()
 
         try:
-            ssl_context = None
             ca_bundle = (
                 os.getenv("GOOGLE_CA_BUNDLE")
                 or os.getenv("SSL_CERT_FILE")
                 or os.getenv("REQUESTS_CA_BUNDLE")
             )
-            if ca_bundle:
-                ssl_context = ssl.create_default_context(cafile=ca_bundle)
-            else:
-                try:
-                    import certifi
-
-                    ssl_context = ssl.create_default_context(cafile=certifi.where())
-                except Exception:
-                    ssl_context = None
-
-            with request.urlopen(
-                req,
-                timeout=self.timeout_seconds,
-                context=ssl_context,
-            ) as resp:
-                status = resp.getcode()
-                raw_body = resp.read().decode("utf-8")
+            ssl_context = _ssl_context(ca_bundle or None)
+            status, raw_body = self._fetch(req, ssl_context)
         except error.HTTPError as e:
-            raise SearchError(f"Google API HTTP error: {e.code}") from e
+            raise SearchError(f"Google API HTTP error: {e.code}", retry_after=self._retry_after(e)) from e
         except error.URLError as e:
             raise SearchError(f"Google API connection error: {e.reason}") from e
         except Exception as e:
@@ -184,6 +184,71 @@ class TestGoogleProvider(unittest.TestCase):
         with self.assertRaises(SearchError):
             provider.search("trigger error")
 
+    @patch("HDRP.tools.search.google.request.urlopen")
+    def test_google_rate_limit_passes_retry_after_without_retrying(self, mock_urlopen):
+        from HDRP.tools.search import GoogleSearchProvider
+        from urllib import error as urlerror
+
+        mock_urlopen.side_effect = urlerror.HTTPError(
+            url="https://www.googleapis.com/customsearch/v1",
+            code=429,
+            msg="Too Many Requests",
+            hdrs={"Retry-After": "120"},
+            fp=None,
+        )
+
+        provider = GoogleSearchProvider(
+            api_key="test-google-key",
+            cx="test-cx-id",
+            validate_key=False,
+        )
+        with self.assertRaises(SearchError) as raised:
+            provider.search("throttled query")
+
+        self.assertEqual(mock_urlopen.call_count, 1)
+        self.assertEqual(raised.exception.retry_after, 30.0)
+
+    @patch("HDRP.tools.search.google.request.urlopen")
+    def test_google_non_throttle_error_has_no_retry_after(self, mock_urlopen):
+        from HDRP.tools.search import GoogleSearchProvider
+        from urllib import error as urlerror
+
+        mock_urlopen.side_effect = urlerror.HTTPError(
+            url="https://www.googleapis.com/customsearch/v1",
+            code=403,
+            msg="Forbidden",
+            hdrs={"Retry-After": "5"},
+            fp=None,
+        )
+
+        provider = GoogleSearchProvider(
+            api_key="test-google-key",
+            cx="test-cx-id",
+            validate_key=False,
+        )
+        with self.assertRaises(SearchError) as raised:
+            provider.search("forbidden query")
+
+        self.assertIsNone(raised.exception.retry_after)
+
+    @patch("HDRP.tools.search.google.request.urlopen")
+    def test_google_reuses_ssl_context_across_searches(self, mock_urlopen):
+        from HDRP.tools.search import GoogleSearchProvider
+
+        mock_urlopen.side_effect = lambda *args, **kwargs: self._mock_urlopen({"items": []})
+
+        provider = GoogleSearchProvider(
+            api_key="test-google-key",
+            cx="test-cx-id",
+            validate_key=False,
+        )
+        provider.search("first query")
+        provider.search("second query")
+
+        contexts = [c.kwargs["context"] for c in mock_urlopen.call_args_list]
+        self.assertEqual(len(contexts), 2)
+        self.assertIs(contexts[0], contexts[1])
+
 
 class TestSearchFactoryFromEnv(unittest.TestCase):
     """Tests for SearchFactory.from_env() with various env configurations."""
@@ -22,15 +22,20 @@ Examples:
 
 import argparse
 import json
-import statistics
+import math
+import os
 import time
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 import sys
 from typing import Dict, Iterable, List
 
+import numpy as np
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
+
 from HDRP.services.critic.nli_verifier import NLIVerifier
 from HDRP.services.critic.service import CriticService
 from HDRP.services.shared.pipeline_runner import PipelineRunner, build_search_provider
@@ -61,72 +66,224 @@ BENCHMARK_QUERIES = [
 ]
 
 
+DEFAULT_PERCENTILES = [50.0, 90.0, 95.0, 99.0]
+
+
+class LatencyHistogram:
+    """Streaming log-bucketed latency histogram (HDR-histogram style).
+
+    Each sample is recorded in O(1) into a bucket whose width is a fixed
+    fraction (``precision``) of its value, so memory is bounded by the
+    dynamic range of the samples rather than their number, and percentiles
+    are answered within ``precision`` relative error using nearest-rank.
+    """
+
+    def __init__(self, precision: float = 0.01, min_value: float = 1e-6):
+        self._log_base = math.log1p(precision)
+        self._min_value = min_value
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def record(self, value: float) -> None:
+        index = int(math.log(max(value, self._min_value) / self._min_value) / self._log_base)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, pct: float) -> float:
+        if not self.count:
+            raise ValueError("No samples recorded")
+        rank = max(1, math.ceil(pct / 100.0 * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                midpoint = self._min_value * math.exp((index + 0.5) * self._log_base)
+                return min(max(midpoint, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict:
+        """Serialize the histogram as a compact, JSON-friendly digest."""
+        return {
+            "precision": math.expm1(self._log_base),
+            "min_value": self._min_value,
+            "min": self.min,
+            "max": self.max,
+            "buckets": [[index, self._counts[index]] for index in sorted(self._counts)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencyHistogram":
+        """Rebuild a histogram from ``to_dict`` output."""
+        histogram = cls(precision=data["precision"], min_value=data["min_value"])
+        histogram._counts = {int(index): int(count) for index, count in data["buckets"]}
+        histogram.count = sum(histogram._counts.values())
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
+
+
+def _percentile_key(pct: float) -> str:
+    return f"p{pct:g}"
+
+
+def _result_percentiles(results: Dict) -> List[float]:
+    """Return the percentiles reported in a saved benchmark result, ascending."""
+    if "percentiles" in results:
+        return sorted(results["percentiles"])
+    # Older result files only carry the p* keys themselves
+    percentiles = []
+    for key in results.get("latencies", {}):
+        if key.startswith("p"):
+            try:
+                percentiles.append(float(key[1:]))
+            except ValueError:
+                continue
+    return sorted(percentiles)
+
+
+def _parse_percentiles(value: str) -> List[float]:
+    try:
+        percentiles = [float(item) for item in value.split(",") if item.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid percentile list: {value}")
+    if not percentiles or any(not 0 < pct <= 100 for pct in percentiles):
+        raise argparse.ArgumentTypeError("Percentiles must be in the range (0, 100]")
+    return percentiles
+
+
+def _run_benchmark_query(query: str, search_provider: SearchProvider) -> Dict:
+    """Run a single benchmark query and time it.
+
+    Returns a dict with the elapsed latency plus either the pipeline result
+    or the exception raised while executing it.
+    """
+    start_time = time.perf_counter()
+    try:
+        runner = PipelineRunner(
+            search_provider=search_provider,
+            verbose=False,
+        )
+        result = runner.execute(query=query)
+        return {"elapsed": time.perf_counter() - start_time, "result": result, "exception": None}
+    except Exception as exc:
+        return {"elapsed": time.perf_counter() - start_time, "result": None, "exception": exc}
+
+
 def run_pipeline_benchmark(
     num_queries: int = 10,
     provider: str = "simulated",
     api_key: str = None,
     output_file: str = None,
+    concurrency: int = 1,
+    percentiles: List[float] = None,
 ) -> Dict:
-    """Run pipeline benchmark with specified number of queries."""
+    """Run pipeline benchmark with specified number of queries.
+
+    Queries are dispatched to a thread pool of ``concurrency`` workers so that
+    I/O-bound search and LLM calls overlap. Per-query latencies are kept in
+    query order; ``runtime_latency`` is the wall time of the whole batch and
+    ``sum_latency`` the sum of per-query latencies. Reported percentiles are
+    computed exactly from the samples, so they agree with ``median``; a
+    ``LatencyHistogram`` is also saved as ``latencies_digest`` so later
+    comparisons can derive other percentiles, and raw samples go to a
+    ``.npy`` file next to ``output_file``.
+    """
+    concurrency = max(1, concurrency)
+    percentiles = sorted(percentiles or DEFAULT_PERCENTILES)
     print(f"Running benchmark with {num_queries} queries...")
     print(f"Provider: {provider}")
+    print(f"Concurrency: {concurrency}")
     print("-" * 60)
 
     queries = BENCHMARK_QUERIES[:num_queries]
-    latencies = []
+    outcomes: List[Dict] = [None] * len(queries)
+    histogram = LatencyHistogram()
     successes = 0
     failures = 0
 
-    for i, query in enumerate(queries, 1):
-        print(f"\n[{i}/{num_queries}] Query: {query}")
-        start_time = time.time()
-
-        try:
-            # Build search provider once per query
-            search_provider = build_search_provider(provider, api_key)
-            runner = PipelineRunner(
-                search_provider=search_provider,
-                verbose=False,
-            )
-            result = runner.execute(query=query)
-
-            elapsed = time.time() - start_time
-            latencies.append(elapsed)
+    # The search provider is stateless across queries, so build it (and any
+    # HTTP/client setup behind it) once and share it between all workers.
+    try:
+        search_provider = build_search_provider(provider, api_key)
+    except (SearchError, APIKeyError, SystemExit) as exc:
+        print(f"FAIL  Failed to initialize search provider: {exc}")
+        return {
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "num_queries": num_queries,
+            "provider": provider,
+            "successes": 0,
+            "failures": num_queries,
+            "concurrency": concurrency,
+            "error": f"Failed to initialize search provider: {exc}",
+        }
 
-            if result.get("success"):
+    # Per-query status lines are buffered and printed after the run so that
+    # terminal writes do not land inside the measured window.
+    status_lines: List[str] = [""] * len(queries)
+
+    batch_start = time.perf_counter()
+    with Progress(
+        TextColumn("{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        transient=True,
+    ) as progress, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        task = progress.add_task("Benchmarking", total=len(queries))
+        futures = {
+            executor.submit(_run_benchmark_query, query, search_provider): index
+            for index, query in enumerate(queries)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            outcome = future.result()
+            outcomes[index] = outcome
+            histogram.record(outcome["elapsed"])
+            progress.advance(task)
+
+            result = outcome["result"]
+            if outcome["exception"] is not None:
+                failures += 1
+                status = f"  FAIL  Exception: {outcome['exception']}"
+            elif result.get("success"):
                 successes += 1
-                print(f"  OK  Success in {elapsed:.2f}s")
+                status = f"  OK  Success in {outcome['elapsed']:.2f}s"
             else:
                 failures += 1
-                print(f"  FAIL  {result.get('error', 'Unknown error')}")
+                status = f"  FAIL  {result.get('error', 'Unknown error')}"
+            status_lines[index] = f"\n[{index + 1}/{num_queries}] Query: {queries[index]}\n{status}"
+    runtime_latency = time.perf_counter() - batch_start
+
+    for line in status_lines:
+        print(line)
 
-        except Exception as exc:
-            elapsed = time.time() - start_time
-            latencies.append(elapsed)
-            failures += 1
-            print(f"  FAIL  Exception: {exc}")
+    latencies = [outcome["elapsed"] for outcome in outcomes if outcome is not None]
 
     if latencies:
+        samples = np.asarray(latencies, dtype=np.float64)
         results = {
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
             "num_queries": num_queries,
             "provider": provider,
             "successes": successes,
             "failures": failures,
+            "concurrency": concurrency,
+            "percentiles": percentiles,
+            "runtime_latency": runtime_latency,
+            "sum_latency": float(samples.sum()),
             "latencies": {
-                "min": min(latencies),
-                "max": max(latencies),
-                "mean": statistics.mean(latencies),
-                "median": statistics.median(latencies),
-                "p95": sorted(latencies)[min(int(len(latencies) * 0.95), len(latencies) - 1)]
-                if len(latencies) > 1
-                else latencies[0],
-                "p99": sorted(latencies)[min(int(len(latencies) * 0.99), len(latencies) - 1)]
-                if len(latencies) > 1
-                else latencies[0],
-                "stdev": statistics.stdev(latencies) if len(latencies) > 1 else 0,
-                "all_latencies": latencies,
+                "min": float(samples.min()),
+                "max": float(samples.max()),
+                "mean": float(samples.mean()),
+                "median": float(np.median(samples)),
+                **{_percentile_key(pct): float(np.percentile(samples, pct)) for pct in percentiles},
+                "stdev": float(samples.std(ddof=1)) if samples.size > 1 else 0.0,
             },
+            "latencies_digest": histogram.to_dict(),
         }
     else:
         results = {
@@ -135,6 +292,7 @@ def run_pipeline_benchmark(
             "provider": provider,
             "successes": 0,
             "failures": num_queries,
+            "concurrency": concurrency,
             "error": "No successful queries",
         }
 
@@ -146,28 +304,42 @@ def run_pipeline_benchmark(
     print(f"Failures:  {failures}")
 
     if "latencies" in results:
+        print(f"\nWall time:        {results['runtime_latency']:.2f}s")
+        print(f"Sum of latencies: {results['sum_latency']:.2f}s")
         lat = results["latencies"]
         print("\nLatency (seconds):")
         print(f"  Min:    {lat['min']:.2f}s")
         print(f"  Max:    {lat['max']:.2f}s")
         print(f"  Mean:   {lat['mean']:.2f}s")
         print(f"  Median: {lat['median']:.2f}s")
-        print(f"  P95:    {lat['p95']:.2f}s")
-        print(f"  P99:    {lat['p99']:.2f}s")
+        for pct in percentiles:
+            key = _percentile_key(pct)
+            print(f"  {key.upper() + ':':<8}{lat[key]:.2f}s")
         print(f"  StdDev: {lat['stdev']:.2f}s")
 
     if output_file:
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as handle:
-            json.dump(results, handle, indent=2)
+        if latencies:
+            # Raw per-query samples go to a binary sidecar instead of the JSON
+            raw_path = output_path.with_suffix(".npy")
+            np.save(raw_path, np.asarray(latencies, dtype=np.float32))
+            results["raw_latencies_file"] = raw_path.name
+        with open(output_path, "w", encoding="utf-8", buffering=64 * 1024) as handle:
+            json.dump(results, handle, separators=(",", ":"))
         print(f"\nResults saved to: {output_file}")
 
     return results
 
 
-def compare_results(baseline_file: str, optimized_file: str) -> None:
-    """Compare two pipeline benchmark results."""
+def compare_results(baseline_file: str, optimized_file: str, output_file: str = None) -> Dict:
+    """Compare two pipeline benchmark results.
+
+    Compares mean, median and every percentile the baseline reported that
+    the optimized run also has (or can derive from its digest); improvements are computed in a single
+    vectorized pass. If ``output_file`` is set, the comparison is also
+    written there as JSON.
+    """
     with open(baseline_file, encoding="utf-8") as handle:
         baseline = json.load(handle)
     with open(optimized_file, encoding="utf-8") as handle:
@@ -182,25 +354,34 @@ def compare_results(baseline_file: str, optimized_file: str) -> None:
 
     if "latencies" not in baseline or "latencies" not in optimized:
         print("Error: Missing latency data in one or both files")
-        return
+        return {}
 
     baseline_lat = baseline["latencies"]
-    optimized_lat = optimized["latencies"]
-    metrics = ["mean", "median", "p95", "p99"]
+    optimized_lat = dict(optimized["latencies"])
+    # Fill percentiles the optimized run did not report from its digest
+    if "latencies_digest" in optimized:
+        digest = LatencyHistogram.from_dict(optimized["latencies_digest"])
+        for pct in _result_percentiles(baseline):
+            optimized_lat.setdefault(_percentile_key(pct), digest.percentile(pct))
+    metrics = ["mean", "median"] + [
+        _percentile_key(pct)
+        for pct in _result_percentiles(baseline)
+        if _percentile_key(pct) in optimized_lat
+    ]
+
+    base = np.array([baseline_lat[m] for m in metrics], dtype=np.float64)
+    opt = np.array([optimized_lat[m] for m in metrics], dtype=np.float64)
+    change = base - opt
+    pct = np.divide(change * 100, base, out=np.zeros_like(base), where=base > 0)
 
     print(f"{'Metric':<10} {'Baseline':>12} {'Optimized':>12} {'Change':>12} {'% Improvement':>15}")
     print("-" * 65)
 
-    for metric in metrics:
-        base_val = baseline_lat[metric]
-        opt_val = optimized_lat[metric]
-        change = base_val - opt_val
-        pct_improvement = (change / base_val) * 100 if base_val > 0 else 0
-        direction = "down" if change > 0 else "up"
-
+    for metric, base_val, opt_val, delta, pct_improvement in zip(metrics, base, opt, change, pct):
+        direction = "down" if delta > 0 else "up"
         print(
             f"{metric:<10} {base_val:>10.2f}s {opt_val:>10.2f}s "
-            f"{direction:>4} {abs(change):>8.2f}s {pct_improvement:>13.1f}%"
+            f"{direction:>4} {abs(delta):>8.2f}s {pct_improvement:>13.1f}%"
         )
 
     mean_improvement = ((baseline_lat["mean"] - optimized_lat["mean"]) / baseline_lat["mean"]) * 100
@@ -211,6 +392,30 @@ def compare_results(baseline_file: str, optimized_file: str) -> None:
     else:
         print(f"Target not met. Need {30 - mean_improvement:.1f}% more improvement.")
 
+    comparison = {
+        "baseline": baseline_file,
+        "optimized": optimized_file,
+        "metrics": {
+            metric: {
+                "baseline": float(base_val),
+                "optimized": float(opt_val),
+                "change": float(delta),
+                "pct_improvement": float(pct_improvement),
+            }
+            for metric, base_val, opt_val, delta, pct_improvement in zip(metrics, base, opt, change, pct)
+        },
+        "mean_improvement_pct": mean_improvement,
+        "target_met": mean_improvement >= 30,
+    }
+
+    if output_file:
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(comparison, indent=2), encoding="utf-8")
+        print(f"\nComparison saved to: {output_file}")
+
+    return comparison
+
 
 def run_react_agent_benchmark(search_provider: str, max_results: int, question: str) -> None:
     """Run a single ReActAgent episode for a sanity check."""
@@ -399,9 +604,9 @@ def _benchmark_critic_method(
     critic = CriticService(use_nli=use_nli, nli_threshold=0.60)
 
     claims = [tc.claim for tc in test_claims]
-    start_time = time.time()
+    start_time = time.perf_counter()
     results = critic.verify(claims, task=test_query.question)
-    end_time = time.time()
+    end_time = time.perf_counter()
 
     processing_time_ms = (end_time - start_time) * 1000
     true_positives = 0
@@ -640,8 +845,7 @@ def run_critic_nli_benchmark(output_path: str = None) -> Dict:
     if output_path:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, "w", encoding="utf-8") as handle:
-            json.dump(output, handle, indent=2)
+        output_file.write_text(json.dumps(output, indent=2), encoding="utf-8")
         print(f"Results saved to: {output_file}")
 
     return output
@@ -831,7 +1035,7 @@ def _benchmark_direct_method(
     labels = ["ENTAILMENT", "CONTRADICTION", "NO_ENTAILMENT"]
     confusion = {label: {pred: 0 for pred in labels} for label in labels}
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     for test_case in test_cases:
         if method == "nli":
             predicted_label = _predict_nli_label(
@@ -891,7 +1095,7 @@ def _benchmark_direct_method(
         if predicted_label == true_label:
             category_accuracy[category]["correct"] += 1
 
-    end_time = time.time()
+    end_time = time.perf_counter()
     processing_time_ms = (end_time - start_time) * 1000
 
     precision = (
@@ -1089,8 +1293,7 @@ def run_direct_nli_benchmark(
     if output_path:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, "w", encoding="utf-8") as handle:
-            json.dump(output, handle, indent=2)
+        output_file.write_text(json.dumps(output, indent=2), encoding="utf-8")
         print(f"Results saved to: {output_file}")
 
     return output
@@ -1200,7 +1403,28 @@ def _build_parser() -> argparse.ArgumentParser:
     pipeline.add_argument("--queries", "-n", type=int, default=10, help="Number of queries to run")
     pipeline.add_argument("--provider", "-p", default="simulated", help="Search provider to use")
     pipeline.add_argument("--api-key", "-k", help="API key for search provider")
-    pipeline.add_argument("--output", "-o", help="Output file for results (JSON)")
+    pipeline.add_argument(
+        "--output",
+        "-o",
+        help="Output file for results (JSON); with --compare, the comparison report",
+    )
+    pipeline.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of benchmark queries to run concurrently",
+    )
+    pipeline.add_argument(
+        "--percentiles",
+        type=_parse_percentiles,
+        default=DEFAULT_PERCENTILES,
+        help="Comma-separated latency percentiles to report (default: 50,90,95,99)",
+    )
+    pipeline.add_argument(
+        "--use-cache",
+        action="store_true",
+        help="Keep the response and research caches enabled (default: measure cold runs)",
+    )
     pipeline.add_argument(
         "--compare",
         "-c",
@@ -1260,13 +1484,18 @@ def main() -> None:
         if args.question:
             run_react_agent_benchmark(args.search_provider, args.max_results, args.question)
         elif args.compare:
-            compare_results(args.compare[0], args.compare[1])
+            compare_results(args.compare[0], args.compare[1], output_file=args.output)
         else:
+            if not args.use_cache:
+                # Time the pipeline itself, not cache hits from earlier runs
+                os.environ["HDRP_CACHE_DISABLE"] = "1"
             run_pipeline_benchmark(
                 num_queries=args.queries,
                 provider=args.provider,
                 api_key=args.api_key,
                 output_file=args.output,
+                concurrency=args.concurrency,
+                percentiles=args.percentiles,
             )
         return
 